@@ -85,17 +85,20 @@ if "last_activity_time" not in st.session_state:
 
 # --- UI 모듈 임포트 ---
 from modules.ui import render_sidebar, render_records_tab, render_ai_evaluation_tab
+from modules.utils.cache_utils import request_cache
 
-# --- 사이드바 렌더링 ---
-render_sidebar()
+# 한 번의 스크립트 실행 동안 동일한 대상자 조회는 1번만 수행
+with request_cache():
+    # --- 사이드바 렌더링 ---
+    render_sidebar()
 
-# --- 메인 화면 구성 ---
-main_tab1, main_tab2 = st.tabs(["📄주간 상태 변화 평가", "일일 특이사항 평가"])
+    # --- 메인 화면 구성 ---
+    main_tab1, main_tab2 = st.tabs(["📄주간 상태 변화 평가", "일일 특이사항 평가"])
 
-# 탭 1: 기록 조회
-with main_tab1:
-    render_records_tab()
+    # 탭 1: 기록 조회
+    with main_tab1:
+        render_records_tab()
 
-# 탭 2: AI 품질 평가
-with main_tab2:
-    render_ai_evaluation_tab()
+    # 탭 2: AI 품질 평가
+    with main_tab2:
+        render_ai_evaluation_tab()
@@ -0,0 +1,4 @@
+-- 대상자별 최근 기록 조회용 인덱스
+-- get_evaluations_by_customer / get_customer_records의
+-- WHERE customer_id = ? ORDER BY date DESC 를 filesort 없이 인덱스 순서로 처리
+CREATE INDEX idx_daily_infos_customer_date ON daily_infos (customer_id, date DESC);
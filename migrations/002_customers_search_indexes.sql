@@ -0,0 +1,5 @@
+-- 대상자 검색용 인덱스
+-- list_customers 키워드 검색: 이름은 ngram 전문 검색, 인정번호는 접두어 B-tree 검색
+-- (ngram_token_size 기본값 2 기준, 1글자 검색은 애플리케이션에서 LIKE로 처리)
+ALTER TABLE customers ADD FULLTEXT INDEX ft_customers_name (name) WITH PARSER ngram;
+CREATE INDEX idx_customers_recognition_no ON customers (recognition_no);
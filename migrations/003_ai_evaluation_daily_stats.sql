@@ -0,0 +1,148 @@
+-- 대상자/카테고리/일자별 AI 평가 집계 테이블
+-- get_evaluation_stats가 매번 ai_evaluations 전체를 집계하지 않고
+-- 이 테이블의 (customer_id, category, date) 범위만 합산하도록 함
+-- 평가 저장 경로가 여러 곳(리포지토리, 서비스)이므로 집계는 트리거로 유지
+CREATE TABLE ai_evaluation_daily_stats (
+    customer_id INT NOT NULL,
+    category VARCHAR(20) NOT NULL,
+    date DATE NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    oer_o_count INT NOT NULL DEFAULT 0,
+    specificity_o_count INT NOT NULL DEFAULT 0,
+    grammar_o_count INT NOT NULL DEFAULT 0,
+    excellent_count INT NOT NULL DEFAULT 0,
+    average_count INT NOT NULL DEFAULT 0,
+    improvement_count INT NOT NULL DEFAULT 0,
+    poor_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (customer_id, category, date)
+);
+
+-- 기존 평가 백필
+INSERT INTO ai_evaluation_daily_stats (
+    customer_id, category, date, total,
+    oer_o_count, specificity_o_count, grammar_o_count,
+    excellent_count, average_count, improvement_count, poor_count
+)
+SELECT
+    di.customer_id, ae.category, di.date, COUNT(*),
+    SUM(IF(ae.oer_fidelity = 'O', 1, 0)),
+    SUM(IF(ae.specificity_score = 'O', 1, 0)),
+    SUM(IF(ae.grammar_score = 'O', 1, 0)),
+    SUM(IF(ae.grade_code = '우수', 1, 0)),
+    SUM(IF(ae.grade_code = '평균', 1, 0)),
+    SUM(IF(ae.grade_code = '개선', 1, 0)),
+    SUM(IF(ae.grade_code = '불량', 1, 0))
+FROM ai_evaluations ae
+JOIN daily_infos di ON ae.record_id = di.record_id
+GROUP BY di.customer_id, ae.category, di.date;
+
+DELIMITER $$
+
+-- 평가 추가: 해당 일자 집계에 +1
+CREATE TRIGGER trg_ai_evaluations_after_insert
+AFTER INSERT ON ai_evaluations
+FOR EACH ROW
+BEGIN
+    INSERT INTO ai_evaluation_daily_stats (
+        customer_id, category, date, total,
+        oer_o_count, specificity_o_count, grammar_o_count,
+        excellent_count, average_count, improvement_count, poor_count
+    )
+    SELECT
+        di.customer_id, NEW.category, di.date, 1,
+        IF(NEW.oer_fidelity = 'O', 1, 0),
+        IF(NEW.specificity_score = 'O', 1, 0),
+        IF(NEW.grammar_score = 'O', 1, 0),
+        IF(NEW.grade_code = '우수', 1, 0),
+        IF(NEW.grade_code = '평균', 1, 0),
+        IF(NEW.grade_code = '개선', 1, 0),
+        IF(NEW.grade_code = '불량', 1, 0)
+    FROM daily_infos di
+    WHERE di.record_id = NEW.record_id
+    ON DUPLICATE KEY UPDATE
+        total = total + VALUES(total),
+        oer_o_count = oer_o_count + VALUES(oer_o_count),
+        specificity_o_count = specificity_o_count + VALUES(specificity_o_count),
+        grammar_o_count = grammar_o_count + VALUES(grammar_o_count),
+        excellent_count = excellent_count + VALUES(excellent_count),
+        average_count = average_count + VALUES(average_count),
+        improvement_count = improvement_count + VALUES(improvement_count),
+        poor_count = poor_count + VALUES(poor_count);
+END$$
+
+-- 평가 수정(재평가): 이전 값만큼 빼고 새 값만큼 더함 (같은 기록이므로 키는 동일)
+CREATE TRIGGER trg_ai_evaluations_after_update
+AFTER UPDATE ON ai_evaluations
+FOR EACH ROW
+BEGIN
+    UPDATE ai_evaluation_daily_stats s
+    JOIN daily_infos di ON di.customer_id = s.customer_id AND di.date = s.date
+    SET
+        s.oer_o_count = s.oer_o_count
+            - IF(OLD.oer_fidelity = 'O', 1, 0) + IF(NEW.oer_fidelity = 'O', 1, 0),
+        s.specificity_o_count = s.specificity_o_count
+            - IF(OLD.specificity_score = 'O', 1, 0) + IF(NEW.specificity_score = 'O', 1, 0),
+        s.grammar_o_count = s.grammar_o_count
+            - IF(OLD.grammar_score = 'O', 1, 0) + IF(NEW.grammar_score = 'O', 1, 0),
+        s.excellent_count = s.excellent_count
+            - IF(OLD.grade_code = '우수', 1, 0) + IF(NEW.grade_code = '우수', 1, 0),
+        s.average_count = s.average_count
+            - IF(OLD.grade_code = '평균', 1, 0) + IF(NEW.grade_code = '평균', 1, 0),
+        s.improvement_count = s.improvement_count
+            - IF(OLD.grade_code = '개선', 1, 0) + IF(NEW.grade_code = '개선', 1, 0),
+        s.poor_count = s.poor_count
+            - IF(OLD.grade_code = '불량', 1, 0) + IF(NEW.grade_code = '불량', 1, 0)
+    WHERE di.record_id = NEW.record_id AND s.category = NEW.category;
+END$$
+
+-- 평가 삭제: 해당 일자 집계에서 -1
+CREATE TRIGGER trg_ai_evaluations_after_delete
+AFTER DELETE ON ai_evaluations
+FOR EACH ROW
+BEGIN
+    UPDATE ai_evaluation_daily_stats s
+    JOIN daily_infos di ON di.customer_id = s.customer_id AND di.date = s.date
+    SET
+        s.total = s.total - 1,
+        s.oer_o_count = s.oer_o_count - IF(OLD.oer_fidelity = 'O', 1, 0),
+        s.specificity_o_count = s.specificity_o_count - IF(OLD.specificity_score = 'O', 1, 0),
+        s.grammar_o_count = s.grammar_o_count - IF(OLD.grammar_score = 'O', 1, 0),
+        s.excellent_count = s.excellent_count - IF(OLD.grade_code = '우수', 1, 0),
+        s.average_count = s.average_count - IF(OLD.grade_code = '평균', 1, 0),
+        s.improvement_count = s.improvement_count - IF(OLD.grade_code = '개선', 1, 0),
+        s.poor_count = s.poor_count - IF(OLD.grade_code = '불량', 1, 0)
+    WHERE di.record_id = OLD.record_id AND s.category = OLD.category;
+END$$
+
+-- 기록 삭제: FK CASCADE로 지워지는 평가는 트리거가 실행되지 않으므로 기록 삭제 전에 미리 차감
+CREATE TRIGGER trg_daily_infos_before_delete
+BEFORE DELETE ON daily_infos
+FOR EACH ROW
+BEGIN
+    UPDATE ai_evaluation_daily_stats s
+    JOIN (
+        SELECT category, COUNT(*) AS total,
+               SUM(IF(oer_fidelity = 'O', 1, 0)) AS oer_o_count,
+               SUM(IF(specificity_score = 'O', 1, 0)) AS specificity_o_count,
+               SUM(IF(grammar_score = 'O', 1, 0)) AS grammar_o_count,
+               SUM(IF(grade_code = '우수', 1, 0)) AS excellent_count,
+               SUM(IF(grade_code = '평균', 1, 0)) AS average_count,
+               SUM(IF(grade_code = '개선', 1, 0)) AS improvement_count,
+               SUM(IF(grade_code = '불량', 1, 0)) AS poor_count
+        FROM ai_evaluations
+        WHERE record_id = OLD.record_id
+        GROUP BY category
+    ) e ON e.category = s.category
+    SET
+        s.total = s.total - e.total,
+        s.oer_o_count = s.oer_o_count - e.oer_o_count,
+        s.specificity_o_count = s.specificity_o_count - e.specificity_o_count,
+        s.grammar_o_count = s.grammar_o_count - e.grammar_o_count,
+        s.excellent_count = s.excellent_count - e.excellent_count,
+        s.average_count = s.average_count - e.average_count,
+        s.improvement_count = s.improvement_count - e.improvement_count,
+        s.poor_count = s.poor_count - e.poor_count
+    WHERE s.customer_id = OLD.customer_id AND s.date = OLD.date;
+END$$
+
+DELIMITER ;
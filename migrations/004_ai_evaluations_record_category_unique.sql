@@ -0,0 +1,14 @@
+-- 기록/카테고리별 평가는 1건만 유지 (save_evaluation의 조회 후 UPDATE/INSERT 규칙을 DB에서도 보장)
+-- InnoDB 보조 인덱스에는 PK(ai_eval_id)가 포함되므로
+-- save_evaluation 존재 확인(SELECT ai_eval_id ... WHERE record_id AND category)과
+-- get_evaluation / delete_evaluation 조건 검색이 이 인덱스만으로 처리됨
+-- (reason_text 등 TEXT 컬럼은 인덱스에 넣을 수 없어 점수 컬럼은 포함하지 않음)
+
+-- 동시 저장으로 생긴 중복이 있으면 최신 평가만 남김
+DELETE ae_old FROM ai_evaluations ae_old
+JOIN ai_evaluations ae_new
+  ON ae_new.record_id = ae_old.record_id
+ AND ae_new.category = ae_old.category
+ AND ae_new.ai_eval_id > ae_old.ai_eval_id;
+
+CREATE UNIQUE INDEX uq_ai_evaluations_record_category ON ai_evaluations (record_id, category);
@@ -0,0 +1,8 @@
+-- 하위 기록 테이블은 기록(record_id)당 1행
+-- replace_daily_* / save_parsed_data가 DELETE 후 INSERT 대신
+-- INSERT ... ON DUPLICATE KEY UPDATE 1문장으로 교체할 수 있도록 UNIQUE 키 추가
+-- (기존 코드는 항상 같은 record_id의 행을 삭제한 뒤 삽입했으므로 중복 행이 없음)
+CREATE UNIQUE INDEX uq_daily_physicals_record ON daily_physicals (record_id);
+CREATE UNIQUE INDEX uq_daily_cognitives_record ON daily_cognitives (record_id);
+CREATE UNIQUE INDEX uq_daily_nursings_record ON daily_nursings (record_id);
+CREATE UNIQUE INDEX uq_daily_recoveries_record ON daily_recoveries (record_id);
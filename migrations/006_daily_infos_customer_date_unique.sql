@@ -0,0 +1,45 @@
+-- 대상자/일자별 기록은 1건만 유지 (save_parsed_data의 (customer_id, date) 조회 후 UPDATE/INSERT 규칙을 DB에서도 보장)
+-- 001의 (customer_id, date DESC) 인덱스를 같은 컬럼 순서의 UNIQUE 인덱스로 교체하므로
+-- find_existing_record_id / get_record_by_customer_and_date / 최근 기록 정렬은 그대로 이 인덱스를 사용
+-- insert_daily_info는 이 키로 INSERT ... ON DUPLICATE KEY UPDATE 1문장 처리
+
+-- 동시 저장으로 생긴 중복이 있으면 최신 기록만 남김 (하위 테이블 → daily_infos 순서,
+-- 평가는 FK CASCADE, 평가 집계는 trg_daily_infos_before_delete가 차감)
+DELETE child FROM daily_physicals child
+JOIN daily_infos di_old ON di_old.record_id = child.record_id
+JOIN daily_infos di_new
+  ON di_new.customer_id = di_old.customer_id
+ AND di_new.date = di_old.date
+ AND di_new.record_id > di_old.record_id;
+
+DELETE child FROM daily_cognitives child
+JOIN daily_infos di_old ON di_old.record_id = child.record_id
+JOIN daily_infos di_new
+  ON di_new.customer_id = di_old.customer_id
+ AND di_new.date = di_old.date
+ AND di_new.record_id > di_old.record_id;
+
+DELETE child FROM daily_nursings child
+JOIN daily_infos di_old ON di_old.record_id = child.record_id
+JOIN daily_infos di_new
+  ON di_new.customer_id = di_old.customer_id
+ AND di_new.date = di_old.date
+ AND di_new.record_id > di_old.record_id;
+
+DELETE child FROM daily_recoveries child
+JOIN daily_infos di_old ON di_old.record_id = child.record_id
+JOIN daily_infos di_new
+  ON di_new.customer_id = di_old.customer_id
+ AND di_new.date = di_old.date
+ AND di_new.record_id > di_old.record_id;
+
+DELETE di_old FROM daily_infos di_old
+JOIN daily_infos di_new
+  ON di_new.customer_id = di_old.customer_id
+ AND di_new.date = di_old.date
+ AND di_new.record_id > di_old.record_id;
+
+-- 같은 ALTER에서 교체해 customer_id FK가 사용할 인덱스가 비는 순간이 없도록 함
+ALTER TABLE daily_infos
+    DROP INDEX idx_daily_infos_customer_date,
+    ADD UNIQUE INDEX uq_daily_infos_customer_date (customer_id, date DESC);
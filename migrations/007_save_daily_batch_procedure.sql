@@ -0,0 +1,145 @@
+-- 일일 기록 배치 저장 프로시저 (save_parsed_data의 배치당 서버 왕복을 CALL 1회로 축소)
+-- payload: [{customer_id, date, start_time, ..., physical_note, writer_phy, ...}, ...] JSON 배열
+--   (키는 DailyInfoRepository의 레코드 키와 동일, 대상자 확인/생성은 호출 전에 완료된 상태)
+-- 1) daily_infos: (customer_id, date) UNIQUE 키(006)로 신규 삽입/기존 갱신 (record_id 유지 → AI 평가 유지)
+-- 2) 하위 테이블: 같은 키로 record_id를 찾아 record_id UNIQUE 키(005)로 UPSERT
+-- 배치의 customer_id/record_id는 모두 이 저장 흐름에서 확인/생성한 값이므로
+-- 프로시저 안에서만 행별 FK 검사를 끄고, 오류가 나도 원래 값으로 복원
+-- JSON_TABLE 사용 (MySQL 8.0 이상)
+-- INSERT ... SELECT ... ON DUPLICATE KEY UPDATE는 SELECT 쪽과 이름이 겹칠 수 있어 갱신 대상 컬럼을 테이블명으로 한정
+
+DELIMITER $$
+
+CREATE PROCEDURE save_daily_batch(IN payload JSON)
+BEGIN
+    DECLARE saved_foreign_key_checks INT DEFAULT @@SESSION.foreign_key_checks;
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET SESSION foreign_key_checks = saved_foreign_key_checks;
+        RESIGNAL;
+    END;
+
+    SET SESSION foreign_key_checks = 0;
+
+    INSERT INTO daily_infos (
+        customer_id, date, start_time, end_time, total_service_time, transport_service, transport_vehicles
+    )
+    SELECT jt.customer_id, jt.date, jt.start_time, jt.end_time, jt.total_service_time, jt.transport_service, jt.transport_vehicles
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        start_time TEXT PATH '$.start_time',
+        end_time TEXT PATH '$.end_time',
+        total_service_time TEXT PATH '$.total_service_time',
+        transport_service TEXT PATH '$.transport_service',
+        transport_vehicles TEXT PATH '$.transport_vehicles'
+    )) AS jt
+    ON DUPLICATE KEY UPDATE
+        daily_infos.start_time = VALUES(start_time),
+        daily_infos.end_time = VALUES(end_time),
+        daily_infos.total_service_time = VALUES(total_service_time),
+        daily_infos.transport_service = VALUES(transport_service),
+        daily_infos.transport_vehicles = VALUES(transport_vehicles);
+
+    INSERT INTO daily_physicals (
+        record_id, hygiene_care, bath_time, bath_method, meal_breakfast, meal_lunch, meal_dinner, toilet_care, mobility_care, note, writer_name
+    )
+    SELECT di.record_id, jt.hygiene_care, jt.bath_time, jt.bath_method, jt.meal_breakfast, jt.meal_lunch, jt.meal_dinner, jt.toilet_care, jt.mobility_care, jt.physical_note, jt.writer_phy
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        hygiene_care TEXT PATH '$.hygiene_care',
+        bath_time TEXT PATH '$.bath_time',
+        bath_method TEXT PATH '$.bath_method',
+        meal_breakfast TEXT PATH '$.meal_breakfast',
+        meal_lunch TEXT PATH '$.meal_lunch',
+        meal_dinner TEXT PATH '$.meal_dinner',
+        toilet_care TEXT PATH '$.toilet_care',
+        mobility_care TEXT PATH '$.mobility_care',
+        physical_note TEXT PATH '$.physical_note',
+        writer_phy TEXT PATH '$.writer_phy'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    ON DUPLICATE KEY UPDATE
+        daily_physicals.hygiene_care = VALUES(hygiene_care),
+        daily_physicals.bath_time = VALUES(bath_time),
+        daily_physicals.bath_method = VALUES(bath_method),
+        daily_physicals.meal_breakfast = VALUES(meal_breakfast),
+        daily_physicals.meal_lunch = VALUES(meal_lunch),
+        daily_physicals.meal_dinner = VALUES(meal_dinner),
+        daily_physicals.toilet_care = VALUES(toilet_care),
+        daily_physicals.mobility_care = VALUES(mobility_care),
+        daily_physicals.note = VALUES(note),
+        daily_physicals.writer_name = VALUES(writer_name);
+
+    INSERT INTO daily_cognitives (
+        record_id, cog_support, comm_support, note, writer_name
+    )
+    SELECT di.record_id, jt.cog_support, jt.comm_support, jt.cognitive_note, jt.writer_cog
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        cog_support TEXT PATH '$.cog_support',
+        comm_support TEXT PATH '$.comm_support',
+        cognitive_note TEXT PATH '$.cognitive_note',
+        writer_cog TEXT PATH '$.writer_cog'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    ON DUPLICATE KEY UPDATE
+        daily_cognitives.cog_support = VALUES(cog_support),
+        daily_cognitives.comm_support = VALUES(comm_support),
+        daily_cognitives.note = VALUES(note),
+        daily_cognitives.writer_name = VALUES(writer_name);
+
+    INSERT INTO daily_nursings (
+        record_id, bp_temp, health_manage, nursing_manage, emergency, note, writer_name
+    )
+    SELECT di.record_id, jt.bp_temp, jt.health_manage, jt.nursing_manage, jt.emergency, jt.nursing_note, jt.writer_nur
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        bp_temp TEXT PATH '$.bp_temp',
+        health_manage TEXT PATH '$.health_manage',
+        nursing_manage TEXT PATH '$.nursing_manage',
+        emergency TEXT PATH '$.emergency',
+        nursing_note TEXT PATH '$.nursing_note',
+        writer_nur TEXT PATH '$.writer_nur'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    ON DUPLICATE KEY UPDATE
+        daily_nursings.bp_temp = VALUES(bp_temp),
+        daily_nursings.health_manage = VALUES(health_manage),
+        daily_nursings.nursing_manage = VALUES(nursing_manage),
+        daily_nursings.emergency = VALUES(emergency),
+        daily_nursings.note = VALUES(note),
+        daily_nursings.writer_name = VALUES(writer_name);
+
+    INSERT INTO daily_recoveries (
+        record_id, prog_basic, prog_activity, prog_cognitive, prog_therapy, prog_enhance_detail, note, writer_name
+    )
+    SELECT di.record_id, jt.prog_basic, jt.prog_activity, jt.prog_cognitive, jt.prog_therapy, jt.prog_enhance_detail, jt.functional_note, jt.writer_func
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        prog_basic TEXT PATH '$.prog_basic',
+        prog_activity TEXT PATH '$.prog_activity',
+        prog_cognitive TEXT PATH '$.prog_cognitive',
+        prog_therapy TEXT PATH '$.prog_therapy',
+        prog_enhance_detail TEXT PATH '$.prog_enhance_detail',
+        functional_note TEXT PATH '$.functional_note',
+        writer_func TEXT PATH '$.writer_func'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    ON DUPLICATE KEY UPDATE
+        daily_recoveries.prog_basic = VALUES(prog_basic),
+        daily_recoveries.prog_activity = VALUES(prog_activity),
+        daily_recoveries.prog_cognitive = VALUES(prog_cognitive),
+        daily_recoveries.prog_therapy = VALUES(prog_therapy),
+        daily_recoveries.prog_enhance_detail = VALUES(prog_enhance_detail),
+        daily_recoveries.note = VALUES(note),
+        daily_recoveries.writer_name = VALUES(writer_name);
+
+    SET SESSION foreign_key_checks = saved_foreign_key_checks;
+END$$
+
+DELIMITER ;
@@ -0,0 +1,206 @@
+-- save_daily_batch 프로시저 재정의: 하위 항목 값이 모두 비어 있으면 하위 테이블 행을 만들지 않음
+-- 기록별로 해당 하위 테이블 레코드 키가 모두 null이면
+--   - INSERT ... SELECT 대상에서 제외 (빈 행 저장/갱신 생략)
+--   - 이전에 저장된 하위 행이 있으면 삭제 (재업로드 시 예전 값이 남지 않도록, 조회 결과는 빈 행과 동일하게 NULL)
+-- 나머지 동작은 007과 동일
+
+DROP PROCEDURE IF EXISTS save_daily_batch;
+
+DELIMITER $$
+
+CREATE PROCEDURE save_daily_batch(IN payload JSON)
+BEGIN
+    DECLARE saved_foreign_key_checks INT DEFAULT @@SESSION.foreign_key_checks;
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        SET SESSION foreign_key_checks = saved_foreign_key_checks;
+        RESIGNAL;
+    END;
+
+    SET SESSION foreign_key_checks = 0;
+
+    INSERT INTO daily_infos (
+        customer_id, date, start_time, end_time, total_service_time, transport_service, transport_vehicles
+    )
+    SELECT jt.customer_id, jt.date, jt.start_time, jt.end_time, jt.total_service_time, jt.transport_service, jt.transport_vehicles
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        start_time TEXT PATH '$.start_time',
+        end_time TEXT PATH '$.end_time',
+        total_service_time TEXT PATH '$.total_service_time',
+        transport_service TEXT PATH '$.transport_service',
+        transport_vehicles TEXT PATH '$.transport_vehicles'
+    )) AS jt
+    ON DUPLICATE KEY UPDATE
+        daily_infos.start_time = VALUES(start_time),
+        daily_infos.end_time = VALUES(end_time),
+        daily_infos.total_service_time = VALUES(total_service_time),
+        daily_infos.transport_service = VALUES(transport_service),
+        daily_infos.transport_vehicles = VALUES(transport_vehicles);
+
+    INSERT INTO daily_physicals (
+        record_id, hygiene_care, bath_time, bath_method, meal_breakfast, meal_lunch, meal_dinner, toilet_care, mobility_care, note, writer_name
+    )
+    SELECT di.record_id, jt.hygiene_care, jt.bath_time, jt.bath_method, jt.meal_breakfast, jt.meal_lunch, jt.meal_dinner, jt.toilet_care, jt.mobility_care, jt.physical_note, jt.writer_phy
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        hygiene_care TEXT PATH '$.hygiene_care',
+        bath_time TEXT PATH '$.bath_time',
+        bath_method TEXT PATH '$.bath_method',
+        meal_breakfast TEXT PATH '$.meal_breakfast',
+        meal_lunch TEXT PATH '$.meal_lunch',
+        meal_dinner TEXT PATH '$.meal_dinner',
+        toilet_care TEXT PATH '$.toilet_care',
+        mobility_care TEXT PATH '$.mobility_care',
+        physical_note TEXT PATH '$.physical_note',
+        writer_phy TEXT PATH '$.writer_phy'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.hygiene_care, jt.bath_time, jt.bath_method, jt.meal_breakfast, jt.meal_lunch, jt.meal_dinner, jt.toilet_care, jt.mobility_care, jt.physical_note, jt.writer_phy) IS NOT NULL
+    ON DUPLICATE KEY UPDATE
+        daily_physicals.hygiene_care = VALUES(hygiene_care),
+        daily_physicals.bath_time = VALUES(bath_time),
+        daily_physicals.bath_method = VALUES(bath_method),
+        daily_physicals.meal_breakfast = VALUES(meal_breakfast),
+        daily_physicals.meal_lunch = VALUES(meal_lunch),
+        daily_physicals.meal_dinner = VALUES(meal_dinner),
+        daily_physicals.toilet_care = VALUES(toilet_care),
+        daily_physicals.mobility_care = VALUES(mobility_care),
+        daily_physicals.note = VALUES(note),
+        daily_physicals.writer_name = VALUES(writer_name);
+
+    DELETE t FROM daily_physicals t
+    JOIN daily_infos di ON di.record_id = t.record_id
+    JOIN JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        hygiene_care TEXT PATH '$.hygiene_care',
+        bath_time TEXT PATH '$.bath_time',
+        bath_method TEXT PATH '$.bath_method',
+        meal_breakfast TEXT PATH '$.meal_breakfast',
+        meal_lunch TEXT PATH '$.meal_lunch',
+        meal_dinner TEXT PATH '$.meal_dinner',
+        toilet_care TEXT PATH '$.toilet_care',
+        mobility_care TEXT PATH '$.mobility_care',
+        physical_note TEXT PATH '$.physical_note',
+        writer_phy TEXT PATH '$.writer_phy'
+    )) AS jt ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.hygiene_care, jt.bath_time, jt.bath_method, jt.meal_breakfast, jt.meal_lunch, jt.meal_dinner, jt.toilet_care, jt.mobility_care, jt.physical_note, jt.writer_phy) IS NULL;
+
+    INSERT INTO daily_cognitives (
+        record_id, cog_support, comm_support, note, writer_name
+    )
+    SELECT di.record_id, jt.cog_support, jt.comm_support, jt.cognitive_note, jt.writer_cog
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        cog_support TEXT PATH '$.cog_support',
+        comm_support TEXT PATH '$.comm_support',
+        cognitive_note TEXT PATH '$.cognitive_note',
+        writer_cog TEXT PATH '$.writer_cog'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.cog_support, jt.comm_support, jt.cognitive_note, jt.writer_cog) IS NOT NULL
+    ON DUPLICATE KEY UPDATE
+        daily_cognitives.cog_support = VALUES(cog_support),
+        daily_cognitives.comm_support = VALUES(comm_support),
+        daily_cognitives.note = VALUES(note),
+        daily_cognitives.writer_name = VALUES(writer_name);
+
+    DELETE t FROM daily_cognitives t
+    JOIN daily_infos di ON di.record_id = t.record_id
+    JOIN JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        cog_support TEXT PATH '$.cog_support',
+        comm_support TEXT PATH '$.comm_support',
+        cognitive_note TEXT PATH '$.cognitive_note',
+        writer_cog TEXT PATH '$.writer_cog'
+    )) AS jt ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.cog_support, jt.comm_support, jt.cognitive_note, jt.writer_cog) IS NULL;
+
+    INSERT INTO daily_nursings (
+        record_id, bp_temp, health_manage, nursing_manage, emergency, note, writer_name
+    )
+    SELECT di.record_id, jt.bp_temp, jt.health_manage, jt.nursing_manage, jt.emergency, jt.nursing_note, jt.writer_nur
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        bp_temp TEXT PATH '$.bp_temp',
+        health_manage TEXT PATH '$.health_manage',
+        nursing_manage TEXT PATH '$.nursing_manage',
+        emergency TEXT PATH '$.emergency',
+        nursing_note TEXT PATH '$.nursing_note',
+        writer_nur TEXT PATH '$.writer_nur'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.bp_temp, jt.health_manage, jt.nursing_manage, jt.emergency, jt.nursing_note, jt.writer_nur) IS NOT NULL
+    ON DUPLICATE KEY UPDATE
+        daily_nursings.bp_temp = VALUES(bp_temp),
+        daily_nursings.health_manage = VALUES(health_manage),
+        daily_nursings.nursing_manage = VALUES(nursing_manage),
+        daily_nursings.emergency = VALUES(emergency),
+        daily_nursings.note = VALUES(note),
+        daily_nursings.writer_name = VALUES(writer_name);
+
+    DELETE t FROM daily_nursings t
+    JOIN daily_infos di ON di.record_id = t.record_id
+    JOIN JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        bp_temp TEXT PATH '$.bp_temp',
+        health_manage TEXT PATH '$.health_manage',
+        nursing_manage TEXT PATH '$.nursing_manage',
+        emergency TEXT PATH '$.emergency',
+        nursing_note TEXT PATH '$.nursing_note',
+        writer_nur TEXT PATH '$.writer_nur'
+    )) AS jt ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.bp_temp, jt.health_manage, jt.nursing_manage, jt.emergency, jt.nursing_note, jt.writer_nur) IS NULL;
+
+    INSERT INTO daily_recoveries (
+        record_id, prog_basic, prog_activity, prog_cognitive, prog_therapy, prog_enhance_detail, note, writer_name
+    )
+    SELECT di.record_id, jt.prog_basic, jt.prog_activity, jt.prog_cognitive, jt.prog_therapy, jt.prog_enhance_detail, jt.functional_note, jt.writer_func
+    FROM JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        prog_basic TEXT PATH '$.prog_basic',
+        prog_activity TEXT PATH '$.prog_activity',
+        prog_cognitive TEXT PATH '$.prog_cognitive',
+        prog_therapy TEXT PATH '$.prog_therapy',
+        prog_enhance_detail TEXT PATH '$.prog_enhance_detail',
+        functional_note TEXT PATH '$.functional_note',
+        writer_func TEXT PATH '$.writer_func'
+    )) AS jt
+    JOIN daily_infos di ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.prog_basic, jt.prog_activity, jt.prog_cognitive, jt.prog_therapy, jt.prog_enhance_detail, jt.functional_note, jt.writer_func) IS NOT NULL
+    ON DUPLICATE KEY UPDATE
+        daily_recoveries.prog_basic = VALUES(prog_basic),
+        daily_recoveries.prog_activity = VALUES(prog_activity),
+        daily_recoveries.prog_cognitive = VALUES(prog_cognitive),
+        daily_recoveries.prog_therapy = VALUES(prog_therapy),
+        daily_recoveries.prog_enhance_detail = VALUES(prog_enhance_detail),
+        daily_recoveries.note = VALUES(note),
+        daily_recoveries.writer_name = VALUES(writer_name);
+
+    DELETE t FROM daily_recoveries t
+    JOIN daily_infos di ON di.record_id = t.record_id
+    JOIN JSON_TABLE(payload, '$[*]' COLUMNS (
+        customer_id INT PATH '$.customer_id',
+        date DATE PATH '$.date',
+        prog_basic TEXT PATH '$.prog_basic',
+        prog_activity TEXT PATH '$.prog_activity',
+        prog_cognitive TEXT PATH '$.prog_cognitive',
+        prog_therapy TEXT PATH '$.prog_therapy',
+        prog_enhance_detail TEXT PATH '$.prog_enhance_detail',
+        functional_note TEXT PATH '$.functional_note',
+        writer_func TEXT PATH '$.writer_func'
+    )) AS jt ON di.customer_id = jt.customer_id AND di.date = jt.date
+    WHERE COALESCE(jt.prog_basic, jt.prog_activity, jt.prog_cognitive, jt.prog_therapy, jt.prog_enhance_detail, jt.functional_note, jt.writer_func) IS NULL;
+
+    SET SESSION foreign_key_checks = saved_foreign_key_checks;
+END$$
+
+DELIMITER ;
@@ -0,0 +1,46 @@
+#!/bin/sh
+# 미적용 마이그레이션을 파일명 순서대로 적용 (배포 시 새 앱 컨테이너를 띄우기 전에 실행)
+#
+# 사용법: sh migrations/apply.sh [compose 파일]   (기본값: docker-compose.prod.yml)
+#
+# - mysql 컨테이너 안의 mysql 클라이언트로 실행하므로 DELIMITER가 있는 프로시저 파일도 그대로 적용됨
+# - 적용한 파일명은 schema_migrations 테이블에 기록해 다음 배포에서 건너뜀
+# - 하나라도 실패하면 즉시 종료(0이 아닌 종료 코드)하므로 배포가 새 코드로 넘어가지 않음
+set -eu
+
+COMPOSE_FILE="${1:-docker-compose.prod.yml}"
+MIGRATIONS_DIR="$(dirname "$0")"
+
+mysql_exec() {
+    docker compose -f "$COMPOSE_FILE" exec -T mysql sh -c \
+        'MYSQL_PWD="$MYSQL_ROOT_PASSWORD" exec mysql -uroot --batch --skip-column-names "$MYSQL_DATABASE"'
+}
+
+# mysql 컨테이너가 막 시작된 경우 접속 가능해질 때까지 대기 (최대 60초)
+attempt=0
+until echo "SELECT 1" | mysql_exec > /dev/null 2>&1; do
+    attempt=$((attempt + 1))
+    if [ "$attempt" -ge 30 ]; then
+        echo "MySQL에 접속할 수 없습니다." >&2
+        exit 1
+    fi
+    sleep 2
+done
+
+echo "CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) NOT NULL PRIMARY KEY,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)" | mysql_exec
+
+for file in "$MIGRATIONS_DIR"/[0-9]*.sql; do
+    version="$(basename "$file")"
+    applied="$(echo "SELECT 1 FROM schema_migrations WHERE version = '$version'" | mysql_exec)"
+    if [ -n "$applied" ]; then
+        continue
+    fi
+    echo "Applying $version"
+    mysql_exec < "$file"
+    echo "INSERT INTO schema_migrations (version) VALUES ('$version')" | mysql_exec
+done
+
+echo "Migrations up to date."
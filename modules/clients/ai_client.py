@@ -7,9 +7,14 @@
 - 환경변수 (테스트/CLI용)
 - 의존성 주입 (단위 테스트용)
 - Rate Limit 재시도 로직 (tenacity)
+- 분당 요청 수 제한 (비동기 병렬 호출용 토큰 버킷)
 """
 
+import asyncio
+import logging
 import os
+import threading
+import time
 import openai
 from typing import Optional, Any, List, Dict
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -19,9 +24,15 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     genai = None
 
+logger = logging.getLogger(__name__)
+
 # AI Client instance for dependency injection (테스트용)
 _ai_client_instance: Optional['BaseAIClient'] = None
 
+# Streamlit 밖(테스트/CLI)에서 생성한 provider별 클라이언트 (HTTP 연결 풀을 호출 간 재사용)
+_ai_clients: Dict[str, 'BaseAIClient'] = {}
+_ai_clients_lock = threading.Lock()
+
 
 class BaseAIClient:
     """AI 클라이언트 기본 인터페이스"""
@@ -31,6 +42,29 @@ class BaseAIClient:
         raise NotImplementedError
 
 
+class AsyncRateLimiter:
+    """분당 요청 수(RPM) 제한 토큰 버킷 (같은 이벤트 루프의 태스크 간 공유)"""
+    
+    def __init__(self, requests_per_minute: int):
+        self._capacity = float(requests_per_minute)
+        self._tokens = float(requests_per_minute)
+        self._rate = requests_per_minute / 60.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
 class OpenAIClient(BaseAIClient):
     """OpenAI 클라이언트 래퍼 클래스"""
     
@@ -46,7 +80,10 @@ class OpenAIClient(BaseAIClient):
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=1, max=60),
         retry=retry_if_exception_type(openai.RateLimitError),
-        before_sleep=lambda retry_state: print(f"Rate limit reached. Retrying in {retry_state.next_action.sleep} seconds... (Attempt {retry_state.attempt_number}/5)")
+        before_sleep=lambda retry_state: logger.warning(
+            "Rate limit reached. Retrying in %s seconds... (Attempt %d/5)",
+            retry_state.next_action.sleep, retry_state.attempt_number
+        )
     )
     def chat_completion(self, model: str, messages: list, **kwargs):
         """채팅 완성 요청 (Rate Limit 자동 재시도 포함)"""
@@ -98,7 +135,10 @@ class GeminiClient(BaseAIClient):
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=1, max=60),
-        before_sleep=lambda retry_state: print(f"Rate limit reached. Retrying in {retry_state.next_action.sleep} seconds... (Attempt {retry_state.attempt_number}/5)")
+        before_sleep=lambda retry_state: logger.warning(
+            "Rate limit reached. Retrying in %s seconds... (Attempt %d/5)",
+            retry_state.next_action.sleep, retry_state.attempt_number
+        )
     )
     def chat_completion(self, model: str, messages: list, **kwargs):
         # Gemini API
@@ -130,9 +170,11 @@ class GeminiClient(BaseAIClient):
 
 
 def set_ai_client(client: Optional[Any]) -> None:
-    # 테스트용 커스텀 AI 클라이언트 설정
+    # 테스트용 커스텀 AI 클라이언트 설정 (캐시된 클라이언트도 초기화)
     global _ai_client_instance
     _ai_client_instance = client
+    with _ai_clients_lock:
+        _ai_clients.clear()
 
 
 def get_api_key(provider: str = 'gemini') -> str:
@@ -170,9 +212,10 @@ def get_ai_client(provider: str = 'gemini') -> BaseAIClient:
         provider: 'openai' 또는 'gemini' (기본값: 'gemini')
     
     설정된 커스텀 클라이언트가 있으면 사용하고(테스트용),
-    그렇지 않으면 환경변수나 Streamlit secrets의 API 키로 새 클라이언트를 생성합니다.
+    그렇지 않으면 환경변수나 Streamlit secrets의 API 키로 클라이언트를 생성합니다.
     
-    Streamlit 프로덕션 환경에서는 st.cache_resource를 사용하여 캐시됩니다.
+    Streamlit 프로덕션 환경에서는 st.cache_resource로, 그 외 환경에서는 모듈 전역에
+    provider별로 캐시되어 호출마다 HTTP 연결 풀을 새로 만들지 않습니다.
     """
     global _ai_client_instance
     
@@ -187,7 +230,19 @@ def get_ai_client(provider: str = 'gemini') -> BaseAIClient:
     except (ImportError, RuntimeError):
         pass
     
-    # 일반 환경에서는 새 클라이언트 생성
+    # 일반 환경에서는 provider별로 한 번만 생성해 재사용
+    client = _ai_clients.get(provider)
+    if client is None:
+        with _ai_clients_lock:
+            client = _ai_clients.get(provider)
+            if client is None:
+                client = _create_ai_client(provider)
+                _ai_clients[provider] = client
+    return client
+
+
+def _create_ai_client(provider: str) -> BaseAIClient:
+    """API 키로 provider에 맞는 새 클라이언트 생성"""
     api_key = get_api_key(provider)
     if provider == 'gemini':
         if genai is None:
@@ -206,16 +261,6 @@ def _get_cached_ai_client(provider: str = 'gemini') -> BaseAIClient:
     
     @st.cache_resource
     def _create_client(prov: str):
-        api_key = get_api_key(prov)
-        if prov == 'gemini':
-            if genai is None:
-                raise ModuleNotFoundError(
-                    "google-generativeai 패키지가 설치되어 있지 않습니다. "
-                    "Gemini를 사용하려면 requirements.txt의 google-generativeai를 설치하세요."
-                )
-            return GeminiClient(api_key)
-        else:
-            client = openai.OpenAI(api_key=api_key)
-            return OpenAIClient(client)
+        return _create_ai_client(prov)
     
     return _create_client(provider)
@@ -53,7 +53,7 @@ SYSTEM_PROMPT = """
     </writing_examples>
 
     <output_format>
-    오직 아래의 JSON 구조로만 답변하십시오.
+    오직 아래의 JSON 구조로만 답변하십시오. 각 candidates 배열에는 가장 완성도 높은 기록 1개만 작성하십시오.
     {
         "original_physical_evaluation": {
             "oer_fidelity": "O",
@@ -67,42 +67,18 @@ SYSTEM_PROMPT = """
         },
         "physical_candidates": [
             { 
-                "corrected_note": "후보1",
+                "corrected_note": "작성한 기록",
                 "oer_fidelity": "O",
                 "specificity": "O", 
                 "grammar": "O"
-            },
-            { 
-                "corrected_note": "후보2",
-                "oer_fidelity": "X",
-                "specificity": "O", 
-                "grammar": "O"
-            },
-            { 
-                "corrected_note": "후보3",
-                "oer_fidelity": "O",
-                "specificity": "X", 
-                "grammar": "X"
             }
         ],
         "cognitive_candidates": [
             { 
-                "corrected_note": "후보1",
+                "corrected_note": "작성한 기록",
                 "oer_fidelity": "O",
                 "specificity": "O", 
                 "grammar": "O"
-            },
-            { 
-                "corrected_note": "후보2",
-                "oer_fidelity": "X",
-                "specificity": "O", 
-                "grammar": "O"
-            },
-            { 
-                "corrected_note": "후보3",
-                "oer_fidelity": "O",
-                "specificity": "X", 
-                "grammar": "X"
             }
         ]
     }
@@ -208,3 +184,27 @@ def get_special_note_prompt(record: dict) -> tuple[str, str]:
 </daily_activity_record>
 """
     return SYSTEM_PROMPT, user_prompt
+
+
+# 여러 기록을 한 번에 평가할 때 SYSTEM_PROMPT 뒤에 붙이는 출력 형식 지시
+BATCH_OUTPUT_INSTRUCTION = """
+<batch_instruction>
+    여러 개의 <daily_activity_record>가 각각 <record id="...">로 감싸져 주어집니다.
+    각 기록을 서로 독립적으로 평가하고 생성하십시오. 다른 기록의 내용을 섞지 마십시오.
+    응답은 오직 아래 JSON 객체 하나로 답변하고, results에는 입력된 모든 id를 한 번씩 포함하십시오.
+    {
+        "results": [
+            { "id": 기록 id, ...위 output_format의 필드 전체... }
+        ]
+    }
+</batch_instruction>
+"""
+
+
+def get_special_note_batch_prompt(records: list) -> tuple[str, str]:
+    """record_id 기준으로 여러 기록을 하나의 프롬프트로 묶기"""
+    blocks = []
+    for record in records:
+        _, user_prompt = get_special_note_prompt(record)
+        blocks.append(f'<record id="{record["record_id"]}">{user_prompt}</record>')
+    return SYSTEM_PROMPT + BATCH_OUTPUT_INSTRUCTION, '\n'.join(blocks)
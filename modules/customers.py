@@ -32,6 +32,11 @@ def create_customer(*, name: str, birth_date, gender: str = None,
     )
 
 
+def create_customers_bulk(rows: List[Dict]) -> List[int]:
+    """Create many customers at once and return their IDs in input order."""
+    return customer_repo.create_customers_bulk(rows)
+
+
 def update_customer(*, customer_id: int, name: str, birth_date, 
                    gender: str = None, recognition_no: str = None, 
                    benefit_start_date = None, grade: str = None) -> int:
@@ -27,6 +27,11 @@ def save_parsed_data(records):
     return daily_info_repo.save_parsed_data(records)
 
 
+def save_parsed_data_columnar(columns):
+    """열 단위(레코드 키 → 값 목록) 파싱 데이터 저장"""
+    return daily_info_repo.save_parsed_data_columnar(columns)
+
+
 def get_customers_with_records(start_date=None, end_date=None):
     """날짜 범위 내에 기록이 있는 대상자 목록 조회"""
     return daily_info_repo.get_customers_with_records(start_date, end_date)
@@ -37,6 +42,11 @@ def get_all_records_by_date_range(start_date, end_date):
     return daily_info_repo.get_all_records_by_date_range(start_date, end_date)
 
 
+def iter_all_records_by_date_range(start_date, end_date):
+    """날짜 범위 내 모든 레코드를 한 행씩 스트리밍 조회"""
+    return daily_info_repo.iter_all_records_by_date_range(start_date, end_date)
+
+
 def get_db_connection():
     """Get a database connection using Streamlit secrets."""
     import streamlit as st
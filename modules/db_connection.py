@@ -5,10 +5,14 @@
 - 환경변수 (테스트/CLI용)
 - 의존성 주입 (단위 테스트용)
 - 연결 풀링 (성능 최적화)
+- 풀 연결별 쿼리당 서버 측 prepared 커서 캐시 (단건 조회 핫 패스용)
 """
 
 import os
 import gc
+import threading
+import time
+import weakref
 import mysql.connector
 from mysql.connector import pooling
 from contextlib import contextmanager
@@ -21,6 +25,16 @@ _connection_factory: Optional[Callable[[], Any]] = None
 _connection_pool: Optional[pooling.MySQLConnectionPool] = None
 _pool_config: Optional[Dict[str, Any]] = None
 
+# 풀 소진 시 반납 확인 간격 (_checkout 참고)
+_POOL_RETRY_INTERVAL = 0.005
+
+# 연결(풀 연결은 래퍼가 감싼 실제 연결 객체)별 prepared 커서 캐시: 연결 → (서버 connection_id, {SQL: 커서})
+# 반납 시 세션 리셋을 하지 않으므로(pool_reset_session=False) prepared 문장은 연결에 남아 있고,
+# 풀이 재연결하면 connection_id가 바뀌므로 서버에서 사라진 prepared 문장은 다시 만들고,
+# 풀에서 버려진 연결은 약한 참조라 캐시에서도 자동으로 빠짐 (prepared_cursor 참고)
+_prepared_cursors: 'weakref.WeakKeyDictionary[Any, tuple]' = weakref.WeakKeyDictionary()
+_prepared_cursors_lock = threading.Lock()
+
 
 def set_connection_factory(factory: Optional[Callable[[], Any]]) -> None:
     """테스트용 커스텀 연결 팩토리 설정
@@ -30,6 +44,7 @@ def set_connection_factory(factory: Optional[Callable[[], Any]]) -> None:
     """
     global _connection_factory
     _connection_factory = factory
+    _clear_prepared_cursors()
 
 
 def get_db_config() -> Dict[str, Any]:
@@ -86,14 +101,20 @@ def _get_connection_pool() -> pooling.MySQLConnectionPool:
                 pass
         
         from modules.utils.memory_utils import DB_POOL_SIZE
-        pool_size = DB_POOL_SIZE
+        # 배포 환경별 동시 접속 수에 맞춰 환경변수로 조정 가능
+        pool_size = int(os.environ.get('DB_POOL_SIZE', DB_POOL_SIZE))
         
         _pool_config = config.copy()
+        # 반납 시 세션 리셋(ping + COM_RESET_CONNECTION) 생략:
+        # 체크아웃/반납이 네트워크 왕복 없이 큐 연산으로 끝나고,
+        # 연결 시 설정한 time_zone(+09:00)도 리셋으로 사라지지 않음
+        # 리셋이 없으므로 autocommit으로 두어 읽기 후 열린 스냅샷이 다음 사용자에게 남지 않게 함
+        # (쓰기는 db_transaction에서 명시적으로 트랜잭션 시작)
         _connection_pool = pooling.MySQLConnectionPool(
             pool_name="arisa_pool",
             pool_size=pool_size,
-            pool_reset_session=True,
-            **config
+            pool_reset_session=False,
+            **{**config, 'autocommit': True}
         )
     
     return _connection_pool
@@ -110,19 +131,105 @@ def get_db_connection():
     
     try:
         pool = _get_connection_pool()
-        return pool.get_connection()
     except Exception:
         # 풀링 실패 시 직접 연결 (폴백)
-        config = get_db_config()
-        return mysql.connector.connect(**config)
+        return _connect_direct()
+    return _checkout(pool)
+
+
+def _checkout(pool: pooling.MySQLConnectionPool):
+    """풀에서 연결 체크아웃
+    
+    풀이 모두 사용 중이면 곧바로 직접 연결(TCP + 인증 핸드셰이크)을 만들지 않고
+    DB_POOL_WAIT_SECONDS 동안 반납을 기다립니다. 같은 스레드가 연결을 쥔 채 다시
+    체크아웃하는 경우에도 교착되지 않도록 대기 후에는 직접 연결로 폴백합니다.
+    """
+    from modules.utils.memory_utils import DB_POOL_WAIT_SECONDS
+    deadline = time.monotonic() + DB_POOL_WAIT_SECONDS
+    while True:
+        try:
+            return pool.get_connection()
+        except mysql.connector.errors.PoolError:
+            if time.monotonic() >= deadline:
+                return _connect_direct()
+            time.sleep(_POOL_RETRY_INTERVAL)
+        except Exception:
+            # 재연결 실패 등
+            return _connect_direct()
+
+
+def _connect_direct():
+    """풀을 거치지 않는 autocommit 직접 연결 생성"""
+    return mysql.connector.connect(**{**get_db_config(), 'autocommit': True})
+
+
+def _connect_local_infile():
+    """LOAD DATA LOCAL INFILE을 허용하는 직접 연결 생성
+    
+    클라이언트 파일 읽기를 허용하는 연결이므로 풀에는 넣지 않고 대량 적재 트랜잭션에서만 사용합니다.
+    """
+    if _connection_factory is not None:
+        return _connection_factory()
+    return mysql.connector.connect(**{**get_db_config(), 'autocommit': True, 'allow_local_infile': True})
 
 
 @contextmanager
-def db_transaction(dictionary: bool = False) -> Iterator[mysql.connector.cursor.MySQLCursor]:
+def prepared_cursor(query: str) -> Iterator[Any]:
+    """풀 연결을 체크아웃해 쿼리별 서버 측 prepared 커서로 실행하는 컨텍스트 매니저
+    
+    prepared 커서는 풀 연결마다 SQL 문자열별로 캐시되므로, 같은 연결에서 같은 쿼리는
+    서버가 최초 1회만 파싱(PREPARE)하고 이후에는 파라미터만 바인딩해 실행합니다.
+    연결은 블록이 끝나면 풀에 반납되므로 서버 연결 수는 풀 크기를 넘지 않습니다.
+    풀 밖 연결(풀 대기 초과 시 직접 연결)도 같은 캐시를 쓰며, 연결이 닫혀 해제되면 캐시에서도 빠집니다.
+    고정된 SQL 상수에만 사용해야 합니다 (문자열마다 연결별 prepared 문장이 하나씩 남음).
+    
+    Yields:
+        딕셔너리 커서 (prepared 커서는 unbuffered: 블록 안에서 결과를 모두 읽어야 함)
+    """
+    conn = get_db_connection()
+    # PooledMySQLConnection은 체크아웃마다 새 래퍼를 만들므로 캐시 키는 래퍼가 감싼 실제 연결이어야 함.
+    # mysql-connector에는 이를 꺼내는 공개 API가 없어 비공개 속성 _cnx에 의존하며,
+    # 속성 이름이 바뀌면 연결 객체 자체를 키로 써서 캐시 적중만 줄고 동작은 그대로 유지됨
+    cnx = getattr(conn, '_cnx', conn)
+    try:
+        yield _cached_prepared_cursor(cnx, query)
+    except Exception:
+        # 오류가 난 연결의 prepared 문장은 믿을 수 없으므로 다음 체크아웃에서 다시 만듦
+        with _prepared_cursors_lock:
+            _prepared_cursors.pop(cnx, None)
+        raise
+    finally:
+        conn.close()
+
+
+def _cached_prepared_cursor(cnx, query: str):
+    """풀의 실제 연결 객체에 묶인 쿼리별 prepared 커서 (없거나 재연결됐으면 새로 생성)"""
+    connection_id = cnx.connection_id
+    with _prepared_cursors_lock:
+        entry = _prepared_cursors.get(cnx)
+        if entry is None or entry[0] != connection_id:
+            entry = _prepared_cursors[cnx] = (connection_id, {})
+    cursors = entry[1]
+    cursor = cursors.get(query)
+    if cursor is None:
+        cursor = cursors[query] = cnx.cursor(prepared=True, dictionary=True)
+    return cursor
+
+
+def _clear_prepared_cursors() -> None:
+    """캐시된 prepared 커서 전체 폐기 (연결 설정/풀 변경 시)"""
+    with _prepared_cursors_lock:
+        _prepared_cursors.clear()
+
+
+@contextmanager
+def db_transaction(dictionary: bool = False,
+                   local_infile: bool = False) -> Iterator[mysql.connector.cursor.MySQLCursor]:
     """자동 커밋/롤백이 포함된 데이터베이스 트랜잭션 컨텍스트 매니저
     
     Args:
         dictionary: 딕셔너리 커서 반환 여부 (기본값: False)
+        local_infile: LOAD DATA LOCAL INFILE 허용 전용 연결 사용 여부 (기본값: False, 대량 적재용)
         
     Yields:
         MySQL 커서 객체
@@ -132,9 +239,10 @@ def db_transaction(dictionary: bool = False) -> Iterator[mysql.connector.cursor.
             cursor.execute("INSERT INTO table VALUES (%s)", (value,))
             # 성공 시 자동 커밋, 예외 발생 시 롤백
     """
-    conn = get_db_connection()
+    conn = _connect_local_infile() if local_infile else get_db_connection()
     cursor = conn.cursor(dictionary=dictionary)
     try:
+        conn.start_transaction()
         yield cursor
         conn.commit()
     except Exception:
@@ -179,4 +287,5 @@ def release_pool():
     global _connection_pool, _pool_config
     _connection_pool = None
     _pool_config = None
+    _clear_prepared_cursors()
     gc.collect()
@@ -1,7 +1,148 @@
-from typing import Dict, Optional
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from modules.db_connection import db_transaction
+from modules.utils.memory_utils import BULK_INSERT_CHUNK_SIZE
 from .base import BaseRepository
 
 
+class EvaluationRow(NamedTuple):
+    """get_all_evaluations_by_record 결과 행 (SELECT 컬럼 순서와 동일)"""
+    category: str
+    oer_fidelity: Optional[str]
+    specificity_score: Optional[str]
+    grammar_score: Optional[str]
+    grade_code: Optional[str]
+    reason_text: Optional[str]
+    suggestion_text: Optional[str]
+    created_at: Optional[datetime]
+
+
+class CustomerEvaluationRow(NamedTuple):
+    """get_evaluations_by_customer 결과 행 (SELECT 컬럼 순서와 동일)"""
+    category: str
+    oer_fidelity: Optional[str]
+    specificity_score: Optional[str]
+    grammar_score: Optional[str]
+    grade_code: Optional[str]
+    reason_text: Optional[str]
+    suggestion_text: Optional[str]
+    created_at: Optional[datetime]
+    date: Optional[date]
+    customer_name: Optional[str]
+
+
+# 카테고리별 통계 집계 컬럼 (ai_evaluation_daily_stats 합산, 반올림/NULL 처리까지 SQL에서 수행)
+# 집계 테이블은 ai_evaluations 트리거로 유지됨 (migrations/003_ai_evaluation_daily_stats.sql)
+_STATS_AGGREGATE_COLUMNS = """
+                CAST(SUM(total) AS SIGNED) as total_evaluations,
+                COALESCE(ROUND(SUM(oer_o_count) / NULLIF(SUM(total), 0), 2), 0) as avg_oer_fidelity,
+                COALESCE(ROUND(SUM(specificity_o_count) / NULLIF(SUM(total), 0), 2), 0) as avg_specificity,
+                COALESCE(ROUND(SUM(grammar_o_count) / NULLIF(SUM(total), 0), 2), 0) as avg_grammar,
+                SUM(excellent_count) as excellent_count,
+                SUM(average_count) as average_count,
+                SUM(improvement_count) as improvement_count,
+                SUM(poor_count) as poor_count
+"""
+
+# 날짜 조건은 NULL이면 무시하는 고정 형태로 두어 조회 조건과 무관하게 SQL 문자열이 항상 같도록 유지
+# 파라미터: (customer_id, start_date, start_date, end_date, end_date)
+_DATE_RANGE_FILTER = """
+                  AND (%s IS NULL OR {date_column} >= %s)
+                  AND (%s IS NULL OR {date_column} <= %s)"""
+
+# 일자별 집계 행만 범위 합산 (평가 건수와 무관하게 대상자/기간당 수십 행 수준)
+_STATS_FROM_DAILY = f"""
+            FROM ai_evaluation_daily_stats
+            WHERE customer_id = %s{_DATE_RANGE_FILTER.format(date_column='date')}
+            GROUP BY category
+            HAVING SUM(total) > 0
+"""
+
+_EVALUATION_STATS_QUERY = f"""
+            SELECT 
+                category,{_STATS_AGGREGATE_COLUMNS}{_STATS_FROM_DAILY}"""
+
+# 영어 카테고리 → 저장용 한국어 카테고리
+_CATEGORY_MAP = {
+    "PHYSICAL": "신체",
+    "COGNITIVE": "인지",
+    "NURSING": "간호",
+    "RECOVERY": "기능",
+    "SPECIAL_NOTE_PHYSICAL": "신체",
+    "SPECIAL_NOTE_COGNITIVE": "인지"
+}
+
+# 단건 조회 컬럼 / 쿼리는 모듈 로드 시 한 번만 조립하고 호출마다 같은 문자열 객체를 재사용
+_EVALUATION_COLUMNS = (
+    "ai_eval_id, oer_fidelity, specificity_score, grammar_score, "
+    "grade_code, reason_text, suggestion_text, original_text, created_at, updated_at"
+)
+
+_EXISTS_EVALUATION_QUERY = "SELECT ai_eval_id FROM ai_evaluations WHERE record_id = %s AND category = %s"
+
+_GET_EVALUATION_QUERY = f"""
+            SELECT {_EVALUATION_COLUMNS}
+            FROM ai_evaluations
+            WHERE record_id = %s AND category = %s
+"""
+
+_UPDATE_EVALUATION_QUERY = """
+            UPDATE ai_evaluations SET
+                oer_fidelity = %s,
+                specificity_score = %s,
+                grammar_score = %s,
+                grade_code = %s,
+                reason_text = %s,
+                suggestion_text = %s,
+                original_text = %s,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE record_id = %s AND category = %s
+"""
+
+_INSERT_EVALUATION_QUERY = """
+            INSERT INTO ai_evaluations (
+                record_id, category, oer_fidelity, specificity_score, grammar_score,
+                grade_code, reason_text, suggestion_text, original_text,
+                created_at, updated_at
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            )
+"""
+
+# 다중 행 저장: (record_id, category) UNIQUE 키(migrations/004)로 기존 평가는 같은 문장에서 갱신
+_UPSERT_EVALUATION_ROW = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+
+_UPSERT_EVALUATIONS_QUERY = """
+            INSERT INTO ai_evaluations (
+                record_id, category, oer_fidelity, specificity_score, grammar_score,
+                grade_code, reason_text, suggestion_text, original_text,
+                created_at, updated_at
+            ) VALUES {rows}
+            ON DUPLICATE KEY UPDATE
+                oer_fidelity = VALUES(oer_fidelity),
+                specificity_score = VALUES(specificity_score),
+                grammar_score = VALUES(grammar_score),
+                grade_code = VALUES(grade_code),
+                reason_text = VALUES(reason_text),
+                suggestion_text = VALUES(suggestion_text),
+                original_text = VALUES(original_text),
+                updated_at = CURRENT_TIMESTAMP
+"""
+
+_DELETE_EVALUATION_QUERY = "DELETE FROM ai_evaluations WHERE record_id = %s AND category = %s"
+
+# SELECT 컬럼 순서를 EvaluationRow 필드 순서에서 그대로 생성
+_EVALUATIONS_BY_RECORD_QUERY = f"""
+            SELECT {', '.join(EvaluationRow._fields)}
+            FROM ai_evaluations
+            WHERE record_id = %s
+"""
+
+# get_all_evaluations_by_record 결과 정렬 순서 (레코드당 최대 몇 건이라 DB 정렬 대신 파이썬에서 정렬)
+_CATEGORY_ORDER = {"신체": 0, "인지": 1, "간호": 2, "기능": 3}
+
+
 class AiEvaluationRepository(BaseRepository):
 
     def save_evaluation(self, record_id: int, category: str, 
@@ -9,152 +150,121 @@ class AiEvaluationRepository(BaseRepository):
                        grade_code: str, original_text: str, reason_text: str = None,
                        suggestion_text: str = None) -> None:
         """Save or update AI evaluation result."""
-        # 영어 카테고리를 한국어로 매핑
-        category_map = {
-            "PHYSICAL": "신체",
-            "COGNITIVE": "인지", 
-            "NURSING": "간호",
-            "RECOVERY": "기능",
-            "SPECIAL_NOTE_PHYSICAL": "신체",
-            "SPECIAL_NOTE_COGNITIVE": "인지"
-        }
-        korean_category = category_map.get(category, category)
+        korean_category = _CATEGORY_MAP.get(category, category)
         
         # 평가가 존재하는지 확인
-        check_query = 'SELECT ai_eval_id FROM ai_evaluations WHERE record_id = %s AND category = %s'
-        existing = self._execute_query_one(check_query, (record_id, korean_category))
+        existing = self._execute_query_one(_EXISTS_EVALUATION_QUERY, (record_id, korean_category))
         
         if existing:
             # 기존 평가 업데이트
-            update_query = '''
-                UPDATE ai_evaluations SET
-                    oer_fidelity = %s,
-                    specificity_score = %s,
-                    grammar_score = %s,
-                    grade_code = %s,
-                    reason_text = %s,
-                    suggestion_text = %s,
-                    original_text = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE record_id = %s AND category = %s
-            '''
-            self._execute_transaction(update_query, (
+            self._execute_transaction(_UPDATE_EVALUATION_QUERY, (
                 oer_fidelity, specificity_score, grammar_score,
                 grade_code, reason_text, suggestion_text, original_text,
                 record_id, korean_category
             ))
         else:
             # 새 평가 삽입
-            insert_query = '''
-                INSERT INTO ai_evaluations (
-                    record_id, category, oer_fidelity, specificity_score, grammar_score,
-                    grade_code, reason_text, suggestion_text, original_text, 
-                    created_at, updated_at
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                )
-            '''
-            self._execute_transaction(insert_query, (
+            self._execute_transaction(_INSERT_EVALUATION_QUERY, (
                 record_id, korean_category, oer_fidelity, specificity_score, grammar_score,
                 grade_code, reason_text, suggestion_text, original_text
             ))
     
-    def get_evaluation(self, record_id: int, category: str) -> Optional[Dict]:
-        """Get AI evaluation for a specific record and category."""
-        category_map = {
-            "PHYSICAL": "신체",
-            "COGNITIVE": "인지", 
-            "NURSING": "간호",
-            "RECOVERY": "기능"
-        }
-        korean_category = category_map.get(category, category)
+    def save_evaluations_bulk(self, rows: List[Tuple], chunk_size: int = None) -> None:
+        """Save or update many AI evaluations with multi-row upserts in one transaction.
         
-        query = """
-            SELECT ai_eval_id, oer_fidelity, specificity_score, grammar_score,
-                   grade_code, reason_text, suggestion_text, original_text,
-                   created_at, updated_at
-            FROM ai_evaluations
-            WHERE record_id = %s AND category = %s
+        Args:
+            rows: save_evaluation 인자 순서의 튜플 목록
+                  (record_id, category, oer_fidelity, specificity_score, grammar_score,
+                   grade_code, original_text, reason_text, suggestion_text)
+            chunk_size: INSERT 1문장당 행 수 (None이면 BULK_INSERT_CHUNK_SIZE)
         """
-        return self._execute_query_one(query, (record_id, korean_category))
+        if not rows:
+            return
+        
+        if chunk_size is None:
+            chunk_size = BULK_INSERT_CHUNK_SIZE
+        
+        with db_transaction() as cursor:
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                params = []
+                for (record_id, category, oer_fidelity, specificity_score, grammar_score,
+                     grade_code, original_text, reason_text, suggestion_text) in chunk:
+                    params.extend((
+                        record_id, _CATEGORY_MAP.get(category, category), oer_fidelity,
+                        specificity_score, grammar_score, grade_code,
+                        reason_text, suggestion_text, original_text
+                    ))
+                
+                cursor.execute(
+                    _UPSERT_EVALUATIONS_QUERY.format(rows=', '.join([_UPSERT_EVALUATION_ROW] * len(chunk))),
+                    params
+                )
     
-    def get_all_evaluations_by_record(self, record_id: int) -> list:
+    def get_evaluation(self, record_id: int, category: str) -> Optional[Dict]:
+        """Get AI evaluation for a specific record and category."""
+        korean_category = _CATEGORY_MAP.get(category, category)
+        return self._execute_query_one(_GET_EVALUATION_QUERY, (record_id, korean_category))
+    
+    def get_all_evaluations_by_record(self, record_id: int) -> List[EvaluationRow]:
         """Get all AI evaluations for a record."""
-        query = """
-            SELECT category, oer_fidelity, specificity_score, grammar_score,
-                   grade_code, reason_text, suggestion_text, created_at
-            FROM ai_evaluations
-            WHERE record_id = %s
-            ORDER BY category
-        """
-        return self._execute_query(query, (record_id,))
+        rows = self._execute_query_tuples(_EVALUATIONS_BY_RECORD_QUERY, (record_id,), EvaluationRow)
+        rows.sort(key=lambda r: _CATEGORY_ORDER.get(r.category, len(_CATEGORY_ORDER)))
+        return rows
     
-    def get_evaluations_by_customer(self, customer_id: int, limit: int = 50) -> list:
+    def get_evaluations_by_customer(self, customer_id: int, limit: int = 50) -> List[CustomerEvaluationRow]:
         """Get recent AI evaluations for a customer."""
+        # customers는 이름 1건만 필요하므로 JOIN 대신 1회 평가되는 스칼라 서브쿼리 사용
+        # (daily_infos(customer_id, date) 인덱스로 정렬/LIMIT 처리)
         query = """
             SELECT 
                 ae.category, ae.oer_fidelity, ae.specificity_score,
                 ae.grammar_score, ae.grade_code, ae.reason_text,
                 ae.suggestion_text, ae.created_at,
-                di.date, c.name as customer_name
+                di.date,
+                (SELECT name FROM customers WHERE customer_id = %s) as customer_name
             FROM ai_evaluations ae
             JOIN daily_infos di ON ae.record_id = di.record_id
-            JOIN customers c ON di.customer_id = c.customer_id
-            WHERE c.customer_id = %s
+            WHERE di.customer_id = %s
             ORDER BY di.date DESC, ae.created_at DESC
             LIMIT %s
         """
-        return self._execute_query(query, (customer_id, limit))
+        return self._execute_query_tuples(query, (customer_id, customer_id, limit), CustomerEvaluationRow)
     
     def delete_evaluation(self, record_id: int, category: str) -> int:
         """Delete an AI evaluation."""
-        category_map = {
-            "PHYSICAL": "신체",
-            "COGNITIVE": "인지", 
-            "NURSING": "간호",
-            "RECOVERY": "기능"
-        }
-        korean_category = category_map.get(category, category)
-        
-        query = "DELETE FROM ai_evaluations WHERE record_id = %s AND category = %s"
-        return self._execute_transaction(query, (record_id, korean_category))
+        korean_category = _CATEGORY_MAP.get(category, category)
+        return self._execute_transaction(_DELETE_EVALUATION_QUERY, (record_id, korean_category))
     
     def get_evaluation_stats(self, customer_id: int, start_date=None, end_date=None) -> Dict:
         """Get evaluation statistics for a customer within date range."""
-        query = """
-            SELECT 
-                ae.category,
-                COUNT(*) as total_evaluations,
-                AVG(CASE WHEN ae.oer_fidelity = 'O' THEN 1 ELSE 0 END) as avg_oer_fidelity,
-                AVG(CASE WHEN ae.specificity_score = 'O' THEN 1 ELSE 0 END) as avg_specificity,
-                AVG(CASE WHEN ae.grammar_score = 'O' THEN 1 ELSE 0 END) as avg_grammar,
-                SUM(CASE WHEN ae.grade_code = '우수' THEN 1 ELSE 0 END) as excellent_count,
-                SUM(CASE WHEN ae.grade_code = '평균' THEN 1 ELSE 0 END) as average_count,
-                SUM(CASE WHEN ae.grade_code = '개선' THEN 1 ELSE 0 END) as improvement_count,
-                SUM(CASE WHEN ae.grade_code = '불량' THEN 1 ELSE 0 END) as poor_count
-            FROM ai_evaluations ae
-            JOIN daily_infos di ON ae.record_id = di.record_id
-            WHERE di.customer_id = %s
-        """
-        params = [customer_id]
+        start_date, end_date = self._date_range_params(start_date, end_date)
+        results = self._execute_query(
+            _EVALUATION_STATS_QUERY,
+            (customer_id, start_date, start_date, end_date, end_date)
+        )
         
+        return self._format_stats(results)
+    
+    @staticmethod
+    def _date_range_params(start_date, end_date) -> Tuple:
+        """날짜 필터 파라미터 정규화 (시작/종료일이 모두 있을 때만 범위 적용)"""
         if start_date and end_date:
-            query += " AND di.date BETWEEN %s AND %s"
-            params.extend([start_date, end_date])
-        
-        query += " GROUP BY ae.category"
-        
-        results = self._execute_query(query, tuple(params))
+            return start_date, end_date
+        return None, None
+    
+    @staticmethod
+    def _format_stats(results: List[Dict]) -> Dict:
+        """통계 쿼리 결과를 카테고리별 딕셔너리로 변환
         
-        # 결과 포맷팅
-        stats = {}
-        for row in results:
-            stats[row['category']] = {
+        반올림과 NULL 처리는 SQL(_STATS_AGGREGATE_COLUMNS)에서 끝난 상태입니다.
+        """
+        return {
+            row['category']: {
                 'total': row['total_evaluations'],
-                'avg_oer_fidelity': round(row['avg_oer_fidelity'], 2) if row['avg_oer_fidelity'] else 0,
-                'avg_specificity': round(row['avg_specificity'], 2) if row['avg_specificity'] else 0,
-                'avg_grammar': round(row['avg_grammar'], 2) if row['avg_grammar'] else 0,
+                'avg_oer_fidelity': row['avg_oer_fidelity'],
+                'avg_specificity': row['avg_specificity'],
+                'avg_grammar': row['avg_grammar'],
                 'grades': {
                     '우수': row['excellent_count'],
                     '평균': row['average_count'],
@@ -162,5 +272,5 @@ class AiEvaluationRepository(BaseRepository):
                     '불량': row['poor_count']
                 }
             }
-        
-        return stats
+            for row in results
+        }
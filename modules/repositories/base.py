@@ -1,5 +1,9 @@
-from typing import Dict, List, Optional, Any
-from modules.db_connection import db_query, db_transaction
+from typing import Dict, List, Optional, Any, Iterator, Type, TypeVar
+import mysql.connector
+from modules.db_connection import db_query, db_transaction, prepared_cursor
+from modules.utils.cache_utils import invalidate_request_cache
+
+RowT = TypeVar('RowT')
 
 
 class BaseRepository:
@@ -14,12 +18,61 @@ class BaseRepository:
             cursor.execute(query, params or ())
             return cursor.fetchall()
     
+    def _execute_query_iter(self, query: str, params: tuple = None) -> Iterator[Dict]:
+        """Execute a read-only query and yield rows one by one without materializing them.
+        
+        db_query의 unbuffered 커서를 그대로 사용하므로 소비가 끝날 때까지 연결을 점유합니다.
+        """
+        with db_query() as cursor:
+            cursor.execute(query, params or ())
+            row = cursor.fetchone()
+            while row is not None:
+                yield row
+                row = cursor.fetchone()
+    
+    def _execute_query_tuples(self, query: str, params: tuple, row_type: Type[RowT]) -> List[RowT]:
+        """Execute a read-only query and return rows as NamedTuple instances.
+        
+        딕셔너리 대신 튜플 커서를 사용하므로 SELECT 컬럼 순서가 row_type 필드 순서와 같아야 합니다.
+        """
+        with db_query(dictionary=False) as cursor:
+            cursor.execute(query, params or ())
+            return [row_type._make(row) for row in cursor.fetchall()]
+    
+    def _execute_query_sets(self, query: str, params: tuple = None) -> List[List[Dict]]:
+        """Execute several read-only statements in one round trip and return each result set.
+        
+        세미콜론으로 이은 다중 문장을 한 번에 보내고, 문장 순서대로 결과 목록을 반환합니다.
+        """
+        with db_query() as cursor:
+            cursor.execute(query, params or ())
+            return [rows for _, rows in cursor.fetchsets()]
+    
     def _execute_query_one(self, query: str, params: tuple = None) -> Optional[Dict]:
         """Execute a read-only query and return single result."""
         with db_query() as cursor:
             cursor.execute(query, params or ())
             return cursor.fetchone()
     
+    def _fast_one(self, query: str, params: tuple = None) -> Optional[Dict]:
+        """Execute a single-row read on a pooled connection's cached prepared cursor (hot read paths only).
+        
+        query는 고정된 SQL 상수여야 합니다 (풀 연결마다 SQL 문자열별로 서버 측 prepared 문장을 캐시).
+        연결이 끊긴 경우 새로 체크아웃한 연결로 한 번만 다시 시도합니다.
+        """
+        try:
+            return self._fast_one_once(query, params)
+        except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+            return self._fast_one_once(query, params)
+    
+    @staticmethod
+    def _fast_one_once(query: str, params: tuple = None) -> Optional[Dict]:
+        with prepared_cursor(query) as cursor:
+            cursor.execute(query, params or ())
+            # prepared 커서는 unbuffered이므로 연결 반납 전에 결과를 모두 읽음
+            rows = cursor.fetchall()
+        return rows[0] if rows else None
+    
     def _execute_transaction(self, query: str, params: tuple = None) -> int:
         """Execute a write query in a transaction and return affected rows."""
         with db_transaction() as cursor:
@@ -37,3 +90,19 @@ class BaseRepository:
         with db_transaction() as cursor:
             cursor.executemany(query, params_list)
             return cursor.rowcount
+    
+    @staticmethod
+    def _inserted_ids(cursor, row_count: int) -> range:
+        """Return the AUTO_INCREMENT IDs assigned by the multi-row INSERT just executed on cursor.
+        
+        lastrowid는 첫 행의 ID입니다. 행 수가 정해진 단순 INSERT는 ID를 한 번에 할당받지만
+        ID 간격은 auto_increment_increment(복제/클러스터 설정에 따라 1이 아닐 수 있음)이므로 서버 값을 읽어 계산합니다.
+        """
+        first_id = cursor.lastrowid
+        cursor.execute("SELECT @@SESSION.auto_increment_increment")
+        step = cursor.fetchone()[0]
+        return range(first_id, first_id + row_count * step, step)
+    
+    def _invalidate_cache(self) -> None:
+        """Drop request-scoped cached lookups of this repository."""
+        invalidate_request_cache(type(self))
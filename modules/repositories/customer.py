@@ -1,13 +1,44 @@
 from typing import List, Optional, Dict
+from modules.db_connection import db_transaction
 from .base import BaseRepository
+from modules.utils.cache_utils import cached_per_request, TTLCache
+from modules.utils.memory_utils import (
+    REFERENCE_CACHE_MAX_ENTRIES, REFERENCE_CACHE_TTL, BULK_INSERT_CHUNK_SIZE
+)
+
+# 이름 전문 검색(ngram_token_size=2)을 사용할 최소 키워드 길이
+_FULLTEXT_MIN_KEYWORD_LENGTH = 2
+
+# 대상자 단건 조회 캐시 (프로세스 전역, customer_id 기준)
+_customer_cache = TTLCache(maxsize=REFERENCE_CACHE_MAX_ENTRIES, ttl=REFERENCE_CACHE_TTL)
 
 
 class CustomerRepository(BaseRepository):
     """Repository for customer-related database operations."""
     
     def list_customers(self, keyword: str = None) -> List[Dict]:
-        """List all customers or search by keyword."""
-        if keyword:
+        """List all customers or search by keyword.
+        
+        2글자 이상은 이름 ngram 전문 인덱스 + 인정번호 접두어 인덱스를 사용하고,
+        ngram 토큰보다 짧은 1글자 검색은 LIKE 부분 일치로 처리합니다.
+        """
+        if keyword and len(keyword) >= _FULLTEXT_MIN_KEYWORD_LENGTH:
+            # 불리언 모드 연산자 무력화를 위해 구문 검색으로 감싸기
+            phrase = '"' + keyword.replace('"', '') + '"'
+            query = """
+                SELECT customer_id, name, birth_date, gender, recognition_no, 
+                       benefit_start_date, grade
+                FROM customers
+                WHERE MATCH(name) AGAINST (%s IN BOOLEAN MODE)
+                UNION
+                SELECT customer_id, name, birth_date, gender, recognition_no, 
+                       benefit_start_date, grade
+                FROM customers
+                WHERE recognition_no LIKE %s
+                ORDER BY customer_id DESC
+            """
+            return self._execute_query(query, (phrase, f"{keyword}%"))
+        elif keyword:
             like = f"%{keyword}%"
             query = """
                 SELECT customer_id, name, birth_date, gender, recognition_no, 
@@ -26,15 +57,23 @@ class CustomerRepository(BaseRepository):
             """
             return self._execute_query(query)
     
+    @cached_per_request
     def get_customer(self, customer_id: int) -> Optional[Dict]:
         """Get a single customer by ID."""
+        cached = _customer_cache.get(customer_id)
+        if cached is not None:
+            return dict(cached)
+        
         query = """
             SELECT customer_id, name, birth_date, gender, recognition_no, 
                    benefit_start_date, grade
             FROM customers
             WHERE customer_id = %s
         """
-        return self._execute_query_one(query, (customer_id,))
+        customer = self._fast_one(query, (customer_id,))
+        if customer:
+            _customer_cache.set(customer_id, dict(customer))
+        return customer
     
     def create_customer(self, name: str, birth_date, gender: str = None, 
                        recognition_no: str = None, benefit_start_date = None, 
@@ -45,10 +84,51 @@ class CustomerRepository(BaseRepository):
                                   benefit_start_date, grade)
             VALUES (%s, %s, %s, %s, %s, %s)
         """
-        return self._execute_transaction_lastrowid(
+        customer_id = self._execute_transaction_lastrowid(
             query, (name, birth_date, gender, recognition_no, 
                    benefit_start_date, grade)
         )
+        self._invalidate_cache()
+        return customer_id
+    
+    def create_customers_bulk(self, rows: List[Dict], chunk_size: int = None) -> List[int]:
+        """Create many customers with multi-row INSERTs and return their IDs in input order.
+        
+        MySQL은 RETURNING을 지원하지 않으므로 청크별 첫 ID(lastrowid)와 auto_increment_increment로
+        행 수만큼 ID를 계산합니다 (_inserted_ids). 이름은 UNIQUE가 아니어서 이름으로 다시 조회할 수 없습니다.
+        
+        Args:
+            rows: name, birth_date, gender, recognition_no, benefit_start_date, grade 키를 가진 딕셔너리 목록
+            chunk_size: INSERT 1문장당 행 수 (None이면 BULK_INSERT_CHUNK_SIZE)
+        """
+        if not rows:
+            return []
+        
+        if chunk_size is None:
+            chunk_size = BULK_INSERT_CHUNK_SIZE
+        
+        customer_ids = []
+        with db_transaction() as cursor:
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                placeholders = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(chunk))
+                params = []
+                for row in chunk:
+                    params.extend((
+                        row['name'], row.get('birth_date'), row.get('gender'),
+                        row.get('recognition_no'), row.get('benefit_start_date'),
+                        row.get('grade')
+                    ))
+                
+                cursor.execute(f"""
+                    INSERT INTO customers (name, birth_date, gender, recognition_no, 
+                                          benefit_start_date, grade)
+                    VALUES {placeholders}
+                """, params)
+                customer_ids.extend(self._inserted_ids(cursor, len(chunk)))
+        
+        self._invalidate_cache()
+        return customer_ids
     
     def update_customer(self, customer_id: int, name: str, birth_date, 
                        gender: str = None, recognition_no: str = None, 
@@ -60,16 +140,23 @@ class CustomerRepository(BaseRepository):
                 benefit_start_date=%s, grade=%s
             WHERE customer_id=%s
         """
-        return self._execute_transaction(
+        affected = self._execute_transaction(
             query, (name, birth_date, gender, recognition_no, 
                    benefit_start_date, grade, customer_id)
         )
+        _customer_cache.pop(customer_id)
+        self._invalidate_cache()
+        return affected
     
     def delete_customer(self, customer_id: int) -> int:
         """Delete a customer and return the number of affected rows."""
         query = "DELETE FROM customers WHERE customer_id=%s"
-        return self._execute_transaction(query, (customer_id,))
+        affected = self._execute_transaction(query, (customer_id,))
+        _customer_cache.pop(customer_id)
+        self._invalidate_cache()
+        return affected
     
+    @cached_per_request
     def find_by_name(self, name: str) -> Optional[Dict]:
         """Find a customer by name (returns the most recent one)."""
         query = """
@@ -80,8 +167,9 @@ class CustomerRepository(BaseRepository):
             ORDER BY customer_id DESC
             LIMIT 1
         """
-        return self._execute_query_one(query, (name,))
+        return self._fast_one(query, (name,))
     
+    @cached_per_request
     def find_by_recognition_no(self, recognition_no: str) -> Optional[Dict]:
         """Find a customer by recognition number (returns the most recent one)."""
         query = """
@@ -92,7 +180,7 @@ class CustomerRepository(BaseRepository):
             ORDER BY customer_id DESC
             LIMIT 1
         """
-        return self._execute_query_one(query, (recognition_no,))
+        return self._fast_one(query, (recognition_no,))
     
     def find_by_name_and_birth(self, name: str, birth_date) -> Optional[Dict]:
         """Find a customer by name and birth date (returns the most recent one)."""
@@ -104,31 +192,43 @@ class CustomerRepository(BaseRepository):
             ORDER BY customer_id DESC
             LIMIT 1
         """
-        return self._execute_query_one(query, (name, birth_date))
+        return self._fast_one(query, (name, birth_date))
     
     def get_or_create(self, name: str, birth_date = None, grade: str = None,
                      recognition_no: str = None, facility_name: str = None,
                      facility_code: str = None) -> int:
-        """Get existing customer or create a new one."""
-        # 먼저 기존 고객 찾기
-        existing = self.find_by_name(name)
+        """Get existing customer or create a new one.
         
-        if existing:
-            customer_id = existing['customer_id']
-            # 새 정보가 제공되면 업데이트
-            self.update_customer(
-                customer_id=customer_id,
-                name=name,
-                birth_date=birth_date,
-                grade=grade,
-                recognition_no=recognition_no
-            )
-            return customer_id
-        else:
-            # 새 고객 생성
-            return self.create_customer(
-                name=name,
-                birth_date=birth_date,
-                grade=grade,
-                recognition_no=recognition_no
-            )
+        이름은 UNIQUE가 아니므로(동명이인 허용) UPSERT 대신
+        한 트랜잭션에서 잠금 조회 후 UPDATE/INSERT를 수행합니다.
+        """
+        with db_transaction() as cursor:
+            # 먼저 기존 고객 찾기 (동시 호출 시 중복 생성 방지를 위해 잠금)
+            cursor.execute("""
+                SELECT customer_id FROM customers
+                WHERE name = %s
+                ORDER BY customer_id DESC
+                LIMIT 1
+                FOR UPDATE
+            """, (name,))
+            existing = cursor.fetchone()
+            
+            if existing:
+                customer_id = existing[0]
+                # 새 정보로 업데이트 (성별/급여개시일 등 다른 컬럼은 유지)
+                cursor.execute("""
+                    UPDATE customers SET
+                        birth_date=%s, grade=%s, recognition_no=%s
+                    WHERE customer_id=%s
+                """, (birth_date, grade, recognition_no, customer_id))
+            else:
+                # 새 고객 생성
+                cursor.execute("""
+                    INSERT INTO customers (name, birth_date, grade, recognition_no)
+                    VALUES (%s, %s, %s, %s)
+                """, (name, birth_date, grade, recognition_no))
+                customer_id = cursor.lastrowid
+        
+        _customer_cache.pop(customer_id)
+        self._invalidate_cache()
+        return customer_id
@@ -1,7 +1,451 @@
-from typing import List, Dict, Optional, Iterator, Generator
-import gc
-from modules.db_connection import db_transaction, db_query
+from typing import Callable, List, Dict, NamedTuple, Optional, Iterator, Generator, Tuple
+import csv
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import chain
+from operator import itemgetter
+import mysql.connector
+from modules.db_connection import db_transaction
+from modules.utils.cache_utils import invalidate_request_cache, TTLCache
+from modules.utils.memory_utils import (
+    BULK_LOAD_THRESHOLD, RECORDS_CACHE_MAX_CUSTOMERS, REFERENCE_CACHE_TTL, THREAD_MAX_WORKERS
+)
 from .base import BaseRepository
+from .customer import CustomerRepository, _customer_cache
+
+# 날짜 범위 내 전체 기록 조회 (대상자 정보 + 하위 테이블 포함)
+_ALL_RECORDS_BY_DATE_RANGE_QUERY = """
+    SELECT 
+        c.customer_id, c.name as customer_name, c.birth_date as customer_birth_date,
+        c.grade as customer_grade, c.recognition_no as customer_recognition_no,
+        di.record_id, di.date, di.start_time, di.end_time,
+        di.total_service_time, di.transport_service, di.transport_vehicles,
+        dp.hygiene_care, dp.bath_time, dp.bath_method,
+        dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
+        dp.toilet_care, dp.mobility_care, dp.note as physical_note, dp.writer_name as writer_phy,
+        dc.cog_support, dc.comm_support, dc.note as cognitive_note, dc.writer_name as writer_cog,
+        dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
+        dn.note as nursing_note, dn.writer_name as writer_nur,
+        dr.prog_basic, dr.prog_activity, dr.prog_cognitive, dr.prog_therapy,
+        dr.prog_enhance_detail, dr.note as functional_note, dr.writer_name as writer_func
+    FROM daily_infos di
+    INNER JOIN customers c ON di.customer_id = c.customer_id
+    LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
+    LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
+    LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
+    LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
+    WHERE di.date BETWEEN %s AND %s
+    ORDER BY c.name, di.date DESC
+"""
+
+
+# 대상자별 기록 조회 캐시 (프로세스 전역, customer_id → {(start_date, end_date): rows})
+# 대상자 단위로 무효화할 수 있도록 customer_id를 키로 두고 기간별 결과를 묶어 보관
+_records_cache = TTLCache(maxsize=RECORDS_CACHE_MAX_CUSTOMERS, ttl=REFERENCE_CACHE_TTL)
+
+
+class DailyRecordRow(NamedTuple):
+    """get_customer_records 기록 키 / get_customer_records_rows 결과 행 (화면 컬럼 순서)"""
+    record_id: int
+    date: Optional[date]
+    total_service_time: Optional[str]
+    physical_note: Optional[str]
+    writer_physical: Optional[str]
+    meal_breakfast: Optional[str]
+    meal_lunch: Optional[str]
+    meal_dinner: Optional[str]
+    toilet_care: Optional[str]
+    bath_time: Optional[str]
+    bp_temp: Optional[str]
+    prog_therapy: Optional[str]
+    cognitive_note: Optional[str]
+    writer_cognitive: Optional[str]
+    nursing_note: Optional[str]
+    writer_nursing: Optional[str]
+    functional_note: Optional[str]
+    writer_recovery: Optional[str]
+
+
+_daily_record_row_values = itemgetter(*DailyRecordRow._fields)
+
+
+# get_customer_records 하위 테이블별 조회 컬럼 (별칭은 DailyRecordRow 필드명)
+_CUSTOMER_RECORD_CHILD_COLUMNS = (
+    ('daily_physicals', 'note AS physical_note, writer_name AS writer_physical, '
+                        'meal_breakfast, meal_lunch, meal_dinner, toilet_care, bath_time'),
+    ('daily_cognitives', 'note AS cognitive_note, writer_name AS writer_cognitive'),
+    ('daily_nursings', 'bp_temp, note AS nursing_note, writer_name AS writer_nursing'),
+    ('daily_recoveries', 'prog_therapy, note AS functional_note, writer_name AS writer_recovery'),
+)
+
+
+class _ChildTable(NamedTuple):
+    """하위 테이블 INSERT 명세 (columns[i]에는 record[record_keys[i]] 값이 들어감)"""
+    table: str
+    columns: Tuple[str, ...]
+    record_keys: Tuple[str, ...]
+    values: Callable[[Dict], tuple]
+    upsert_query: str  # 1행 UPSERT (record_id, *columns)
+    delete_query: str  # 1행 삭제 (record_id)
+
+
+def _child_table(table: str, columns: Tuple[str, ...], record_keys: Tuple[str, ...]) -> _ChildTable:
+    """record_keys 추출용 itemgetter와 1행 UPSERT/DELETE 쿼리를 미리 만들어 둔 하위 테이블 명세 생성
+    
+    하위 테이블은 record_id UNIQUE 인덱스가 있으므로 (migrations/005)
+    DELETE 후 INSERT 대신 INSERT ... ON DUPLICATE KEY UPDATE 1문장으로 교체합니다.
+    """
+    upsert_query = f"""
+        INSERT INTO {table} (record_id, {', '.join(columns)})
+        VALUES ({', '.join(['%s'] * (len(columns) + 1))})
+        ON DUPLICATE KEY UPDATE {', '.join(f'{col} = VALUES({col})' for col in columns)}
+    """
+    delete_query = f"DELETE FROM {table} WHERE record_id = %s"
+    return _ChildTable(table, columns, record_keys, itemgetter(*record_keys), upsert_query, delete_query)
+
+
+def _pluck(getter: Callable[[Dict], tuple], keys: Tuple[str, ...], record: Dict) -> tuple:
+    """레코드 값을 itemgetter 1회 호출로 추출 (키가 빠진 레코드는 get으로 None 채움)
+
+    파서 결과는 모든 키를 갖고 있어 대부분 첫 경로에서 끝나고,
+    UI 수정 등 일부 키만 있는 레코드만 dict.get 경로로 넘어갑니다.
+    두 경로 모두 키별 반복을 C 수준(itemgetter, map)에서 처리해 행 조립에 파이썬 루프가 없습니다.
+    """
+    try:
+        return getter(record)
+    except KeyError:
+        return tuple(map(record.get, keys))
+
+
+_PHYSICALS = _child_table(
+    'daily_physicals',
+    ('hygiene_care', 'bath_time', 'bath_method', 'meal_breakfast', 'meal_lunch', 'meal_dinner',
+     'toilet_care', 'mobility_care', 'note', 'writer_name'),
+    ('hygiene_care', 'bath_time', 'bath_method', 'meal_breakfast', 'meal_lunch', 'meal_dinner',
+     'toilet_care', 'mobility_care', 'physical_note', 'writer_phy'),
+)
+_COGNITIVES = _child_table(
+    'daily_cognitives',
+    ('cog_support', 'comm_support', 'note', 'writer_name'),
+    ('cog_support', 'comm_support', 'cognitive_note', 'writer_cog'),
+)
+_NURSINGS = _child_table(
+    'daily_nursings',
+    ('bp_temp', 'health_manage', 'nursing_manage', 'emergency', 'note', 'writer_name'),
+    ('bp_temp', 'health_manage', 'nursing_manage', 'emergency', 'nursing_note', 'writer_nur'),
+)
+_RECOVERIES = _child_table(
+    'daily_recoveries',
+    ('prog_basic', 'prog_activity', 'prog_cognitive', 'prog_therapy', 'prog_enhance_detail',
+     'note', 'writer_name'),
+    ('prog_basic', 'prog_activity', 'prog_cognitive', 'prog_therapy', 'prog_enhance_detail',
+     'functional_note', 'writer_func'),
+)
+_CHILD_TABLES = (_PHYSICALS, _COGNITIVES, _NURSINGS, _RECOVERIES)
+
+# 기록 삭제 대상 테이블 (의존성 순서: 하위 테이블 → daily_infos)
+_DELETE_DAILY_RECORD_TABLES = (
+    'daily_physicals', 'daily_cognitives', 'daily_nursings',
+    'daily_recoveries', 'daily_infos'
+)
+
+_DAILY_INFO_COLUMNS = (
+    "customer_id, date, start_time, end_time, "
+    "total_service_time, transport_service, transport_vehicles"
+)
+_DAILY_INFO_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, %s, %s)"
+
+# (customer_id, date) UNIQUE 키(migrations/006)로 충돌 시 기존 기록을 갱신하고,
+# LAST_INSERT_ID(record_id)로 신규/기존 어느 경우든 lastrowid가 해당 record_id가 되도록 함
+_INSERT_DAILY_INFO_QUERY = f"""
+    INSERT INTO daily_infos ({_DAILY_INFO_COLUMNS})
+    VALUES {_DAILY_INFO_ROW_PLACEHOLDER}
+    ON DUPLICATE KEY UPDATE
+        record_id = LAST_INSERT_ID(record_id),
+        start_time = VALUES(start_time), end_time = VALUES(end_time),
+        total_service_time = VALUES(total_service_time),
+        transport_service = VALUES(transport_service),
+        transport_vehicles = VALUES(transport_vehicles)
+"""
+
+# daily_infos 갱신 컬럼에 들어가는 레코드 키 (_DAILY_INFO_COLUMNS의 customer_id, date 뒤 순서)
+_DAILY_INFO_RECORD_KEYS = (
+    "start_time", "end_time", "total_service_time", "transport_service", "transport_vehicles"
+)
+_daily_info_values = itemgetter(*_DAILY_INFO_RECORD_KEYS)
+
+
+def _daily_info_params(customer_id: int, record: Dict) -> tuple:
+    """daily_infos INSERT 1행 파라미터 (_DAILY_INFO_COLUMNS 순서)"""
+    return (
+        customer_id, record["date"],
+        *_pluck(_daily_info_values, _DAILY_INFO_RECORD_KEYS, record)
+    )
+
+
+class DailyRecord(NamedTuple):
+    """일괄 저장 경로의 일일 기록 (daily_infos + 하위 테이블 4개에 들어가는 값)
+    
+    파싱 결과 딕셔너리는 화면에서 계속 수정되므로 공개 API는 딕셔너리를 그대로 받고,
+    저장 경로에 들어올 때 한 번만 변환해 이후에는 키 조회 없이 위치/속성으로 읽습니다.
+    필드 순서: date, _DAILY_INFO_RECORD_KEYS, _CHILD_TABLES 레코드 키 순.
+    """
+    date: Optional[date]
+    start_time: Optional[str]
+    end_time: Optional[str]
+    total_service_time: Optional[str]
+    transport_service: Optional[str]
+    transport_vehicles: Optional[str]
+    hygiene_care: Optional[str]
+    bath_time: Optional[str]
+    bath_method: Optional[str]
+    meal_breakfast: Optional[str]
+    meal_lunch: Optional[str]
+    meal_dinner: Optional[str]
+    toilet_care: Optional[str]
+    mobility_care: Optional[str]
+    physical_note: Optional[str]
+    writer_phy: Optional[str]
+    cog_support: Optional[str]
+    comm_support: Optional[str]
+    cognitive_note: Optional[str]
+    writer_cog: Optional[str]
+    bp_temp: Optional[str]
+    health_manage: Optional[str]
+    nursing_manage: Optional[str]
+    emergency: Optional[str]
+    nursing_note: Optional[str]
+    writer_nur: Optional[str]
+    prog_basic: Optional[str]
+    prog_activity: Optional[str]
+    prog_cognitive: Optional[str]
+    prog_therapy: Optional[str]
+    prog_enhance_detail: Optional[str]
+    functional_note: Optional[str]
+    writer_func: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, record: Dict) -> "DailyRecord":
+        """파싱 결과 딕셔너리에서 생성 (빠진 키는 None)"""
+        return cls._make(_pluck(_daily_record_values, cls._fields, record))
+
+
+_daily_record_values = itemgetter(*DailyRecord._fields)
+
+
+# 배치 저장 프로시저(migrations/007~009 save_daily_batch) 호출과 JSON payload 키
+# 프로시저의 JSON_TABLE 경로가 레코드 키(DailyRecord 필드명)를 그대로 쓰므로 이름을 바꾸면 프로시저도 함께 수정
+_SAVE_DAILY_BATCH_PROCEDURE = "save_daily_batch"
+_SAVE_DAILY_BATCH_KEYS = DailyRecord._fields
+
+
+def _save_daily_batch_payload(targets: List[Tuple[int, DailyRecord]]) -> str:
+    """save_daily_batch 프로시저 인자(JSON 배열) 생성
+
+    date/time 값은 str()로 'YYYY-MM-DD'/'HH:MM:SS' 형태가 되어 JSON_TABLE의 DATE/TEXT 컬럼으로 바로 변환됩니다.
+    """
+    return json.dumps([
+        {"customer_id": customer_id, **record._asdict()}
+        for customer_id, record in targets
+    ], ensure_ascii=False, default=str)
+
+
+# 병렬 배치 저장 중 InnoDB가 교착 상태로 트랜잭션을 롤백했을 때의 오류 코드 (ER_LOCK_DEADLOCK)
+_DEADLOCK_ERRNO = 1213
+
+# save_daily_batch 프로시저가 아직 없을 때(migrations/007 미적용)의 오류 코드 (ER_SP_DOES_NOT_EXIST)
+_PROCEDURE_MISSING_ERRNO = 1305
+
+# 프로시저 없는 DB용 배치 저장 쿼리 (UNIQUE 키(migrations/005, 006) 없이도 중복 행을 만들지 않도록
+# 기존 기록을 조회해 UPDATE/INSERT를 나누고, 하위 테이블은 삭제 후 삽입)
+_UPDATE_DAILY_INFO_QUERY = f"""
+    UPDATE daily_infos SET {', '.join(f'{col} = %s' for col in _DAILY_INFO_RECORD_KEYS)}
+    WHERE record_id = %s
+"""
+
+
+def _record_ids_query(keys: List[Tuple[int, object]]) -> Tuple[str, tuple]:
+    """(customer_id, date) 키 목록의 record_id 조회 쿼리/파라미터 (중복 행이 있으면 가장 최근 기록이 마지막)"""
+    query = f"""
+        SELECT record_id, customer_id, date FROM daily_infos
+        WHERE (customer_id, date) IN ({', '.join(['(%s, %s)'] * len(keys))})
+        ORDER BY record_id
+    """
+    return query, tuple(chain.from_iterable(keys))
+
+
+def _child_insert(child: _ChildTable, rows: List[Tuple[int, Dict]]) -> Optional[Tuple[str, tuple]]:
+    """하위 테이블 다중 행 INSERT 쿼리/파라미터 (값이 모두 비어 있는 기록은 제외, 대상이 없으면 None)"""
+    values = [(record_id, *child.values(record)) for record_id, record in rows]
+    values = [row for row in values if any(value is not None for value in row[1:])]
+    if not values:
+        return None
+    placeholder = f"({', '.join(['%s'] * (len(child.columns) + 1))})"
+    query = f"""
+        INSERT INTO {child.table} (record_id, {', '.join(child.columns)})
+        VALUES {', '.join([placeholder] * len(values))}
+    """
+    return query, tuple(chain.from_iterable(values))
+
+
+def _dedupe_targets(targets: List[Tuple[int, DailyRecord]]) -> List[Tuple[int, DailyRecord]]:
+    """같은 (customer_id, date) 기록이 여러 번 있으면 마지막 값만 남김 (순차 저장과 같은 결과)"""
+    return list({(customer_id, str(record.date)): (customer_id, record)
+                 for customer_id, record in targets}.values())
+
+
+def _customer_batches(targets: List[Tuple[int, DailyRecord]],
+                      batch_size: int) -> List[List[Tuple[int, DailyRecord]]]:
+    """저장 대상을 대상자 단위로 묶어 batch_size 안팎의 배치로 분할
+    
+    같은 대상자의 기록은 입력 순서대로 한 배치에 모이므로 배치끼리 (customer_id, date) 키가 겹치지 않아
+    병렬로 저장해도 잠금이 충돌하지 않고, 같은 날짜가 중복되면 순차 저장과 같이 마지막 값이 남습니다.
+    한 대상자의 기록이 batch_size보다 많으면 그 대상자만으로 배치 하나를 만듭니다.
+    """
+    by_customer = {}
+    for target in targets:
+        by_customer.setdefault(target[0], []).append(target)
+    
+    batches = []
+    batch = []
+    for rows in by_customer.values():
+        if batch and len(batch) + len(rows) > batch_size:
+            batches.append(batch)
+            batch = []
+        batch.extend(rows)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# 대량 적재(LOAD DATA LOCAL INFILE) 경로의 세션 임시 스테이징 테이블
+# 컬럼은 customer_id + 배치 저장 payload 키와 같고, 여기서 INSERT ... SELECT로 실제 테이블에 반영
+_STAGING_TABLE = "staging_daily_records"
+_STAGING_COLUMNS = ("customer_id", *_SAVE_DAILY_BATCH_KEYS)
+_CREATE_STAGING_TABLE_QUERY = f"""
+    CREATE TEMPORARY TABLE {_STAGING_TABLE} (
+        customer_id INT NOT NULL,
+        date DATE NOT NULL,
+        {', '.join(f'{key} TEXT' for key in _SAVE_DAILY_BATCH_KEYS[1:])},
+        KEY (customer_id, date)
+    )
+"""
+# 따옴표 안의 구분자/줄바꿈/"" 는 csv.writer 출력 그대로 해석되고, NULL은 \N, 역슬래시는 이스케이프해 기록
+_LOAD_STAGING_QUERY = f"""
+    LOAD DATA LOCAL INFILE %s INTO TABLE {_STAGING_TABLE}
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY '\\\\'
+    LINES TERMINATED BY '\\n'
+    ({', '.join(_STAGING_COLUMNS)})
+"""
+_STAGING_DAILY_INFO_UPSERT = f"""
+    INSERT INTO daily_infos ({_DAILY_INFO_COLUMNS})
+    SELECT customer_id, date, {', '.join(_DAILY_INFO_RECORD_KEYS)}
+    FROM {_STAGING_TABLE}
+    ON DUPLICATE KEY UPDATE {', '.join(f'daily_infos.{col} = VALUES({col})' for col in _DAILY_INFO_RECORD_KEYS)}
+"""
+
+# 서버가 LOCAL INFILE을 허용하지 않을 때(local_infile=OFF, MySQL 8.0 기본값)의 오류 코드
+# (ER_NOT_ALLOWED_COMMAND, ER_CLIENT_LOCAL_FILES_DISABLED)
+_LOCAL_INFILE_DISABLED_ERRNOS = (1148, 3948)
+
+
+def _staging_child_upsert(child: _ChildTable) -> str:
+    """스테이징 테이블 → 하위 테이블 INSERT ... SELECT UPSERT 쿼리 생성
+    
+    record_id는 (customer_id, date) UNIQUE 키(migrations/006)로 daily_infos와 조인해 찾습니다.
+    하위 항목 값이 모두 비어 있는 기록은 행을 만들지 않습니다 (_staging_child_delete 참고).
+    SELECT 쪽 컬럼과 이름이 겹치므로 갱신 대상 컬럼은 테이블명으로 한정합니다.
+    """
+    return f"""
+        INSERT INTO {child.table} (record_id, {', '.join(child.columns)})
+        SELECT di.record_id, {', '.join(f's.{key}' for key in child.record_keys)}
+        FROM {_STAGING_TABLE} s
+        JOIN daily_infos di ON di.customer_id = s.customer_id AND di.date = s.date
+        WHERE {_staging_coalesce(child)} IS NOT NULL
+        ON DUPLICATE KEY UPDATE {', '.join(f'{child.table}.{col} = VALUES({col})' for col in child.columns)}
+    """
+
+
+def _staging_child_delete(child: _ChildTable) -> str:
+    """스테이징 기록 중 하위 항목 값이 모두 비어 있는 기록의 기존 하위 행 삭제 쿼리 생성"""
+    return f"""
+        DELETE t FROM {child.table} t
+        JOIN daily_infos di ON di.record_id = t.record_id
+        JOIN {_STAGING_TABLE} s ON di.customer_id = s.customer_id AND di.date = s.date
+        WHERE {_staging_coalesce(child)} IS NULL
+    """
+
+
+def _staging_coalesce(child: _ChildTable) -> str:
+    """스테이징 행의 하위 테이블 레코드 키 중 첫 non-null 값 (모두 null이면 NULL)"""
+    return f"COALESCE({', '.join(f's.{key}' for key in child.record_keys)})"
+
+
+def _staging_csv_value(value) -> str:
+    """LOAD DATA 입력 필드 값 (NULL은 \\N, 역슬래시는 ESCAPED BY 문자이므로 이스케이프)"""
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\")
+
+
+def _write_staging_csv(f, targets: List[Tuple[int, DailyRecord]]) -> None:
+    """스테이징 테이블 적재용 CSV 기록 (_STAGING_COLUMNS 순서)"""
+    writer = csv.writer(f, lineterminator="\n")
+    for customer_id, record in targets:
+        writer.writerow([customer_id, *map(_staging_csv_value, record)])
+
+
+def _child_replace(child: _ChildTable, record_id: int, record: Dict) -> Tuple[str, tuple]:
+    """하위 테이블 1행 교체 쿼리/파라미터 (값이 모두 비어 있으면 UPSERT 대신 기존 행 삭제)
+    
+    쿼리는 _child_table에서 미리 만든 문자열을 그대로 쓰고 파라미터만 조립합니다.
+    """
+    values = _pluck(child.values, child.record_keys, record)
+    if any(value is not None for value in values):
+        return child.upsert_query, (record_id, *values)
+    return child.delete_query, (record_id,)
+
+
+# 파싱 결과의 대상자 정보 키 (customers birth_date/grade/recognition_no 순)
+_CUSTOMER_META_KEYS = ("customer_birth_date", "customer_grade", "customer_recognition_no")
+
+
+def _customer_meta_by_name(records: List[Dict]) -> Dict[str, tuple]:
+    """이름별 첫 레코드의 대상자 정보 (birth_date, grade, recognition_no)를 한 번의 순회로 수집
+    
+    고객 정보는 같은 이름이면 동일하게 파싱되므로 첫 레코드만 사용합니다.
+    """
+    customer_meta = {}
+    for record in records:
+        name = record.get("customer_name")
+        if name and name not in customer_meta:
+            customer_meta[name] = tuple(map(record.get, _CUSTOMER_META_KEYS))
+    return customer_meta
+
+
+def _customer_refresh_upsert(rows: List[Tuple[int, str, tuple]]) -> Tuple[str, tuple]:
+    """기존 고객 정보 일괄 갱신 쿼리/파라미터 생성 (rows: (customer_id, name, 대상자 정보))
+
+    customers.name은 UNIQUE가 아니므로 이미 조회한 customer_id(PK)로 충돌시켜
+    행별 UPDATE 대신 INSERT ... ON DUPLICATE KEY UPDATE 1문장으로 갱신합니다.
+    PDF에 없는(NULL) 항목은 기존 값을 유지하고, 값이 있는 항목만 덮어씁니다.
+    """
+    params = tuple(chain.from_iterable(
+        (customer_id, name, *meta) for customer_id, name, meta in rows
+    ))
+    query = f"""
+        INSERT INTO customers (customer_id, name, birth_date, grade, recognition_no)
+        VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(rows))}
+        ON DUPLICATE KEY UPDATE
+            birth_date = COALESCE(VALUES(birth_date), birth_date),
+            grade = COALESCE(VALUES(grade), grade),
+            recognition_no = COALESCE(VALUES(recognition_no), recognition_no)
+    """
+    return query, params
 
 
 class DailyInfoRepository(BaseRepository):
@@ -13,7 +457,7 @@ class DailyInfoRepository(BaseRepository):
             SELECT record_id FROM daily_infos 
             WHERE customer_id=%s AND date=%s
         """
-        result = self._execute_query_one(query, (customer_id, record_date))
+        result = self._fast_one(query, (customer_id, record_date))
         return result['record_id'] if result else None
     
     def delete_daily_record(self, record_id: int) -> None:
@@ -21,135 +465,47 @@ class DailyInfoRepository(BaseRepository):
         if not record_id:
             return
         
-        # 의존성 순서대로 삭제
-        queries = [
-            "DELETE FROM daily_physicals WHERE record_id=%s",
-            "DELETE FROM daily_cognitives WHERE record_id=%s", 
-            "DELETE FROM daily_nursings WHERE record_id=%s",
-            "DELETE FROM daily_recoveries WHERE record_id=%s",
-            "DELETE FROM daily_infos WHERE record_id=%s"
-        ]
-        
         with db_transaction() as cursor:
-            for query in queries:
-                cursor.execute(query, (record_id,))
+            self._bulk_delete_records(cursor, [record_id])
+        # record_id만으로는 대상자를 알 수 없으므로 전체 무효화
+        _records_cache.clear()
     
     def insert_daily_info(self, customer_id: int, record: Dict) -> int:
-        """Insert daily info record and return the record ID."""
-        query = """
-            INSERT INTO daily_infos (
-                customer_id, date, start_time, end_time,
-                total_service_time, transport_service, transport_vehicles
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
-        return self._execute_transaction_lastrowid(
-            query, (
-                customer_id, record["date"], 
-                record.get("start_time"), record.get("end_time"),
-                record.get("total_service_time"), 
-                record.get("transport_service"),
-                record.get("transport_vehicles")
-            )
+        """Insert (or update the existing same-day) daily info record and return the record ID."""
+        record_id = self._execute_transaction_lastrowid(
+            _INSERT_DAILY_INFO_QUERY, _daily_info_params(customer_id, record)
         )
+        _records_cache.pop(customer_id)
+        return record_id
     
     def replace_daily_physicals(self, record_id: int, record: Dict) -> None:
         """Replace daily physicals record for a record_id."""
-        with db_transaction() as cursor:
-            # 기존 데이터 삭제
-            cursor.execute("DELETE FROM daily_physicals WHERE record_id=%s", (record_id,))
-            
-            # 새 데이터 삽입
-            cursor.execute("""
-                INSERT INTO daily_physicals (
-                    record_id, hygiene_care, bath_time, bath_method,
-                    meal_breakfast, meal_lunch, meal_dinner,
-                    toilet_care, mobility_care, note, writer_name
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                record_id,
-                record.get("hygiene_care"),
-                record.get("bath_time"),
-                record.get("bath_method"),
-                record.get("meal_breakfast"),
-                record.get("meal_lunch"),
-                record.get("meal_dinner"),
-                record.get("toilet_care"),
-                record.get("mobility_care"),
-                record.get("physical_note"),
-                record.get("writer_phy")
-            ))
+        self._execute_transaction(*_child_replace(_PHYSICALS, record_id, record))
+        _records_cache.clear()
     
     def replace_daily_cognitives(self, record_id: int, record: Dict) -> None:
         """Replace daily cognitives record for a record_id."""
-        with db_transaction() as cursor:
-            # 기존 데이터 삭제
-            cursor.execute("DELETE FROM daily_cognitives WHERE record_id=%s", (record_id,))
-            
-            # 새 데이터 삽입
-            cursor.execute("""
-                INSERT INTO daily_cognitives (
-                    record_id, cog_support, comm_support, note, writer_name
-                ) VALUES (%s, %s, %s, %s, %s)
-            """, (
-                record_id,
-                record.get("cog_support"),
-                record.get("comm_support"),
-                record.get("cognitive_note"),
-                record.get("writer_cog")
-            ))
+        self._execute_transaction(*_child_replace(_COGNITIVES, record_id, record))
+        _records_cache.clear()
     
     def replace_daily_nursings(self, record_id: int, record: Dict) -> None:
         """Replace daily nursings record for a record_id."""
-        with db_transaction() as cursor:
-            # 기존 데이터 삭제
-            cursor.execute("DELETE FROM daily_nursings WHERE record_id=%s", (record_id,))
-            
-            # 새 데이터 삽입
-            cursor.execute("""
-                INSERT INTO daily_nursings (
-                    record_id, bp_temp, health_manage, nursing_manage,
-                    emergency, note, writer_name
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (
-                record_id,
-                record.get("bp_temp"),
-                record.get("health_manage"),
-                record.get("nursing_manage"),
-                record.get("emergency"),
-                record.get("nursing_note"),
-                record.get("writer_nur")
-            ))
+        self._execute_transaction(*_child_replace(_NURSINGS, record_id, record))
+        _records_cache.clear()
     
     def replace_daily_recoveries(self, record_id: int, record: Dict) -> None:
         """Replace daily recoveries record for a record_id."""
-        with db_transaction() as cursor:
-            # 기존 데이터 삭제
-            cursor.execute("DELETE FROM daily_recoveries WHERE record_id=%s", (record_id,))
-            
-            # 새 데이터 삽입
-            cursor.execute("""
-                INSERT INTO daily_recoveries (
-                    record_id, prog_basic, prog_activity, prog_cognitive,
-                    prog_therapy, prog_enhance_detail, note, writer_name
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                record_id,
-                record.get("prog_basic"),
-                record.get("prog_activity"),
-                record.get("prog_cognitive"),
-                record.get("prog_therapy"),
-                record.get("prog_enhance_detail"),
-                record.get("functional_note"),
-                record.get("writer_func")
-            ))
+        self._execute_transaction(*_child_replace(_RECOVERIES, record_id, record))
+        _records_cache.clear()
     
     def save_parsed_data(self, records: List[Dict], batch_size: int = None) -> int:
         """Save parsed daily data in batched transactions to avoid packet size limits.
         
         성능 최적화:
         - 고객명 일괄 조회로 N+1 쿼리 방지
-        - 기존 레코드 일괄 조회
-        - 청크 단위 메모리 해제
+        - 배치별 저장 프로시저 호출 1회 (기존 기록 조회/삽입/갱신을 서버에서 집합 단위로 처리)
+        - 대상자 단위로 나눈 배치를 풀 연결 여러 개로 병렬 저장
+        - BULK_LOAD_THRESHOLD 초과 시 LOAD DATA LOCAL INFILE 1회 적재 (서버가 허용하지 않으면 배치 처리)
         
         Args:
             records: List of parsed records to save
@@ -157,211 +513,367 @@ class DailyInfoRepository(BaseRepository):
                        (None이면 기본값 20 사용)
         
         Returns:
-            Total number of records saved
+            Total number of records saved (같은 대상자/날짜 중복은 마지막 1건만 저장되어 1건으로 셈)
         """
         if not records:
             return 0
-            
-        saved_count = 0
-        total_records = len(records)
         
-        if batch_size is None:
-            from modules.utils.memory_utils import BATCH_SIZE_MEDIUM
-            batch_size = BATCH_SIZE_MEDIUM
+        # 1단계: 이름별 대상자 정보 수집(1회 순회) 및 일괄 조회/생성
+        customer_map = self._bulk_get_or_create_customers(_customer_meta_by_name(records))
+        invalidate_request_cache(CustomerRepository)
         
-        # 1단계: 모든 고객명 수집 및 일괄 조회/생성
-        customer_names = list(set(r.get("customer_name") for r in records if r.get("customer_name")))
-        customer_map = self._bulk_get_or_create_customers(records, customer_names)
+        # 2단계: 저장 대상 변환 후 대량이면 LOAD DATA 1회, 아니면 배치 단위로 처리 (메모리 최적화)
+        try:
+            saved_count = self._write_targets(self._save_targets(records, customer_map), batch_size)
+        finally:
+            # 중간 배치에서 실패해도 이미 커밋된 배치가 있으므로 항상 무효화
+            for customer_id in customer_map.values():
+                _records_cache.pop(customer_id)
         
-        # 2단계: 기존 레코드 일괄 조회
-        existing_records = self._bulk_find_existing_records(customer_map, records)
+        return saved_count
+    
+    def save_parsed_data_columnar(self, columns: Dict[str, List], batch_size: int = None) -> int:
+        """Save parsed daily data given as columns (record key → values in row order).
         
-        # 3단계: 배치 단위로 처리 (메모리 최적화)
-        for i in range(0, total_records, batch_size):
-            batch = records[i:i + batch_size]
-            saved_count += self._process_batch(
-                batch, customer_map, existing_records
-            )
-            
-            # 배치별 메모리 해제
-            if i > 0 and i % (batch_size * 5) == 0:
-                gc.collect()
+        save_parsed_data와 같은 저장 흐름이지만 행별 딕셔너리 없이 열 목록을 zip으로 한 번에
+        DailyRecord로 전치합니다. 대상자 정보는 이름별 첫 행만 딕셔너리로 만들어 조회/생성합니다.
+        없는 열은 모든 행에서 None으로 저장됩니다.
+        
+        Args:
+            columns: 레코드 키별 값 목록 (customer_name 열 필수, 모든 열의 길이가 같아야 함)
+            batch_size: Number of records to process per transaction (None이면 기본값 20 사용)
+        
+        Returns:
+            Total number of records saved (같은 대상자/날짜 중복은 마지막 1건만 저장되어 1건으로 셈)
+        """
+        names = columns.get("customer_name") or []
+        if not names:
+            return 0
         
-        # 최종 메모리 정리
-        del customer_map, existing_records
-        gc.collect()
+        missing = [None] * len(names)
+        
+        # 1단계: 이름별 첫 행의 대상자 정보로 일괄 조회/생성 (_customer_meta_by_name과 같은 기준)
+        meta_columns = [columns.get(key, missing) for key in _CUSTOMER_META_KEYS]
+        customer_meta = {}
+        for i, name in enumerate(names):
+            if name and name not in customer_meta:
+                customer_meta[name] = tuple(column[i] for column in meta_columns)
+        customer_map = self._bulk_get_or_create_customers(customer_meta)
+        invalidate_request_cache(CustomerRepository)
+        
+        # 2단계: 열 → DailyRecord 전치 1회 후 저장
+        daily_records = map(DailyRecord._make, zip(*(columns.get(field, missing) for field in DailyRecord._fields)))
+        try:
+            targets = [
+                (customer_map[name], record)
+                for name, record in zip(names, daily_records) if customer_map.get(name)
+            ]
+            saved_count = self._write_targets(targets, batch_size)
+        finally:
+            for customer_id in customer_map.values():
+                _records_cache.pop(customer_id)
         
         return saved_count
     
-    def _bulk_get_or_create_customers(self, records: List[Dict], customer_names: List[str]) -> Dict[str, int]:
-        """고객 일괄 조회/생성"""
-        if not customer_names:
+    def _write_targets(self, targets: List[Tuple[int, DailyRecord]], batch_size: int = None) -> int:
+        """저장 대상 기록 - BULK_LOAD_THRESHOLD 초과 시 LOAD DATA 1회, 아니면(또는 거부 시) 배치 처리
+        
+        어느 경로든 (customer_id, date) 중복을 제거한 뒤의 저장 수를 반환합니다.
+        """
+        if len(targets) > BULK_LOAD_THRESHOLD:
+            loaded = self._bulk_load_records(targets)
+            if loaded is not None:
+                return loaded
+        
+        if batch_size is None:
+            from modules.utils.memory_utils import BATCH_SIZE_MEDIUM
+            batch_size = BATCH_SIZE_MEDIUM
+        
+        # 배치마다 풀 연결을 따로 체크아웃하므로 여러 배치를 동시에 커밋 (왕복 지연/로그 플러시 중첩)
+        batches = _customer_batches(targets, batch_size)
+        if len(batches) <= 1:
+            return sum(map(self._process_batch, batches))
+        with ThreadPoolExecutor(max_workers=min(len(batches), THREAD_MAX_WORKERS)) as executor:
+            return sum(executor.map(self._process_batch_retrying_deadlock, batches))
+    
+    def _process_batch_retrying_deadlock(self, targets: List[Tuple[int, DailyRecord]]) -> int:
+        """배치 처리 - 교착 상태로 롤백되면 한 번 다시 실행 (프로시저는 upsert라 재실행해도 결과 동일)"""
+        try:
+            return self._process_batch(targets)
+        except mysql.connector.Error as e:
+            if e.errno != _DEADLOCK_ERRNO:
+                raise
+            return self._process_batch(targets)
+    
+    def _bulk_get_or_create_customers(self, customer_meta: Dict[str, tuple]) -> Dict[str, int]:
+        """고객 일괄 조회/생성 (customer_meta: 이름 → (birth_date, grade, recognition_no))"""
+        if not customer_meta:
             return {}
-            
-        customer_map = {}
         
         with db_transaction() as cursor:
-            # 기존 고객 일괄 조회
-            placeholders = ', '.join(['%s'] * len(customer_names))
-            cursor.execute(
-                f"SELECT customer_id, name FROM customers WHERE name IN ({placeholders})",
-                customer_names
-            )
-            for row in cursor.fetchall():
-                customer_map[row[1]] = row[0]
-            
-            # 신규 고객 생성
-            for record in records:
-                name = record.get("customer_name")
-                if not name or name in customer_map:
-                    continue
-                    
-                cursor.execute("""
-                    INSERT INTO customers (name, birth_date, grade, recognition_no)
-                    VALUES (%s, %s, %s, %s)
-                """, (
-                    name,
-                    record.get("customer_birth_date"),
-                    record.get("customer_grade"),
-                    record.get("customer_recognition_no")
-                ))
-                customer_map[name] = cursor.lastrowid
+            customer_map = self._bulk_resolve_customers(cursor, customer_meta)
         
+        # 기존 고객 정보가 갱신되었으므로 프로세스 전역 캐시에서도 제거
+        for customer_id in customer_map.values():
+            _customer_cache.pop(customer_id)
         return customer_map
     
-    def _bulk_find_existing_records(self, customer_map: Dict[str, int], records: List[Dict]) -> Dict[tuple, int]:
-        """기존 레코드 일괄 조회"""
-        existing = {}
+    def _bulk_resolve_customers(self, cursor, by_name: Dict[str, tuple]) -> Dict[str, int]:
+        """Resolve customer ids for all names within an existing transaction.
         
-        if not customer_map:
-            return existing
-            
-        # (customer_id, date) 쌍 수집
-        lookup_pairs = []
-        for record in records:
-            name = record.get("customer_name")
-            if name in customer_map:
-                lookup_pairs.append((customer_map[name], record["date"]))
+        이름 수와 무관하게 SELECT 1회 + 기존 고객 갱신 1회 + 신규 고객 INSERT 1회(+ ID 재조회 1회)로 처리합니다.
+        """
+        if not by_name:
+            return {}
         
-        if not lookup_pairs:
-            return existing
+        # 기존 고객 일괄 조회 (이름은 UNIQUE가 아니므로 find_by_name과 같이 가장 최근 고객 우선)
+        customer_map = self._select_customer_ids(cursor, by_name)
         
-        # 청크 단위로 조회 (SQL IN 절 제한 방지)
-        chunk_size = 100
-        for i in range(0, len(lookup_pairs), chunk_size):
-            chunk = lookup_pairs[i:i + chunk_size]
-            
-            with db_query() as cursor:
-                conditions = " OR ".join(
-                    ["(customer_id=%s AND date=%s)"] * len(chunk)
-                )
-                params = []
-                for cid, dt in chunk:
-                    params.extend([cid, dt])
-                
-                cursor.execute(
-                    f"SELECT record_id, customer_id, date FROM daily_infos WHERE {conditions}",
-                    params
-                )
-                for row in cursor.fetchall():
-                    existing[(row['customer_id'], str(row['date']))] = row['record_id']
-        
-        return existing
-    
-    def _process_batch(self, batch: List[Dict], customer_map: Dict[str, int], 
-                       existing_records: Dict[tuple, int]) -> int:
-        """배치 처리 - 단일 트랜잭션에서 벨크 삽입/업데이트"""
-        saved_count = 0
+        # 기존 고객 정보 갱신 (birth_date, grade, recognition_no 중 PDF에 값이 있는 항목만)
+        # 이름 대신 PK로 충돌시키는 다중 행 upsert 1문장
+        existing_rows = [
+            (customer_map[name], name, meta) for name, meta in by_name.items() if name in customer_map
+        ]
+        if existing_rows:
+            cursor.execute(*_customer_refresh_upsert(existing_rows))
         
-        with db_transaction() as cursor:
-            for record in batch:
-                name = record.get("customer_name")
-                customer_id = customer_map.get(name)
-                if not customer_id:
-                    continue
-                
-                record["customer_id"] = customer_id
-                date_str = str(record["date"])
-                
-                # 기존 레코드 확인
-                existing_id = existing_records.get((customer_id, date_str))
-                
-                if existing_id:
-                    # 기존 레코드 업데이트 (record_id 유지)
-                    cursor.execute("""
-                        UPDATE daily_infos SET
-                            start_time = %s, end_time = %s,
-                            total_service_time = %s, transport_service = %s, transport_vehicles = %s
-                        WHERE record_id = %s
-                    """, (
-                        record.get("start_time"), record.get("end_time"),
-                        record.get("total_service_time"),
-                        record.get("transport_service"),
-                        record.get("transport_vehicles"),
-                        existing_id
-                    ))
-                    record_id = existing_id
-                    
-                    # 하위 레코드들 삭제 후 재삽입 (AI 평가는 유지됨)
-                    cursor.execute("DELETE FROM daily_physicals WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_cognitives WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_nursings WHERE record_id=%s", (record_id,))
-                    cursor.execute("DELETE FROM daily_recoveries WHERE record_id=%s", (record_id,))
-                else:
-                    # 새 레코드 삽입
-                    cursor.execute("""
-                        INSERT INTO daily_infos (
-                            customer_id, date, start_time, end_time,
-                            total_service_time, transport_service, transport_vehicles
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        customer_id, record["date"],
-                        record.get("start_time"), record.get("end_time"),
-                        record.get("total_service_time"),
-                        record.get("transport_service"),
-                        record.get("transport_vehicles")
-                    ))
-                    record_id = cursor.lastrowid
-                
-                # 하위 레코드들 삽입
-                self._insert_physicals_in_transaction(cursor, record_id, record)
-                self._insert_cognitives_in_transaction(cursor, record_id, record)
-                self._insert_nursings_in_transaction(cursor, record_id, record)
-                self._insert_recoveries_in_transaction(cursor, record_id, record)
-                
-                saved_count += 1
+        # 신규 고객 생성 (다중 행 INSERT 1문장)
+        new_customers = {name: meta for name, meta in by_name.items() if name not in customer_map}
+        if new_customers:
+            placeholders = ', '.join(['(%s, %s, %s, %s)'] * len(new_customers))
+            cursor.execute(f"""
+                INSERT INTO customers (name, birth_date, grade, recognition_no)
+                VALUES {placeholders}
+            """, tuple(chain.from_iterable(
+                (name, *meta) for name, meta in new_customers.items()
+            )))
+            # 연속 ID를 가정하지 않고(auto_increment_increment) 방금 만든 고객의 ID를 이름으로 다시 조회
+            customer_map.update(self._select_customer_ids(cursor, new_customers))
         
-        return saved_count
+        return customer_map
+    
+    @staticmethod
+    def _select_customer_ids(cursor, names) -> Dict[str, int]:
+        """이름별 customer_id 조회 (같은 이름이 여러 명이면 가장 최근 고객)"""
+        placeholders = ', '.join(['%s'] * len(names))
+        cursor.execute(
+            f"SELECT customer_id, name FROM customers WHERE name IN ({placeholders}) ORDER BY customer_id",
+            tuple(names)
+        )
+        return {name: customer_id for customer_id, name in cursor.fetchall()}
+    
+    def _process_batch(self, targets: List[Tuple[int, DailyRecord]]) -> int:
+        """배치 처리 - 저장 프로시저 호출 1회
+        
+        배치 전체를 JSON 1개로 보내면 save_daily_batch(migrations/009)가 JSON_TABLE로 펼쳐
+        - daily_infos: (customer_id, date) UNIQUE 키로 신규 삽입/기존 갱신 (record_id 유지)
+        - 하위 테이블: 테이블별 INSERT ... SELECT UPSERT 1문장 (기존 레코드는 덮어씀, AI 평가는 유지,
+          하위 항목 값이 모두 비어 있는 기록은 행을 만들지 않고 예전 행만 삭제)
+        를 서버 안에서 실행하므로 배치당 서버 왕복이 1회입니다.
+        프로시저가 아직 없는 DB(마이그레이션 전)에서는 _write_batch_in_transaction으로 저장합니다.
+        같은 (customer_id, date) 기록은 payload를 만들기 전에 마지막 값만 남깁니다
+        (JSON_TABLE은 중복 항목을 모두 처리하므로, 하위 값이 빈 항목이 다른 항목의 하위 행을 지울 수 있음).
+        """
+        targets = _dedupe_targets(targets)
+        if not targets:
+            return 0
+        
+        try:
+            with db_transaction() as cursor:
+                cursor.callproc(_SAVE_DAILY_BATCH_PROCEDURE, (_save_daily_batch_payload(targets),))
+        except mysql.connector.Error as e:
+            if e.errno != _PROCEDURE_MISSING_ERRNO:
+                raise
+            # 마이그레이션 전 DB: 같은 결과를 Python 집합 단위 쿼리로 저장
+            with db_transaction() as cursor:
+                self._write_batch_in_transaction(cursor, targets)
+        
+        return len(targets)
+    
+    def _write_batch_in_transaction(self, cursor, targets: List[Tuple[int, DailyRecord]]) -> None:
+        """save_daily_batch 프로시저가 없을 때의 배치 저장 (UNIQUE 키에 의존하지 않음)
+        
+        - daily_infos: 기존 기록 일괄 조회 후 UPDATE(record_id 유지) / 신규는 다중 행 INSERT 1문장
+        - 신규 record_id는 자동 증가 값 계산 대신 (customer_id, date)로 다시 조회
+        - 하위 테이블: 테이블별 DELETE ... IN 1문장 후 값이 있는 기록만 다중 행 INSERT 1문장
+        targets는 _process_batch에서 (customer_id, date) 중복을 제거한 목록입니다.
+        """
+        rows = [(customer_id, record._asdict()) for customer_id, record in targets]
+        keys = [(customer_id, record["date"]) for customer_id, record in rows]
+        
+        cursor.execute(*_record_ids_query(keys))
+        existing = {(row[1], str(row[2])): row[0] for row in cursor.fetchall()}
+        
+        update_rows = []
+        new_rows = []
+        for customer_id, record in rows:
+            record_id = existing.get((customer_id, str(record["date"])))
+            values = _daily_info_params(customer_id, record)
+            if record_id:
+                update_rows.append((*values[2:], record_id))
+            else:
+                new_rows.append(values)
+        
+        if update_rows:
+            cursor.executemany(_UPDATE_DAILY_INFO_QUERY, update_rows)
+        if new_rows:
+            cursor.execute(f"""
+                INSERT INTO daily_infos ({_DAILY_INFO_COLUMNS})
+                VALUES {', '.join([_DAILY_INFO_ROW_PLACEHOLDER] * len(new_rows))}
+            """, tuple(chain.from_iterable(new_rows)))
+            cursor.execute(*_record_ids_query(keys))
+            existing = {(row[1], str(row[2])): row[0] for row in cursor.fetchall()}
+        
+        saved = [
+            (existing[(customer_id, str(record["date"]))], record)
+            for customer_id, record in rows
+        ]
+        record_ids = [record_id for record_id, _ in saved]
+        placeholders = ', '.join(['%s'] * len(record_ids))
+        for child in _CHILD_TABLES:
+            cursor.execute(f"DELETE FROM {child.table} WHERE record_id IN ({placeholders})", tuple(record_ids))
+            insert = _child_insert(child, saved)
+            if insert:
+                cursor.execute(*insert)
+    
+    def _bulk_load_records(self, targets: List[Tuple[int, DailyRecord]]) -> Optional[int]:
+        """대량 저장 - LOAD DATA LOCAL INFILE로 스테이징 후 집합 단위 반영
+        
+        레코드를 임시 CSV 파일로 써서 세션 임시 테이블에 LOAD DATA로 한 번에 적재하고,
+        daily_infos와 하위 테이블 4개를 각각 INSERT ... SELECT UPSERT 1문장으로 반영합니다.
+        행별 SQL 파싱이 없고 max_allowed_packet 제한도 받지 않습니다.
+        같은 (customer_id, date) 기록은 CSV에 쓰기 전에 마지막 값만 남깁니다
+        (스테이징에 중복 키가 있으면 INSERT ... SELECT UPSERT가 어느 행을 남길지 정해지지 않음).
+        
+        Returns:
+            저장한 레코드 수, 서버가 LOCAL INFILE을 허용하지 않으면 None (배치 처리로 폴백)
+        """
+        if not targets:
+            return 0
+        
+        targets = _dedupe_targets(targets)
+        # mysql-connector는 LOCAL INFILE을 파일 경로로만 읽으므로 메모리 대신 임시 파일 사용
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", encoding="utf-8",
+                                         newline="", delete=False) as f:
+            _write_staging_csv(f, targets)
+        try:
+            with db_transaction(local_infile=True) as cursor:
+                cursor.execute(_CREATE_STAGING_TABLE_QUERY)
+                cursor.execute(_LOAD_STAGING_QUERY, (f.name,))
+                # 서버가 스테이징에 실제로 적재한 행 수 (ON DUPLICATE KEY UPDATE의 영향 행 수는 갱신 시 2로 세므로 쓰지 않음)
+                loaded = cursor.rowcount
+                cursor.execute(_STAGING_DAILY_INFO_UPSERT)
+                for child in _CHILD_TABLES:
+                    cursor.execute(_staging_child_upsert(child))
+                    cursor.execute(_staging_child_delete(child))
+                # 임시 테이블은 전용 연결이 닫힐 때 함께 제거됨
+        except mysql.connector.Error as e:
+            if e.errno in _LOCAL_INFILE_DISABLED_ERRNOS:
+                return None
+            raise
+        finally:
+            os.unlink(f.name)
+        
+        return loaded
+    
+    @staticmethod
+    def _save_targets(records: List[Dict], customer_map: Dict[str, int]) -> List[Tuple[int, DailyRecord]]:
+        """저장 대상 (customer_id, DailyRecord) 목록 (대상자를 찾지 못한 레코드 제외)
+        
+        화면에서 저장 후 customer_id를 다시 읽으므로 원본 딕셔너리에도 customer_id를 기록합니다.
+        """
+        targets = []
+        for record in records:
+            customer_id = customer_map.get(record.get("customer_name"))
+            if not customer_id:
+                continue
+            
+            record["customer_id"] = customer_id
+            targets.append((customer_id, DailyRecord.from_dict(record)))
+        return targets
     
     def get_customer_records(self, customer_id: int, start_date=None, end_date=None) -> List[Dict]:
-        """Get all daily records for a customer within date range."""
-        query = """
-            SELECT 
-                di.record_id, di.date, di.total_service_time,
-                dp.note AS physical_note, dp.writer_name AS writer_physical,
-                dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
-                dp.toilet_care, dp.bath_time,
-                dn.bp_temp,
-                dr.prog_therapy,
-                dc.note AS cognitive_note, dc.writer_name AS writer_cognitive,
-                dn.note AS nursing_note, dn.writer_name AS writer_nursing,
-                dr.note AS functional_note, dr.writer_name AS writer_recovery
-            FROM daily_infos di
-            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-            WHERE di.customer_id = %s
+        """Get all daily records for a customer within date range.
+        
+        과거 기록은 거의 바뀌지 않으므로 (customer_id, 기간)별 결과를 프로세스 전역으로 캐시하고,
+        해당 대상자 기록을 쓰는 메서드에서 무효화합니다.
         """
-        params = [customer_id]
+        cached = self._cached_customer_records(customer_id, start_date, end_date)
+        if cached is not None:
+            return cached
         
-        if start_date and end_date:
-            query += " AND di.date BETWEEN %s AND %s"
-            params.extend([start_date, end_date])
+        records = self._fetch_customer_records(customer_id, start_date, end_date)
+        by_range = _records_cache.get(customer_id)
+        if by_range is None:
+            by_range = {}
+            _records_cache.set(customer_id, by_range)
+        by_range[self._records_range_key(start_date, end_date)] = [dict(row) for row in records]
+        return records
+    
+    def get_customer_records_rows(self, customer_id: int, start_date=None, end_date=None) -> List[DailyRecordRow]:
+        """get_customer_records 결과(캐시/분할 조회 공유)를 DailyRecordRow 튜플로 반환 (읽기 전용 호출자용)"""
+        return [
+            DailyRecordRow._make(_daily_record_row_values(record))
+            for record in self.get_customer_records(customer_id, start_date, end_date)
+        ]
+    
+    def _fetch_customer_records(self, customer_id: int, start_date, end_date) -> List[Dict]:
+        """대상자 기록을 5테이블 JOIN 없이 조회해 Python에서 병합
         
-        query += " ORDER BY di.date DESC"
+        daily_infos 1건 + 하위 테이블 4건의 인덱스 조회(record_id)를 다중 문장 1회로 보내고,
+        record_id 딕셔너리로 한 번에 병합합니다. 하위 기록이 없는 컬럼은 LEFT JOIN과 같이 None입니다.
+        """
+        parents, *children = self._execute_query_sets(
+            *self._customer_records_split_query(customer_id, start_date, end_date)
+        )
+        records = []
+        by_id = {}
+        for parent in parents:
+            record = dict.fromkeys(DailyRecordRow._fields)
+            record.update(parent)
+            by_id[record["record_id"]] = record
+            records.append(record)
+        for rows in children:
+            for row in rows:
+                record = by_id.get(row["record_id"])
+                if record is not None:
+                    record.update(row)
+        return records
+    
+    @classmethod
+    def _cached_customer_records(cls, customer_id: int, start_date, end_date) -> Optional[List[Dict]]:
+        """캐시된 기록 조회 결과의 사본 반환 (없으면 None)"""
+        by_range = _records_cache.get(customer_id)
+        if by_range is None:
+            return None
+        rows = by_range.get(cls._records_range_key(start_date, end_date))
+        if rows is None:
+            return None
+        return [dict(row) for row in rows]
+    
+    @staticmethod
+    def _records_range_key(start_date, end_date) -> tuple:
+        """캐시 기간 키 (_customer_records_split_query와 같이 시작/종료일이 모두 있을 때만 기간 적용)"""
+        return (start_date, end_date) if start_date and end_date else (None, None)
+    
+    @staticmethod
+    def _customer_records_split_query(customer_id: int, start_date, end_date) -> Tuple[str, tuple]:
+        """_fetch_customer_records 다중 문장 쿼리와 파라미터 생성 (daily_infos → 하위 테이블 순)"""
+        condition = "customer_id = %s"
+        params = (customer_id,)
+        if start_date and end_date:
+            condition += " AND date BETWEEN %s AND %s"
+            params += (start_date, end_date)
         
-        return self._execute_query(query, tuple(params))
+        statements = [
+            f"SELECT record_id, date, total_service_time FROM daily_infos WHERE {condition} ORDER BY date DESC"
+        ]
+        statements.extend(
+            f"SELECT record_id, {columns} FROM {table} "
+            f"WHERE record_id IN (SELECT record_id FROM daily_infos WHERE {condition})"
+            for table, columns in _CUSTOMER_RECORD_CHILD_COLUMNS
+        )
+        return '; '.join(statements), params * len(statements)
     
     def get_record_by_customer_and_date(self, customer_id: int, date) -> Optional[Dict]:
         """Get a specific daily record for a customer and date."""
@@ -371,7 +883,7 @@ class DailyInfoRepository(BaseRepository):
             WHERE customer_id = %s AND date = %s
             LIMIT 1
         """
-        result = self._execute_query_one(query, (customer_id, date))
+        result = self._fast_one(query, (customer_id, date))
         return result['record_id'] if result else None
     
     def get_customers_with_records(self, start_date=None, end_date=None) -> List[Dict]:
@@ -397,139 +909,34 @@ class DailyInfoRepository(BaseRepository):
     
     def get_all_records_by_date_range(self, start_date, end_date) -> List[Dict]:
         """날짜 범위 내 모든 레코드 조회 (대상자 정보 포함)"""
-        query = """
-            SELECT 
-                c.customer_id, c.name as customer_name, c.birth_date as customer_birth_date,
-                c.grade as customer_grade, c.recognition_no as customer_recognition_no,
-                di.record_id, di.date, di.start_time, di.end_time,
-                di.total_service_time, di.transport_service, di.transport_vehicles,
-                dp.hygiene_care, dp.bath_time, dp.bath_method,
-                dp.meal_breakfast, dp.meal_lunch, dp.meal_dinner,
-                dp.toilet_care, dp.mobility_care, dp.note as physical_note, dp.writer_name as writer_phy,
-                dc.cog_support, dc.comm_support, dc.note as cognitive_note, dc.writer_name as writer_cog,
-                dn.bp_temp, dn.health_manage, dn.nursing_manage, dn.emergency,
-                dn.note as nursing_note, dn.writer_name as writer_nur,
-                dr.prog_basic, dr.prog_activity, dr.prog_cognitive, dr.prog_therapy,
-                dr.prog_enhance_detail, dr.note as functional_note, dr.writer_name as writer_func
-            FROM daily_infos di
-            INNER JOIN customers c ON di.customer_id = c.customer_id
-            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-            WHERE di.date BETWEEN %s AND %s
-            ORDER BY c.name, di.date DESC
-        """
-        return self._execute_query(query, (start_date, end_date))
+        return self._execute_query(_ALL_RECORDS_BY_DATE_RANGE_QUERY, (start_date, end_date))
     
-    # 트랜잭션 처리를 위한 비공개 헬퍼 메서드들
-    def _get_or_create_customer_in_transaction(self, cursor, record: Dict) -> int:
-        """Get or create customer within an existing transaction."""
-        name = record.get("customer_name")
-        cursor.execute("SELECT customer_id FROM customers WHERE name = %s", (name,))
-        result = cursor.fetchone()
-        
-        if result:
-            customer_id = result[0]
-            cursor.execute("""
-                UPDATE customers SET
-                    birth_date=%s, grade=%s, recognition_no=%s
-                WHERE customer_id=%s
-            """, (
-                record.get("customer_birth_date"),
-                record.get("customer_grade"),
-                record.get("customer_recognition_no"),
-                customer_id
-            ))
-            return customer_id
-        else:
-            cursor.execute("""
-                INSERT INTO customers (
-                    name, birth_date, grade, recognition_no
-                ) VALUES (%s, %s, %s, %s)
-            """, (
-                name,
-                record.get("customer_birth_date"),
-                record.get("customer_grade"),
-                record.get("customer_recognition_no")
-            ))
-            return cursor.lastrowid
+    def iter_all_records_by_date_range(self, start_date, end_date) -> Iterator[Dict]:
+        """날짜 범위 내 모든 레코드를 한 행씩 스트리밍 조회 (한 번만 순회하는 호출자용)"""
+        return self._execute_query_iter(_ALL_RECORDS_BY_DATE_RANGE_QUERY, (start_date, end_date))
     
+    # 트랜잭션 처리를 위한 비공개 헬퍼 메서드들
     def _delete_daily_record_in_transaction(self, cursor, record_id: int) -> None:
-        """Delete daily record within an existing transaction."""
-        cursor.execute("DELETE FROM daily_physicals WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_cognitives WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_nursings WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_recoveries WHERE record_id=%s", (record_id,))
-        cursor.execute("DELETE FROM daily_infos WHERE record_id=%s", (record_id,))
-    
-    def _insert_physicals_in_transaction(self, cursor, record_id: int, record: Dict) -> None:
-        """Insert physicals record within an existing transaction."""
-        cursor.execute("""
-            INSERT INTO daily_physicals (
-                record_id, hygiene_care, bath_time, bath_method,
-                meal_breakfast, meal_lunch, meal_dinner,
-                toilet_care, mobility_care, note, writer_name
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            record_id,
-            record.get("hygiene_care"),
-            record.get("bath_time"),
-            record.get("bath_method"),
-            record.get("meal_breakfast"),
-            record.get("meal_lunch"),
-            record.get("meal_dinner"),
-            record.get("toilet_care"),
-            record.get("mobility_care"),
-            record.get("physical_note"),
-            record.get("writer_phy")
-        ))
-    
-    def _insert_cognitives_in_transaction(self, cursor, record_id: int, record: Dict) -> None:
-        """Insert cognitives record within an existing transaction."""
-        cursor.execute("""
-            INSERT INTO daily_cognitives (
-                record_id, cog_support, comm_support, note, writer_name
-            ) VALUES (%s, %s, %s, %s, %s)
-        """, (
-            record_id,
-            record.get("cog_support"),
-            record.get("comm_support"),
-            record.get("cognitive_note"),
-            record.get("writer_cog")
-        ))
-    
-    def _insert_nursings_in_transaction(self, cursor, record_id: int, record: Dict) -> None:
-        """Insert nursings record within an existing transaction."""
-        cursor.execute("""
-            INSERT INTO daily_nursings (
-                record_id, bp_temp, health_manage, nursing_manage,
-                emergency, note, writer_name
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """, (
-            record_id,
-            record.get("bp_temp"),
-            record.get("health_manage"),
-            record.get("nursing_manage"),
-            record.get("emergency"),
-            record.get("nursing_note"),
-            record.get("writer_nur")
-        ))
-    
-    def _insert_recoveries_in_transaction(self, cursor, record_id: int, record: Dict) -> None:
-        """Insert recoveries record within an existing transaction."""
-        cursor.execute("""
-            INSERT INTO daily_recoveries (
-                record_id, prog_basic, prog_activity, prog_cognitive,
-                prog_therapy, prog_enhance_detail, note, writer_name
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            record_id,
-            record.get("prog_basic"),
-            record.get("prog_activity"),
-            record.get("prog_cognitive"),
-            record.get("prog_therapy"),
-            record.get("prog_enhance_detail"),
-            record.get("functional_note"),
-            record.get("writer_func")
-        ))
+        """Delete a daily record and its child rows within an existing transaction."""
+        self._bulk_delete_records(cursor, [record_id])
+    
+    def _bulk_delete_records(self, cursor, record_ids: List[int]) -> None:
+        """Delete daily records and their child rows within an existing transaction.
+        
+        기록 수와 무관하게 테이블당 DELETE ... IN 1문장씩, 5문장을 다중 문장 1회 실행으로 보냅니다.
+        """
+        if not record_ids:
+            return
+        
+        placeholders = ', '.join(['%s'] * len(record_ids))
+        # 의존성 순서대로 삭제
+        cursor.execute(
+            '; '.join(
+                f"DELETE FROM {table} WHERE record_id IN ({placeholders})"
+                for table in _DELETE_DAILY_RECORD_TABLES
+            ),
+            tuple(record_ids) * len(_DELETE_DAILY_RECORD_TABLES)
+        )
+        # 다중 문장 결과를 끝까지 읽어야 뒤 문장의 오류가 드러나고 연결에 미처리 결과가 남지 않음
+        for _ in cursor.fetchsets():
+            pass
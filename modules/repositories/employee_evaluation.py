@@ -1,6 +1,9 @@
 from typing import Dict, List, Optional
 from datetime import date
+from modules.db_connection import db_transaction
 from .base import BaseRepository
+from .user import _users_cache
+from modules.utils.memory_utils import BULK_INSERT_CHUNK_SIZE
 
 
 class EmployeeEvaluationRepository(BaseRepository):
@@ -47,6 +50,46 @@ class EmployeeEvaluationRepository(BaseRepository):
             )
         )
     
+    def save_evaluations_bulk(self, rows: List[Dict], chunk_size: int = None) -> List[int]:
+        """Save many employee evaluations with multi-row INSERTs and return their IDs in input order.
+        
+        트랜잭션 1개 안에서 청크별 INSERT 1문장으로 저장하고, 청크별 첫 ID(lastrowid)와
+        auto_increment_increment로 행 수만큼 ID를 계산합니다 (CustomerRepository.create_customers_bulk와 동일).
+        
+        Args:
+            rows: save_evaluation 인자 이름을 키로 가진 딕셔너리 목록
+                  (record_id, target_user_id, category, evaluation_type, evaluation_date 필수)
+            chunk_size: INSERT 1문장당 행 수 (None이면 BULK_INSERT_CHUNK_SIZE)
+        """
+        if not rows:
+            return []
+        
+        if chunk_size is None:
+            chunk_size = BULK_INSERT_CHUNK_SIZE
+        
+        emp_eval_ids = []
+        with db_transaction() as cursor:
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                placeholders = ', '.join(['(%s, %s, %s, %s, %s, %s, %s, %s, %s)'] * len(chunk))
+                params = []
+                for row in chunk:
+                    params.extend((
+                        row['record_id'], row.get('target_date'), row['target_user_id'],
+                        row.get('evaluator_user_id'), row['category'], row['evaluation_type'],
+                        row.get('score', 1), row.get('comment'), row['evaluation_date']
+                    ))
+                
+                cursor.execute(f"""
+                    INSERT INTO employee_evaluations (
+                        record_id, target_date, target_user_id, evaluator_user_id,
+                        category, evaluation_type, score, comment, evaluation_date
+                    ) VALUES {placeholders}
+                """, params)
+                emp_eval_ids.extend(self._inserted_ids(cursor, len(chunk)))
+        
+        return emp_eval_ids
+    
     def get_evaluations_by_record(self, record_id: int) -> List[Dict]:
         """Get all employee evaluations for a specific record."""
         query = """
@@ -66,13 +109,19 @@ class EmployeeEvaluationRepository(BaseRepository):
     def get_user_id_by_name(self, name: str) -> Optional[int]:
         """Get user ID by name."""
         query = "SELECT user_id FROM users WHERE name = %s LIMIT 1"
-        result = self._execute_query_one(query, (name,))
+        result = self._fast_one(query, (name,))
         return result['user_id'] if result else None
     
     def get_all_users(self) -> List[Dict]:
         """Get all users for dropdown selection."""
+        cached = _users_cache.get(("all",))
+        if cached is not None:
+            return [dict(row) for row in cached]
+        
         query = "SELECT user_id, name FROM users ORDER BY name"
-        return self._execute_query(query, ())
+        users = self._execute_query(query, ())
+        _users_cache.set(("all",), [dict(row) for row in users])
+        return users
     
     def delete_evaluation(self, emp_eval_id: int) -> int:
         """Delete an employee evaluation by ID."""
@@ -93,9 +142,46 @@ class EmployeeEvaluationRepository(BaseRepository):
               AND category = %s AND evaluation_type = %s
             LIMIT 1
         """
-        result = self._execute_query_one(query, (record_id, target_user_id, category, evaluation_type))
+        result = self._fast_one(query, (record_id, target_user_id, category, evaluation_type))
         return result['emp_eval_id'] if result else None
     
+    def update_existing_evaluation(
+        self,
+        record_id: int,
+        target_user_id: int,
+        category: str,
+        evaluation_type: str,
+        evaluation_date: date,
+        target_date: date = None,
+        evaluator_user_id: int = None,
+        score: int = 1,
+        comment: str = None
+    ) -> Optional[int]:
+        """Update the evaluation matching find_existing_evaluation in one statement and return its ID.
+        
+        조회(find_existing_evaluation) 후 수정(update_evaluation)하던 2회 왕복을 UPDATE 1문장으로 합칩니다.
+        LAST_INSERT_ID(emp_eval_id)로 수정한 행의 ID를 응답(lastrowid)에 실어 받으므로,
+        값이 바뀌지 않았어도 일치한 평가가 있으면 ID를 반환하고 없으면 None을 반환합니다.
+        """
+        update_query = '''
+            UPDATE employee_evaluations SET
+                target_date = %s,
+                evaluator_user_id = %s,
+                score = %s,
+                comment = %s,
+                evaluation_date = %s,
+                emp_eval_id = LAST_INSERT_ID(emp_eval_id)
+            WHERE record_id = %s AND target_user_id = %s
+              AND category = %s AND evaluation_type = %s
+            LIMIT 1
+        '''
+        with db_transaction() as cursor:
+            cursor.execute(update_query, (
+                target_date, evaluator_user_id, score, comment, evaluation_date,
+                record_id, target_user_id, category, evaluation_type,
+            ))
+            return cursor.lastrowid or None
+    
     def update_evaluation(
         self,
         emp_eval_id: int,
@@ -1,11 +1,22 @@
 from typing import List, Optional, Dict, Any
 from .base import BaseRepository
+from modules.utils.cache_utils import TTLCache
+from modules.utils.memory_utils import REFERENCE_CACHE_TTL
+
+# 직원 목록 조회 캐시 (프로세스 전역, 드롭다운/목록용 - 변경이 드묾)
+# 키: ("list", keyword, work_status) / ("all",) (EmployeeEvaluationRepository.get_all_users)
+_users_cache = TTLCache(maxsize=32, ttl=REFERENCE_CACHE_TTL)
 
 
 class UserRepository(BaseRepository):
     """Repository for user (employee) CRUD operations."""
 
     def list_users(self, keyword: str = None, work_status: str = None) -> List[Dict[str, Any]]:
+        cache_key = ("list", keyword, work_status)
+        cached = _users_cache.get(cache_key)
+        if cached is not None:
+            return [dict(row) for row in cached]
+
         query = """
             SELECT
                 user_id,
@@ -34,7 +45,9 @@ class UserRepository(BaseRepository):
             params.append(work_status)
 
         query += " ORDER BY name"
-        return self._execute_query(query, tuple(params))
+        users = self._execute_query(query, tuple(params))
+        _users_cache.set(cache_key, [dict(row) for row in users])
+        return users
 
     def create_user(
         self,
@@ -58,7 +71,7 @@ class UserRepository(BaseRepository):
                 license_name, license_date
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
-        return self._execute_transaction_lastrowid(
+        user_id = self._execute_transaction_lastrowid(
             query,
             (
                 username,
@@ -75,6 +88,8 @@ class UserRepository(BaseRepository):
                 license_date,
             ),
         )
+        _users_cache.clear()
+        return user_id
 
     def update_user(
         self,
@@ -103,7 +118,7 @@ class UserRepository(BaseRepository):
                 updated_at = CURRENT_TIMESTAMP
             WHERE user_id = %s
         """
-        return self._execute_transaction(
+        affected = self._execute_transaction(
             query,
             (
                 name,
@@ -118,6 +133,8 @@ class UserRepository(BaseRepository):
                 user_id,
             ),
         )
+        _users_cache.clear()
+        return affected
 
     def soft_delete_user(self, user_id: int) -> int:
         """퇴사 처리 (실제 삭제 대신 상태 변경)."""
@@ -128,7 +145,9 @@ class UserRepository(BaseRepository):
                 updated_at = CURRENT_TIMESTAMP
             WHERE user_id = %s
         """
-        return self._execute_transaction(query, (user_id,))
+        affected = self._execute_transaction(query, (user_id,))
+        _users_cache.clear()
+        return affected
 
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         query = """
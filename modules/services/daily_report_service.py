@@ -1,13 +1,120 @@
 """AI 평가 서비스 - 일일 기록 평가 비즈니스 로직"""
 
+import asyncio
+import bisect
+import copy
+import hashlib
 import json
+import logging
 import re
-from typing import Dict, Optional, Any, List
-from modules.clients.daily_prompt import get_special_note_prompt
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Any, List
+from modules.clients.daily_prompt import get_special_note_prompt, get_special_note_batch_prompt
 from modules.repositories import AiEvaluationRepository
 from modules.repositories.base import BaseRepository
-from modules.clients.ai_client import get_ai_client
-import numpy as np
+from modules.clients.ai_client import AsyncRateLimiter, get_ai_client
+from modules.utils.cache_utils import TTLCache, cached_per_request, invalidate_request_cache
+from modules.utils.memory_utils import (
+    AI_RESULT_CACHE_MAX_ENTRIES, AI_RESULT_CACHE_TTL, BATCH_SIZE_SMALL, BULK_INSERT_CHUNK_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+# 평균 점수 등급 구간: 75 미만 개선, 75 이상 평균, 90 이상 우수
+_GRADE_THRESHOLDS = (75, 90)
+_GRADES = ('개선', '평균', '우수')
+
+# O/X 평가의 O 개수별 (점수, 등급): 3개 우수, 2개 평균, 그 외 개선
+_OX_SCORES = ((1, '개선'), (1, '개선'), (2, '평균'), (3, '우수'))
+
+# 특이사항 카테고리 코드 → ai_evaluations.category 값
+_CATEGORY_MAP = MappingProxyType({
+    "SPECIAL_NOTE_PHYSICAL": "신체",
+    "SPECIAL_NOTE_COGNITIVE": "인지"
+})
+
+# 평가할 특이사항이 없을 때의 기본 평가 결과 (읽기 전용 템플릿)
+_EMPTY_EVALUATION = MappingProxyType({
+    'oer_fidelity': 'X',
+    'specificity': 'X',
+    'grammar': 'X',
+    'grade_code': '평가없음',
+    'reasoning_process': '',
+    'suggestion_text': ''
+})
+
+_SPECIAL_NOTE_MODEL = 'gemini-3-flash-preview'
+
+# 동시에 진행하는 AI 호출(배치) 수 상한
+_AI_MAX_CONCURRENCY = 10
+
+# 평가용 기록 조회: 기록 기본 정보 + 고객명 + 영역별 특이사항
+_EVALUATION_RECORD_SELECT = '''
+            SELECT di.*, c.name as customer_name,
+                   dp.note as physical_note, dc.note as cognitive_note,
+                   dn.note as nursing_note, dr.note as functional_note
+            FROM daily_infos di
+            LEFT JOIN customers c ON di.customer_id = c.customer_id
+            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
+            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
+            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
+            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
+'''
+
+_EVALUATION_RECORD_QUERY = _EVALUATION_RECORD_SELECT + "            WHERE di.record_id = %s\n"
+
+# 여러 기록 일괄 조회 (placeholders만 기록 수에 따라 달라짐)
+_EVALUATION_RECORDS_QUERY = _EVALUATION_RECORD_SELECT + "            WHERE di.record_id IN ({placeholders})\n"
+
+# 평가할 내용이 없는 상투 문구 (공백 제거 후 비교) - AI 호출 없이 평가 대상에서 제외
+_SKIP_NOTE_TEXTS = frozenset({'', '특이사항없음', '해당없음', '없음', '결석'})
+
+
+def is_skippable_note(text: Optional[str]) -> bool:
+    """특이사항이 비어 있거나 평가할 필요 없는 상투 문구인지 확인"""
+    return not text or ''.join(text.split()) in _SKIP_NOTE_TEXTS
+
+
+def _has_evaluable_notes(record: dict) -> bool:
+    """신체/인지 특이사항 중 AI 평가가 필요한 내용이 있는지 확인"""
+    return not (is_skippable_note(record.get('physical_note')) and is_skippable_note(record.get('cognitive_note')))
+
+
+# 특이사항 AI 평가 결과 캐시 (키: 이름/날짜를 뺀 프롬프트 해시)
+# 입력 데이터와 특이사항이 같은 기록은 AI를 다시 호출하지 않음
+_special_note_cache = TTLCache(maxsize=AI_RESULT_CACHE_MAX_ENTRIES, ttl=AI_RESULT_CACHE_TTL)
+
+
+def _special_note_cache_key(record: dict) -> str:
+    """기록의 평가 입력(프롬프트)을 정규화한 해시 키"""
+    normalized = {
+        **record,
+        'customer_name': '',
+        'date': '',
+        'physical_note': (record.get('physical_note') or '').strip(),
+        'cognitive_note': (record.get('cognitive_note') or '').strip()
+    }
+    _, user_prompt = get_special_note_prompt(normalized)
+    return hashlib.blake2b(user_prompt.encode(), digest_size=16).hexdigest()
+
+
+# 일반적인 프로그램명 패턴 (모듈 로드 시 한 번만 컴파일, 겹치는 이름도 모두 추출하도록 패턴별로 검색)
+_PROGRAM_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'[가-힣]+교실',
+    r'[가-힣]+훈련',
+    r'[가-힣]+프로그램',
+    r'[가-힣]+활동',
+    r'[가-힣]+체조',
+    r'[가-힣]+노래자랑',
+    r'[가-힣]+워크북',
+    r'[가-힣]+관리',
+    r'재난상황\s*대응훈련',
+    r'두뇌튼튼교실',
+    r'보은노래자랑',
+    r'힘뇌체조',
+    r'미니골프',
+    r'인지활동형프로그램'
+))
 
 
 class EvaluationService:
@@ -29,26 +136,13 @@ class EvaluationService:
         if not evaluation:
             return evaluation
         
-        # O 개수 세기
-        o_count = 0
-        for metric in ['oer_fidelity', 'specificity', 'grammar']:
-            if evaluation.get(metric) == 'O':
-                o_count += 1
-        
-        # 점수와 등급 결정
-        if o_count == 3:
-            score = 3
-            grade = '우수'
-        elif o_count == 2:
-            score = 2
-            grade = '평균'
-        else:
-            score = 1
-            grade = '개선'
-        
-        # 점수와 등급 추가
-        evaluation['score'] = score
-        evaluation['grade'] = grade
+        # O 개수(0~3)로 (점수, 등급) 표 조회
+        o_count = (
+            (evaluation.get('oer_fidelity') == 'O')
+            + (evaluation.get('specificity') == 'O')
+            + (evaluation.get('grammar') == 'O')
+        )
+        evaluation['score'], evaluation['grade'] = _OX_SCORES[o_count]
         
         return evaluation
     
@@ -60,13 +154,40 @@ class EvaluationService:
             record_id: 일일 기록 ID
             evaluation_result: AI 평가 결과
         """
+        self.save_special_note_evaluations_bulk([(record_id, evaluation_result)])
+    
+    def save_special_note_evaluations_bulk(self, items: List[tuple]) -> None:
+        """여러 기록의 특이사항 평가 결과를 다중 행 upsert 1회(트랜잭션 1개)로 저장
+        
+        Args:
+            items: (record_id, evaluation_result) 튜플 목록
+        """
+        rows = [
+            row
+            for record_id, evaluation_result in items
+            for row in self._special_note_rows(record_id, evaluation_result)
+        ]
+        self.ai_eval_repo.save_evaluations_bulk(rows)
+        self._invalidate_cache()
+    
+    def _invalidate_cache(self) -> None:
+        """평가 저장 후 요청 범위에 캐시된 record_id/평가 조회 결과 제거"""
+        invalidate_request_cache(type(self))
+    
+    def _special_note_rows(self, record_id: int, evaluation_result: dict) -> List[tuple]:
+        """특이사항 평가 결과를 저장 행(ai_eval_repo.save_evaluation 인자 순서) 목록으로 변환
+        
+        원본 특이사항이 비어 있거나 상투 문구('결석' 등)인 카테고리는 평가 행을 만들지 않습니다.
+        """
         if not evaluation_result:
-            return
-            
-        # 신체활동 특이사항 저장
-        if 'original_physical' in evaluation_result:
+            return []
+        
+        rows = []
+        # 신체활동 특이사항
+        if ('original_physical' in evaluation_result
+                and not is_skippable_note(evaluation_result.get('physical_note'))):
             physical = evaluation_result['original_physical']
-            self._save_evaluation_to_db(
+            rows.append((
                 record_id, 'SPECIAL_NOTE_PHYSICAL',
                 physical.get('oer_fidelity', 'X'),
                 physical.get('specificity', 'X'),
@@ -75,12 +196,13 @@ class EvaluationService:
                 evaluation_result.get('physical_note', ''),
                 None,  # reason_text
                 evaluation_result.get('physical', {}).get('corrected_note', '')
-            )
+            ))
         
-        # 인지관리 특이사항 저장
-        if 'original_cognitive' in evaluation_result:
+        # 인지관리 특이사항
+        if ('original_cognitive' in evaluation_result
+                and not is_skippable_note(evaluation_result.get('cognitive_note'))):
             cognitive = evaluation_result['original_cognitive']
-            self._save_evaluation_to_db(
+            rows.append((
                 record_id, 'SPECIAL_NOTE_COGNITIVE',
                 cognitive.get('oer_fidelity', 'X'),
                 cognitive.get('specificity', 'X'),
@@ -89,64 +211,13 @@ class EvaluationService:
                 evaluation_result.get('cognitive_note', ''),
                 None,  # reason_text
                 evaluation_result.get('cognitive', {}).get('corrected_note', '')
-            )
-    
-    def _save_evaluation_to_db(self, record_id: int, category: str,
-                              oer_fidelity: str, specificity: str, grammar: str,
-                              grade: str, original_text: str, reason_text: str,
-                              suggestion_text: str) -> None:
-        """개별 평가 결과를 DB에 저장"""
-        # 카테고리 매핑
-        category_map = {
-            "SPECIAL_NOTE_PHYSICAL": "신체",
-            "SPECIAL_NOTE_COGNITIVE": "인지"
-        }
-        korean_category = category_map.get(category, category)
-        
-        # 기존 평가 확인
-        check_query = 'SELECT ai_eval_id FROM ai_evaluations WHERE record_id = %s AND category = %s'
-        existing = self.db_repo._execute_query_one(check_query, (record_id, korean_category))
-        
-        if existing:
-            # 업데이트
-            update_query = '''
-                UPDATE ai_evaluations SET
-                    oer_fidelity = %s,
-                    specificity_score = %s,
-                    grammar_score = %s,
-                    grade_code = %s,
-                    reason_text = %s,
-                    suggestion_text = %s,
-                    original_text = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE record_id = %s AND category = %s
-            '''
-            self.db_repo._execute_transaction(update_query, (
-                oer_fidelity, specificity, grammar, grade,
-                reason_text, suggestion_text, original_text,
-                record_id, korean_category
-            ))
-        else:
-            # 삽입
-            insert_query = '''
-                INSERT INTO ai_evaluations (
-                    record_id, category, oer_fidelity, specificity_score, grammar_score,
-                    grade_code, reason_text, suggestion_text, original_text,
-                    created_at, updated_at
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
-                )
-            '''
-            self.db_repo._execute_transaction(insert_query, (
-                record_id, korean_category, oer_fidelity, specificity,
-                grammar, grade, reason_text, suggestion_text, original_text
             ))
+        
+        return rows
     
+    @cached_per_request
     def get_record_id(self, customer_name: str, date: str) -> Optional[int]:
         """고객명과 날짜로 record_id 조회"""
-        print(f"DEBUG: get_record_id 호출 - customer_name={customer_name}, date={date}")
-        
         query = '''
             SELECT di.record_id 
             FROM daily_infos di
@@ -154,14 +225,11 @@ class EvaluationService:
             WHERE c.name = %s AND di.date = %s
         '''
         result = self.db_repo._execute_query_one(query, (customer_name, date))
-        
-        if result:
-            print(f"DEBUG: record_id 조회 성공 - {result['record_id']}")
-        else:
-            print(f"DEBUG: record_id 조회 실패 - 결과 없음")
-            
+        if not result:
+            logger.debug("record_id 조회 실패 - customer_name=%s, date=%s", customer_name, date)
         return result['record_id'] if result else None
     
+    @cached_per_request
     def get_evaluation_from_db(self, record_id: int, category: str) -> Dict[str, str]:
         """DB에서 평가 결과(수정 제안과 등급) 조회
         
@@ -172,12 +240,7 @@ class EvaluationService:
         Returns:
             {'suggestion': str, 'grade': str} 형태의 딕셔너리
         """
-        # 카테고리 매핑
-        category_map = {
-            "SPECIAL_NOTE_PHYSICAL": "신체",
-            "SPECIAL_NOTE_COGNITIVE": "인지"
-        }
-        korean_category = category_map.get(category, category)
+        korean_category = _CATEGORY_MAP.get(category, category)
         
         query = '''
             SELECT suggestion_text, grade_code 
@@ -206,187 +269,218 @@ class EvaluationService:
         Returns:
             평가 결과 딕셔너리 또는 None
         """
-        physical_note = record.get('physical_note', '')
-        cognitive_note = record.get('cognitive_note', '')
-        
-        if not physical_note and not cognitive_note:
+        if not _has_evaluable_notes(record):
             return None
         
+        cache_key = _special_note_cache_key(record)
+        cached = _special_note_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
             ai_client = get_ai_client(provider='gemini')
         except Exception as e:
-            print(f'AI 클라이언트 초기화 오류: {e}')
+            logger.error('AI 클라이언트 초기화 오류: %s', e)
             return None
         
         system_prompt, user_prompt = get_special_note_prompt(record)
         
         try:
             response = ai_client.chat_completion(
-                model='gemini-3-flash-preview',
+                model=_SPECIAL_NOTE_MODEL,
                 messages=[
                     {'role': 'system', 'content': system_prompt},
                     {'role': 'user', 'content': user_prompt}
                 ],
-                temperature=0.7
+                temperature=0.7,
+                response_format={'type': 'json_object'}
             )
             
-            # JSON 응답 파싱
-            content = response.choices[0].message.content
-            # 코드 블록 제거
-            if content.startswith('```json'):
-                content = content[7:-3].strip()
-            elif content.startswith('```'):
-                content = content[3:-3].strip()
-            
-            result = json.loads(content)
-            
-            # AI 결과 디버그 출력
-            print("=" * 50)
-            print("DEBUG: AI 평가 결과")
-            print("=" * 50)
-            print("원본 신체활동 평가:", result.get("original_physical_evaluation", {}))
-            print("원본 인지관리 평가:", result.get("original_cognitive_evaluation", {}))
-            print("생성된 신체활동:", result["physical_candidates"][0])
-            print("생성된 인지관리:", result["cognitive_candidates"][0])
-            print("\n[O/X 평가 결과]")
-            print(f"원본 신체: OER={result.get('original_physical_evaluation', {}).get('oer_fidelity', '-')}, "
-                  f"구체성={result.get('original_physical_evaluation', {}).get('specificity', '-')}, "
-                  f"문법={result.get('original_physical_evaluation', {}).get('grammar', '-')}")
-            print(f"원본 인지: OER={result.get('original_cognitive_evaluation', {}).get('oer_fidelity', '-')}, "
-                  f"구체성={result.get('original_cognitive_evaluation', {}).get('specificity', '-')}, "
-                  f"문법={result.get('original_cognitive_evaluation', {}).get('grammar', '-')}")
-            print("=" * 50)
-            
-            # 3개 후보 중에서 첫 번째 선택 (날짜별 독립 처리)
-            result = {
-                "original_physical": result.get("original_physical_evaluation", {}),
-                "original_cognitive": result.get("original_cognitive_evaluation", {}),
-                "physical": result["physical_candidates"][0],
-                "cognitive": result["cognitive_candidates"][0]
-            }
+            # JSON 모드 응답이므로 코드 블록 없이 바로 파싱
+            result = json.loads(response.choices[0].message.content)
             
-            # O/X 평가 결과를 점수로 변환
-            result["original_physical"] = self._convert_ox_to_score(result["original_physical"])
-            result["original_cognitive"] = self._convert_ox_to_score(result["original_cognitive"])
-            result["physical"] = self._convert_ox_to_score(result["physical"])
-            result["cognitive"] = self._convert_ox_to_score(result["cognitive"])
+            # AI 결과 디버그 로그 (DEBUG 레벨이 아니면 포맷팅 비용 없음)
+            if logger.isEnabledFor(logging.DEBUG):
+                original_physical = result.get("original_physical_evaluation", {})
+                original_cognitive = result.get("original_cognitive_evaluation", {})
+                logger.debug(
+                    "AI 평가 결과 - 원본 신체: OER=%s, 구체성=%s, 문법=%s / 원본 인지: OER=%s, 구체성=%s, 문법=%s"
+                    " / 생성된 신체활동: %s / 생성된 인지관리: %s",
+                    original_physical.get('oer_fidelity', '-'), original_physical.get('specificity', '-'),
+                    original_physical.get('grammar', '-'), original_cognitive.get('oer_fidelity', '-'),
+                    original_cognitive.get('specificity', '-'), original_cognitive.get('grammar', '-'),
+                    result["physical_candidates"][0], result["cognitive_candidates"][0]
+                )
             
+            result = self._build_special_note_result(result)
+            _special_note_cache.set(cache_key, copy.deepcopy(result))
             return result
         except Exception as e:
-            print(f'특이사항 AI 평가 중 오류 발생: {e}')
+            logger.warning('특이사항 AI 평가 중 오류 발생: %s', e)
             return None
     
-    def _extract_programs_from_text(self, text: str) -> List[str]:
-        """텍스트에서 프로그램명을 추출"""
-        if not text:
-            return []
+    def _build_special_note_result(self, result: dict) -> Dict:
+        """AI 응답 1건을 평가 결과 형식으로 변환 (생성 기록 선택 + O/X 점수 변환)"""
+        # 프롬프트는 카테고리별로 기록 1개만 생성하도록 요청
+        return {
+            "original_physical": self._convert_ox_to_score(result.get("original_physical_evaluation", {})),
+            "original_cognitive": self._convert_ox_to_score(result.get("original_cognitive_evaluation", {})),
+            "physical": self._convert_ox_to_score(result["physical_candidates"][0]),
+            "cognitive": self._convert_ox_to_score(result["cognitive_candidates"][0])
+        }
+    
+    def _evaluate_special_notes_batch(self, records: List[dict]) -> Dict[int, Dict]:
+        """여러 기록의 특이사항을 AI 호출 1회로 평가 (캐시된 기록은 호출에서 제외)
         
-        # 일반적인 프로그램명 패턴
-        patterns = [
-            r'([가-힣]+교실)',
-            r'([가-힣]+훈련)',
-            r'([가-힣]+프로그램)',
-            r'([가-힣]+활동)',
-            r'([가-힣]+체조)',
-            r'([가-힣]+노래자랑)',
-            r'([가-힣]+워크북)',
-            r'([가-힣]+관리)',
-            r'재난상황\s*대응훈련',
-            r'두뇌튼튼교실',
-            r'보은노래자랑',
-            r'힘뇌체조',
-            r'미니골프',
-            r'인지활동형프로그램'
-        ]
+        Returns:
+            {record_id: 평가 결과} 딕셔너리 (응답이 잘못된 기록은 포함되지 않음)
+        """
+        results = {}
+        cache_keys = {}
+        uncached = []
+        for record in records:
+            cache_key = _special_note_cache_key(record)
+            cached = _special_note_cache.get(cache_key)
+            if cached is not None:
+                results[record['record_id']] = copy.deepcopy(cached)
+            else:
+                cache_keys[record['record_id']] = cache_key
+                uncached.append(record)
         
-        programs = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                if match and match not in programs:
-                    programs.append(match)
+        if not uncached:
+            return results
         
-        return programs
-    
-    def _select_most_unique_sentences(self, result: Dict, previous_sentences: List[str]) -> Dict:
-        """3개 후보 중에서 이전 문장들과 가장 유사도가 낮은 문장 선택"""
-        if not previous_sentences:
-            # 이전 문장이 없으면 첫 번째 후보 선택
-            return {
-                "physical": result["physical_candidates"][0],
-                "cognitive": result["cognitive_candidates"][0]
-            }
-
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-        except Exception:
-            # scikit-learn / scipy 네이티브 확장 로딩 실패(또는 미설치) 시 fallback
-            return {
-                "physical": result["physical_candidates"][0],
-                "cognitive": result["cognitive_candidates"][0]
-            }
-        
-        # TF-IDF 벡터라이저 초기화
-        vectorizer = TfidfVectorizer()
+            ai_client = get_ai_client(provider='gemini')
+        except Exception as e:
+            logger.error('AI 클라이언트 초기화 오류: %s', e)
+            return results
         
-        # physical 후보 중 가장 유사도 낮은 것 선택
-        physical_sentences = [candidate["corrected_note"] for candidate in result["physical_candidates"]]
-        physical_selected = self._find_least_similar(
-            physical_sentences, previous_sentences, vectorizer
-        )
+        system_prompt, user_prompt = get_special_note_batch_prompt(uncached)
         
-        # cognitive 후보 중 가장 유사도 낮은 것 선택
-        cognitive_sentences = [candidate["corrected_note"] for candidate in result["cognitive_candidates"]]
-        cognitive_selected = self._find_least_similar(
-            cognitive_sentences, previous_sentences, vectorizer
-        )
+        try:
+            response = ai_client.chat_completion(
+                model=_SPECIAL_NOTE_MODEL,
+                messages=[
+                    {'role': 'system', 'content': system_prompt},
+                    {'role': 'user', 'content': user_prompt}
+                ],
+                temperature=0.7,
+                response_format={'type': 'json_object'}
+            )
+            items = json.loads(response.choices[0].message.content)['results']
+        except Exception as e:
+            logger.warning('특이사항 배치 AI 평가 중 오류 발생: %s', e)
+            return results
+        
+        # 요청한 기록의 id만 인정 (형식이 잘못된 항목은 건너뛰어 단건 평가로 넘김)
+        for item in items:
+            try:
+                record_id = int(item['id'])
+                if record_id in cache_keys:
+                    result = self._build_special_note_result(item)
+                    _special_note_cache.set(cache_keys[record_id], copy.deepcopy(result))
+                    results[record_id] = result
+            except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+                continue
+        return results
+    
+    def _process_notes_batch(self, batch: List[dict]) -> Dict[int, Dict]:
+        """기록 1개 배치를 AI 호출 1회로 평가하고 한 번에 저장 (잘못된 응답은 단건 평가로 폴백)"""
+        batch_results = self._evaluate_special_notes_batch(batch)
+        
+        results = {}
+        items = []
+        for record in batch:
+            record_id = record['record_id']
+            result = batch_results.get(record_id)
+            if result is None:
+                result = self.evaluate_special_note_with_ai(record)
+            if not result:
+                continue
+            
+            result_with_notes = result.copy()
+            result_with_notes['physical_note'] = record.get('physical_note', '')
+            result_with_notes['cognitive_note'] = record.get('cognitive_note', '')
+            items.append((record_id, result_with_notes))
+            results[record_id] = result
+        
+        # 배치 전체 평가를 트랜잭션 1개로 저장
+        self.save_special_note_evaluations_bulk(items)
+        return results
+    
+    async def aevaluate_special_note_with_ai(self, record: dict) -> Optional[Dict]:
+        """evaluate_special_note_with_ai의 비동기 버전 (블로킹 AI 호출은 스레드에서 실행)"""
+        return await asyncio.to_thread(self.evaluate_special_note_with_ai, record)
+    
+    async def aprocess_many(self, records: List[dict], max_concurrency: int = _AI_MAX_CONCURRENCY,
+                            batch_size: int = BATCH_SIZE_SMALL,
+                            requests_per_minute: Optional[int] = None,
+                            on_progress: Optional[Callable[[int], None]] = None) -> Dict[int, Dict]:
+        """여러 기록의 특이사항을 배치로 나누어 동시에 평가하고 DB에 저장
         
-        # 선택된 후보의 원래 인덱스 찾기
-        physical_idx = physical_sentences.index(physical_selected)
-        cognitive_idx = cognitive_sentences.index(cognitive_selected)
+        Args:
+            records: record_id와 physical_note/cognitive_note가 포함된 기록 딕셔너리 목록
+            max_concurrency: 동시에 진행하는 배치 AI 호출 수
+            batch_size: AI 호출 1회당 기록 수
+            requests_per_minute: 배치 AI 호출의 분당 최대 횟수 (None이면 제한 없음)
+            on_progress: 배치가 끝날 때마다 처리한 기록 수로 호출되는 콜백 (이벤트 루프 스레드에서 실행)
+            
+        Returns:
+            {record_id: 평가 결과} 딕셔너리 (evaluate_special_note_with_ai 결과 형식)
+        """
+        pending = [
+            record for record in records
+            if record.get('record_id') and _has_evaluable_notes(record)
+        ]
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = AsyncRateLimiter(requests_per_minute) if requests_per_minute else None
+        
+        async def run(batch: List[dict]) -> tuple:
+            async with semaphore:
+                if limiter:
+                    await limiter.acquire()
+                try:
+                    return batch, await asyncio.to_thread(self._process_notes_batch, batch)
+                except Exception as e:
+                    logger.error('특이사항 배치 처리 중 오류 발생 (%d건): %s', len(batch), e)
+                    return batch, {}
+        
+        results = {}
+        for finished in asyncio.as_completed([run(batch) for batch in batches]):
+            batch, batch_results = await finished
+            results.update(batch_results)
+            if on_progress:
+                on_progress(len(batch))
+        
+        return results
+    
+    def process_daily_notes_batch(self, records: List[dict], batch_size: int = BATCH_SIZE_SMALL,
+                                  max_concurrency: int = _AI_MAX_CONCURRENCY,
+                                  on_progress: Optional[Callable[[int], None]] = None) -> Dict[int, Dict]:
+        """여러 기록의 특이사항을 batch_size건씩 묶어 평가하고 DB에 저장 (aprocess_many 동기 래퍼)
         
-        return {
-            "physical": result["physical_candidates"][physical_idx],
-            "cognitive": result["cognitive_candidates"][cognitive_idx]
-        }
+        배치 응답이 잘못되었거나 누락된 기록은 evaluate_special_note_with_ai로 단건 평가합니다.
+        """
+        return asyncio.run(self.aprocess_many(
+            records, max_concurrency=max_concurrency, batch_size=batch_size, on_progress=on_progress
+        ))
     
-    def _find_least_similar(self, candidates: List[str], references: List[str], 
-                           vectorizer: Any) -> str:
-        """후보 중에서 참조 문장들과 가장 유사도가 낮은 문장 찾기"""
-        if not references:
-            return candidates[0]
-
-        try:
-            from sklearn.metrics.pairwise import cosine_similarity
-        except Exception:
-            # scikit-learn / scipy 네이티브 확장 로딩 실패(또는 미설치) 시 fallback
-            return candidates[0]
-        
-        # 모든 문장 결합하여 TF-IDF 벡터 생성
-        all_sentences = candidates + references
-        tfidf_matrix = vectorizer.fit_transform(all_sentences)
-        
-        # 후보 문장들의 벡터 (첫 n개)
-        candidate_vectors = tfidf_matrix[:len(candidates)]
-        
-        # 참조 문장들의 벡터
-        reference_vectors = tfidf_matrix[len(candidates):]
-        
-        # 각 후보와 참조 문장들 간의 평균 유사도 계산
-        similarities = []
-        for i in range(len(candidates)):
-            candidate_vec = candidate_vectors[i]
-            # 참조 문장들과의 유사도 계산
-            sim_scores = cosine_similarity(candidate_vec, reference_vectors)[0]
-            # 평균 유사도
-            avg_similarity = np.mean(sim_scores)
-            similarities.append(avg_similarity)
-        
-        # 가장 유사도가 낮은 후보 선택
-        min_sim_idx = np.argmin(similarities)
-        return candidates[min_sim_idx]
+    def _extract_programs_from_text(self, text: str) -> List[str]:
+        """텍스트에서 프로그램명을 추출"""
+        if not text:
+            return []
+        
+        # 패턴 순서대로, 처음 나온 순서를 유지하며 중복 제거
+        programs = dict.fromkeys(
+            match
+            for pattern in _PROGRAM_PATTERNS
+            for match in pattern.findall(text)
+            if match
+        )
+        return list(programs)
     
     def calculate_grade(self, evaluation_result: Dict) -> str:
         """평가 결과로부터 등급 계산
@@ -406,12 +500,7 @@ class EvaluationService:
         
         average_score = (consistency_score + grammar_score + specificity_score) / 3
         
-        if average_score >= 90:
-            return '우수'
-        elif average_score >= 75:
-            return '평균'
-        else:
-            return '개선'
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, average_score)]
     
     def create_empty_evaluation(self) -> Dict:
         """빈 평가 결과 생성
@@ -419,14 +508,7 @@ class EvaluationService:
         Returns:
             기본값이 설정된 빈 평가 결과 딕셔너리
         """
-        return {
-            'oer_fidelity': 'X',
-            'specificity': 'X',
-            'grammar': 'X',
-            'grade_code': '평가없음',
-            'reasoning_process': '',
-            'suggestion_text': ''
-        }
+        return dict(_EMPTY_EVALUATION)
     
     def save_ai_evaluation(self, record_id: int, category: str, note_writer_user_id: int, 
                           evaluation_result: Dict, original_text: str = None) -> None:
@@ -439,6 +521,26 @@ class EvaluationService:
             evaluation_result: 평가 결과
             original_text: 원본 텍스트
         """
+        self.ai_eval_repo.save_evaluation(*self._evaluation_row(record_id, category, evaluation_result, original_text))
+        self._invalidate_cache()
+    
+    def save_ai_evaluations_bulk(self, payloads: List[tuple]) -> None:
+        """여러 AI 평가 결과를 트랜잭션 1개로 저장
+        
+        Args:
+            payloads: save_ai_evaluation 인자 순서의 튜플 목록
+                      (record_id, category, note_writer_user_id, evaluation_result, original_text)
+        """
+        self.ai_eval_repo.save_evaluations_bulk([
+            self._evaluation_row(record_id, category, evaluation_result, original_text)
+            for record_id, category, _, evaluation_result, original_text in payloads
+        ])
+        self._invalidate_cache()
+    
+    @staticmethod
+    def _evaluation_row(record_id: int, category: str, evaluation_result: Optional[Dict],
+                        original_text: Optional[str]) -> tuple:
+        """평가 결과를 저장 행(ai_eval_repo.save_evaluation 인자 순서)으로 변환"""
         # evaluation_result에서 점수 정보 추출
         if evaluation_result:
             oer_fidelity = evaluation_result.get('oer_fidelity', 'X')
@@ -457,14 +559,16 @@ class EvaluationService:
             reason_text = ''
             suggestion_text = ''
         
-        self.ai_eval_repo.save_evaluation(
+        return (
             record_id, category, oer_fidelity, specificity_score, grammar_score,
             grade_code, original_text or '', reason_text, suggestion_text
         )
     
     def process_daily_note_evaluation(self, record_id: int, category: str, note_text: str, 
                                     note_writer_user_id: int, writer: str = '', 
-                                    customer_name: str = '', date: str = '') -> Dict[str, Any]:
+                                    customer_name: str = '', date: str = '',
+                                    pending_saves: Optional[List[tuple]] = None,
+                                    record: Optional[dict] = None) -> Dict[str, Any]:
         """일일 기록 평가 처리
         
         Args:
@@ -475,31 +579,24 @@ class EvaluationService:
             writer: 작성자
             customer_name: 고객명
             date: 날짜
+            pending_saves: 지정하면 즉시 저장하지 않고 save_ai_evaluation 인자 튜플을 추가
+                           (호출자가 배치 끝에 save_ai_evaluations_bulk로 한 번에 저장)
+            record: _EVALUATION_RECORD_SELECT로 미리 조회한 기록 (None이면 record_id로 조회,
+                    빈 딕셔너리는 없는 기록으로 처리)
             
         Returns:
             평가 결과 딕셔너리
         """
-        if not note_text or note_text.strip() in ['특이사항 없음', '결석', '']:
+        if is_skippable_note(note_text):
             # 빈 텍스트는 평가하지 않음
             return {
                 'grade_code': '평가없음',
                 'evaluation': None
             }
         
-        # DB에서 record 정보 가져오기
-        query = '''
-            SELECT di.*, c.name as customer_name,
-                   dp.note as physical_note, dc.note as cognitive_note,
-                   dn.note as nursing_note, dr.note as functional_note
-            FROM daily_infos di
-            LEFT JOIN customers c ON di.customer_id = c.customer_id
-            LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
-            LEFT JOIN daily_cognitives dc ON dc.record_id = di.record_id
-            LEFT JOIN daily_nursings dn ON dn.record_id = di.record_id
-            LEFT JOIN daily_recoveries dr ON dr.record_id = di.record_id
-            WHERE di.record_id = %s
-        '''
-        record = self.db_repo._execute_query_one(query, (record_id,))
+        # DB에서 record 정보 가져오기 (미리 조회한 기록이 있으면 재사용)
+        if record is None:
+            record = self.db_repo._execute_query_one(_EVALUATION_RECORD_QUERY, (record_id,))
         
         if not record:
             # record가 없으면 평가하지 않음
@@ -529,7 +626,8 @@ class EvaluationService:
                 evaluation_result['corrected_note'] = corrected_note
             else:
                 korean_grade = '평가없음'
-                evaluation_result = self.create_empty_evaluation()
+                # 저장용으로만 읽으므로 복사 없이 템플릿을 그대로 사용
+                evaluation_result = _EMPTY_EVALUATION
         else:
             # NURSING, RECOVERY는 기본 평가
             korean_grade = '평균'
@@ -541,13 +639,47 @@ class EvaluationService:
                 'grade_code': '평균'
             }
         
-        self.save_ai_evaluation(record_id, category, note_writer_user_id, evaluation_result, note_text)
+        if pending_saves is not None:
+            pending_saves.append((record_id, category, note_writer_user_id, evaluation_result, note_text))
+        else:
+            self.save_ai_evaluation(record_id, category, note_writer_user_id, evaluation_result, note_text)
         
         return {
             'grade_code': korean_grade,
             'evaluation': evaluation_result
         }
 
+    
+    def process_daily_note_evaluations_bulk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 일일 기록 평가를 기록 조회 1회, 저장 1회로 처리
+        
+        Args:
+            items: process_daily_note_evaluation 인자 이름을 키로 가진 딕셔너리 목록
+                   (record_id, category, note_text, note_writer_user_id 필수)
+            
+        Returns:
+            items 순서의 평가 결과 딕셔너리 목록
+        """
+        record_ids = list(dict.fromkeys(item['record_id'] for item in items))
+        records = {}
+        for i in range(0, len(record_ids), BULK_INSERT_CHUNK_SIZE):
+            chunk = record_ids[i:i + BULK_INSERT_CHUNK_SIZE]
+            rows = self.db_repo._execute_query(
+                _EVALUATION_RECORDS_QUERY.format(placeholders=', '.join(['%s'] * len(chunk))),
+                tuple(chunk)
+            )
+            records.update((row['record_id'], row) for row in rows)
+        
+        pending_saves = []
+        results = [
+            self.process_daily_note_evaluation(
+                **item, pending_saves=pending_saves, record=records.get(item['record_id'], {})
+            )
+            for item in items
+        ]
+        self.save_ai_evaluations_bulk(pending_saves)
+        return results
+
 
 # 서비스 인스턴스 생성
 evaluation_service = EvaluationService()
@@ -1,10 +1,14 @@
 """주간 보고서 서비스 - 주간 상태변화 기록지 생성 비즈니스 로직"""
 
-from typing import Dict, Tuple, Any, Optional
+import re
+from typing import Dict, List, Tuple, Any, Optional
 from datetime import date
 from modules.clients.weekly_prompt import WEEKLY_WRITER_SYSTEM_PROMPT, WEEKLY_WRITER_USER_TEMPLATE
 from modules.clients.ai_client import get_ai_client
 
+# 부호/천 단위 구분자가 있는 숫자 + 선택적 단위(회분, 회)
+_NUMBER_WITH_UNIT_RE = re.compile(r'^([+-]?[\d,.]+)\s*(?:회분|회)?$')
+
 
 class ReportService:
     """주간 보고서 서비스 클래스"""
@@ -63,13 +67,11 @@ class ReportService:
                 return None
             if isinstance(value, (int, float)):
                 return float(value)
-            text = str(value).strip()
-            for suffix in ("회분", "회"):
-                if text.endswith(suffix):
-                    text = text[: -len(suffix)].strip()
-            text = text.replace(",", "")
+            match = _NUMBER_WITH_UNIT_RE.match(str(value).strip())
+            if not match:
+                return None
             try:
-                return float(text)
+                return float(match.group(1).replace(",", ""))
             except ValueError:
                 return None
         
@@ -83,8 +85,10 @@ class ReportService:
                 return "감소"
             return "유지"
         
-        def _pick_line(text: str, index: int) -> str:
-            lines = [line.strip() for line in (text or "").splitlines() if line.strip()]
+        def _split_lines(text: str) -> List[str]:
+            return [stripped for stripped in (line.strip() for line in (text or "").splitlines()) if stripped]
+        
+        def _pick_line(lines: List[str], index: int) -> str:
             if not lines:
                 return "없음"
             if 0 <= index < len(lines):
@@ -94,8 +98,9 @@ class ReportService:
         def _compose_oer(text: str, fallback: str) -> Tuple[str, str, str]:
             if not text or str(text).strip() in ("", "없음", "-"):
                 return fallback, "없음", "없음"
-            clean = str(text).strip()
-            return _pick_line(clean, 0), _pick_line(clean, 1), _pick_line(clean, 2)
+            # 한 번만 줄 단위로 나눠 세 위치에서 재사용
+            lines = _split_lines(str(text))
+            return _pick_line(lines, 0), _pick_line(lines, 1), _pick_line(lines, 2)
         
         def _notes_trend(prev_text: str, curr_text: str) -> str:
             prev_clean = (prev_text or "").strip()
@@ -137,7 +142,7 @@ class ReportService:
             physical_curr,
             _build_physical_change_observation(meal_trend, toilet_trend),
         )
-        physical_bridge = _pick_line(physical_prev, 0)
+        physical_bridge = _pick_line(_split_lines(physical_prev), 0)
         
         cognitive_observation, cognitive_evidence, _ = _compose_oer(
             cognitive_curr,
@@ -14,7 +14,7 @@ import streamlit as st
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from modules.pdf_parser import CareRecordParser
-from modules.database import save_parsed_data, get_customers_with_records, get_all_records_by_date_range
+from modules.database import save_parsed_data, get_customers_with_records, iter_all_records_by_date_range
 from modules.ui.ui_helpers import (
     get_active_doc, get_person_keys_for_doc, iter_person_entries, 
     ensure_active_person, person_checkbox_key, select_person,
@@ -376,15 +376,14 @@ def _render_person_date_filter(entry):
 
 def _execute_person_db_search(entry, start_date, end_date):
     """특정 대상자의 DB 데이터 조회"""
-    from modules.database import get_all_records_by_date_range
-    
     person_name = entry.get('person_name')
     
     try:
-        records = get_all_records_by_date_range(start_date, end_date)
-        
-        # 해당 대상자의 레코드만 필터링
-        person_records = [r for r in records if r.get('customer_name') == person_name]
+        # 전체 결과를 메모리에 올리지 않고 스트리밍하면서 해당 대상자의 레코드만 필터링
+        person_records = [
+            r for r in iter_all_records_by_date_range(start_date, end_date)
+            if r.get('customer_name') == person_name
+        ]
         
         if person_records:
             db_doc_id = f"db_person_{person_name}_{start_date}_{end_date}"
@@ -536,14 +535,12 @@ def _batch_evaluate_all(person_entries):
                     
                 customer_id = customer_result["customer_id"]
                 
-                # Get records for this customer
+                # Get records for this customer (AI 프롬프트에 필요한 기록 전체 컬럼 포함)
                 cursor.execute(
                     """
-                    SELECT di.record_id, c.name as customer_name, di.date, 
-                           dp.note as physical_note, dc.note as cognitive_note, 
-                           dn.note as nursing_note, dr.note as functional_note,
-                           dp.writer_name as writer_physical, dc.writer_name as writer_cognitive, 
-                           dn.writer_name as writer_nursing, dr.writer_name as writer_recovery
+                    SELECT di.*, c.name as customer_name,
+                           dp.note as physical_note, dc.note as cognitive_note,
+                           dn.note as nursing_note, dr.note as functional_note
                     FROM daily_infos di
                     LEFT JOIN customers c ON di.customer_id = c.customer_id
                     LEFT JOIN daily_physicals dp ON dp.record_id = di.record_id
@@ -555,47 +552,11 @@ def _batch_evaluate_all(person_entries):
                     """,
                     (customer_id,)
                 )
-                
-                records = []
-                for row in cursor.fetchall():
-                    records.append({
-                        "record_id": row["record_id"],
-                        "customer_name": row["customer_name"],
-                        "date": row["date"],
-                        "physical_note": row["physical_note"],
-                        "cognitive_note": row["cognitive_note"],
-                        "nursing_note": row["nursing_note"],
-                        "functional_note": row["functional_note"],
-                        "writer_physical": row["writer_physical"],
-                        "writer_cognitive": row["writer_cognitive"],
-                        "writer_nursing": row["writer_nursing"],
-                        "writer_recovery": row["writer_recovery"]
-                    })
+                records = cursor.fetchall()
             
-            # Evaluate all records for this person using process_daily_note_evaluation
             # 특이사항 평가는 PHYSICAL과 COGNITIVE만 수행
-            for record in records:
-                categories = [
-                    ("PHYSICAL", record.get("physical_note", ""), record.get("writer_physical")),
-                    ("COGNITIVE", record.get("cognitive_note", ""), record.get("writer_cognitive"))
-                ]
-                
-                for category, text, category_writer in categories:
-                    # 빈 텍스트는 건너뛰기
-                    if not text or text.strip() in ['특이사항 없음', '결석', '']:
-                        continue
-                    
-                    note_writer_id = record.get(f"writer_{category.lower()}_id", 1)
-                    
-                    evaluation_service.process_daily_note_evaluation(
-                        record_id=record["record_id"],
-                        category=category,
-                        note_text=text,
-                        note_writer_user_id=note_writer_id,
-                        writer=category_writer or "",
-                        customer_name=record.get("customer_name", ""),
-                        date=record.get("date", "")
-                    )
+            # 기록 여러 건을 AI 호출 1번으로 묶어 평가하고 배치마다 한 번에 저장
+            evaluation_service.process_daily_notes_batch(records)
             
         except Exception as e:
             st.error(f"{entry['person_name']} 평가 중 오류: {e}")
@@ -610,8 +571,8 @@ def _batch_evaluate_all(person_entries):
 def _batch_evaluate_all_optimized(person_entries):
     """성능 최적화된 전체 인원 특이사항 일괄 평가
     
-    탭의 빠른 로직과 동일하게 evaluate_special_note_with_ai를 사용하여
-    1번의 AI 호출로 신체/인지를 동시에 평가합니다.
+    process_daily_notes_batch로 여러 기록의 신체/인지 특이사항을
+    AI 호출 1번에 묶어 평가합니다.
     """
     if not person_entries:
         st.warning("처리할 인원이 없습니다.")
@@ -637,65 +598,40 @@ def _batch_evaluate_all_optimized(person_entries):
             date_str = r.get('date', '')
             record_id = evaluation_service.get_record_id(customer_name, date_str)
             
+            # DB에 없는 기록은 평가 결과를 저장할 수 없으므로 AI 호출 대상에서 제외
+            if not record_id:
+                continue
+            
             # DB에서 이미 신체/인지 평가가 모두 있는지 확인
-            if record_id:
-                phys_eval = evaluation_service.get_evaluation_from_db(record_id, 'SPECIAL_NOTE_PHYSICAL')
-                cogn_eval = evaluation_service.get_evaluation_from_db(record_id, 'SPECIAL_NOTE_COGNITIVE')
-                
-                # 이미 평가가 완료된 건은 제외
-                if phys_eval['grade'] != '평가없음' and cogn_eval['grade'] != '평가없음':
-                    continue
-                    
-            all_records.append(r)
+            phys_eval = evaluation_service.get_evaluation_from_db(record_id, 'SPECIAL_NOTE_PHYSICAL')
+            cogn_eval = evaluation_service.get_evaluation_from_db(record_id, 'SPECIAL_NOTE_COGNITIVE')
+            
+            # 이미 평가가 완료된 건은 제외
+            if phys_eval['grade'] != '평가없음' and cogn_eval['grade'] != '평가없음':
+                continue
+            
+            all_records.append({
+                **r,
+                'record_id': record_id,
+                'physical_note': r.get('physical_note', '').strip(),
+                'cognitive_note': r.get('cognitive_note', '').strip()
+            })
     
     if not all_records:
         st.success("모든 기록이 이미 평가되었거나 평가할 특이사항이 없습니다.")
         return
     
     total = len(all_records)
-    
-    # 병렬 처리를 위한 함수 정의 (탭과 동일한 로직)
-    def process_record(record):
-        date_str = record.get("date", "날짜 없음")
-        customer_name = record.get('customer_name', '')
-        physical_note = record.get("physical_note", "").strip()
-        cognitive_note = record.get("cognitive_note", "").strip()
-        
-        try:
-            print(f"DEBUG: Processing {customer_name} ({date_str})")
-            
-            # 1번의 AI 호출로 신체/인지 동시 평가
-            result = evaluation_service.evaluate_special_note_with_ai(record)
-            if result:
-                record_id = evaluation_service.get_record_id(customer_name, date_str)
-                if record_id:
-                    result_with_notes = result.copy()
-                    result_with_notes['physical_note'] = physical_note
-                    result_with_notes['cognitive_note'] = cognitive_note
-                    evaluation_service.save_special_note_evaluation(record_id, result_with_notes)
-            return True
-        except Exception as e:
-            print(f"Error processing {customer_name} ({date_str}): {str(e)}")
-            return False
-
-    max_workers = 4
     completed = 0
     
-    # UI 업데이트용 컨테이너
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_record = {executor.submit(process_record, rec): rec for rec in all_records}
-        for future in concurrent.futures.as_completed(future_to_record):
-            try:
-                future.result(timeout=40)
-            except concurrent.futures.TimeoutError:
-                print("DEBUG: Task timed out")
-            except Exception as e:
-                print(f"DEBUG: Task error: {e}")
-            
-            completed += 1
-            progress_bar.progress(completed / total)
-            status_text.text(f"⏳ 전체 인원 평가 진행 중... ({completed}/{total})")
+    # 기록 여러 건을 AI 호출 1번으로 묶고, 배치들은 동시에 진행 (진행률은 배치 완료 시 갱신)
+    def on_progress(count):
+        nonlocal completed
+        completed += count
+        progress_bar.progress(completed / total)
+        status_text.text(f"⏳ 전체 인원 평가 진행 중... ({completed}/{total})")
+    
+    evaluation_service.process_daily_notes_batch(all_records, on_progress=on_progress)
     
     st.success(f"총 {total}건의 특이사항 평가가 완료되었습니다.")
     st.toast("✅ 일괄 평가 완료!", icon="✅")
@@ -765,17 +701,15 @@ def _render_date_filter_section():
 def _execute_db_search(start_date, end_date):
     """DB에서 전체 데이터 조회 실행"""
     try:
-        records = get_all_records_by_date_range(start_date, end_date)
+        # DB 레코드를 스트리밍하면서 바로 parsed_data 형식으로 변환 (원본 행 목록을 따로 보관하지 않음)
+        parsed_records = _convert_db_records(iter_all_records_by_date_range(start_date, end_date))
         
-        if records:
+        if parsed_records:
             db_doc_id = f"db_{start_date}_{end_date}"
             
             # 기존 DB 문서가 있으면 제거
             st.session_state.docs = [d for d in st.session_state.docs if not d.get('id', '').startswith('db_')]
             
-            # DB 레코드를 parsed_data 형식으로 변환
-            parsed_records = _convert_db_records(records)
-            
             new_doc = {
                 "id": db_doc_id,
                 "name": f"DB 조회 ({start_date} ~ {end_date})",
@@ -696,28 +696,27 @@ def _render_employee_evaluation_form(person_records: list, person_name: str):
         elif not record_id:
             st.error("해당 기록의 record_id를 찾을 수 없습니다.")
         else:
-            # 기존 평가 조회
-            existing_id = emp_eval_repo.find_existing_evaluation(
-                record_id, target_user_id, selected_category, selected_eval_type
-            )
-            
-            if existing_id:
-                try:
-                    emp_eval_repo.update_evaluation(
-                        emp_eval_id=existing_id,
-                        evaluation_date=date.today(),
-                        target_date=target_date_input,
-                        evaluator_user_id=1,
-                        score=1,
-                        comment=comment if comment.strip() else None
-                    )
+            # 기존 평가 조회 + 수정 (UPDATE 1문장)
+            try:
+                updated_id = emp_eval_repo.update_existing_evaluation(
+                    record_id=record_id,
+                    target_user_id=target_user_id,
+                    category=selected_category,
+                    evaluation_type=selected_eval_type,
+                    evaluation_date=date.today(),
+                    target_date=target_date_input,
+                    evaluator_user_id=1,
+                    score=1,
+                    comment=comment if comment.strip() else None
+                )
+            except Exception as e:
+                st.error(f"평가 수정 중 오류가 발생했습니다: {str(e)}")
+            else:
+                if updated_id:
                     st.session_state.emp_eval_toast_msg = "updated"
                     st.session_state.selected_eval_row = None
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"평가 수정 중 오류가 발생했습니다: {str(e)}")
-            else:
-                st.session_state.emp_eval_toast_msg = "no_update"
+                else:
+                    st.session_state.emp_eval_toast_msg = "no_update"
                 st.rerun()
     
     # 되돌리기 처리
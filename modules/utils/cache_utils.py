@@ -0,0 +1,134 @@
+"""캐시 유틸리티 모듈
+
+이 모듈은 다음을 지원하는 조회 결과 캐시 기능을 제공합니다:
+- 요청(스크립트 실행) 범위 메모이제이션
+- 프로세스 전역 TTL 캐시 (참조 데이터용)
+
+사용법:
+    from modules.utils.cache_utils import request_cache, cached_per_request, TTLCache
+
+    with request_cache():
+        render_page()  # 블록 안에서 같은 인자의 조회는 1번만 실행
+
+    cache = TTLCache(maxsize=1024, ttl=60)
+    cache.set(key, value)
+    cache.get(key)  # 만료 전까지 value 반환
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+# 현재 요청 범위의 캐시 (스코프 밖에서는 None → 캐시 비활성)
+_request_cache: ContextVar[Optional[Dict[tuple, Any]]] = ContextVar('_request_cache', default=None)
+
+
+@contextmanager
+def request_cache() -> Iterator[Dict[tuple, Any]]:
+    """요청 범위 캐시 스코프 컨텍스트 매니저
+
+    중첩 호출 시 바깥 스코프의 캐시를 그대로 사용합니다.
+
+    Yields:
+        현재 스코프의 캐시 딕셔너리
+    """
+    current = _request_cache.get()
+    if current is not None:
+        yield current
+        return
+
+    token = _request_cache.set({})
+    try:
+        yield _request_cache.get()
+    finally:
+        _request_cache.reset(token)
+
+
+def cached_per_request(func: Callable) -> Callable:
+    """요청 범위 메모이제이션 데코레이터 (리포지토리 메서드용)
+
+    캐시 키는 (리포지토리 클래스, 메서드명, 인자)이며,
+    request_cache() 스코프 밖에서는 매번 원본 메서드를 실행합니다.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = _request_cache.get()
+        if cache is None:
+            return func(self, *args, **kwargs)
+
+        key = (type(self), func.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = func(self, *args, **kwargs)
+        return cache[key]
+    return wrapper
+
+
+def invalidate_request_cache(owner: type) -> None:
+    """특정 리포지토리 클래스의 요청 범위 캐시 항목 제거
+
+    Args:
+        owner: 캐시 항목을 제거할 리포지토리 클래스
+    """
+    cache = _request_cache.get()
+    if not cache:
+        return
+
+    for key in [k for k in cache if k[0] is owner]:
+        del cache[key]
+
+
+class TTLCache:
+    """스레드 안전한 TTL 캐시
+
+    항목은 ttl초 후 만료되며, maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값 반환 (없으면 default)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (최대 크기 초과 시 LRU 항목 제거)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -20,12 +20,20 @@ from contextlib import contextmanager
 T = TypeVar('T')
 
 DB_POOL_SIZE = 5
+DB_POOL_WAIT_SECONDS = 0.2  # 풀 소진 시 직접 연결로 폴백하기 전 반납 대기 시간
 THREAD_MAX_WORKERS = 4
 CACHE_MAX_ENTRIES = 20
 CACHE_TTL = 600  # 10분
+REFERENCE_CACHE_MAX_ENTRIES = 1024
+REFERENCE_CACHE_TTL = 60  # 1분
+RECORDS_CACHE_MAX_CUSTOMERS = 256  # 대상자별 기록 조회 캐시 최대 대상자 수
 BATCH_SIZE_SMALL = 10
 BATCH_SIZE_MEDIUM = 20
 BATCH_SIZE_LARGE = 50
+BULK_INSERT_CHUNK_SIZE = 1000  # 다중 행 INSERT 1문장당 최대 행 수 (max_allowed_packet 보호)
+BULK_LOAD_THRESHOLD = 500  # 일일 기록 저장 레코드 수가 이 값을 넘으면 LOAD DATA LOCAL INFILE 경로 사용
+AI_RESULT_CACHE_MAX_ENTRIES = 4096  # 특이사항 AI 평가 결과 캐시 최대 항목 수
+AI_RESULT_CACHE_TTL = 86400  # 1일
 
 # 앱 시작 시 GC 설정
 gc.set_threshold(700, 10, 10)
@@ -90,8 +90,8 @@ def _fetch_two_week_records(
     if not customer:
         return [], (prev_start, prev_end), (start_date, curr_end)
     
-    # 날짜 범위에 대한 레코드 가져오기
-    records = daily_info_repo.get_customer_records(
+    # 날짜 범위에 대한 레코드 가져오기 (get_customer_records 캐시를 공유하고 필드 이름으로 읽는 튜플 행으로 반환)
+    rows = daily_info_repo.get_customer_records_rows(
         customer['customer_id'], 
         prev_start, 
         curr_end
@@ -99,21 +99,21 @@ def _fetch_two_week_records(
     
     # 예상 형식과 일치하도록 레코드 변환
     transformed_records = []
-    for record in records:
+    for row in rows:
         transformed_records.append({
-            'date': record['date'],
-            'total_service_time': record['total_service_time'],
-            'physical_note': record['physical_note'],
-            'cognitive_note': record['cognitive_note'],
-            'nursing_note': record['nursing_note'],
-            'functional_note': record['functional_note'],
-            'meal_breakfast': record.get('meal_breakfast'),
-            'meal_lunch': record.get('meal_lunch'),
-            'meal_dinner': record.get('meal_dinner'),
-            'toilet_care': record.get('toilet_care'),
-            'bath_time': record.get('bath_time'),
-            'bp_temp': record.get('bp_temp'),
-            'prog_therapy': record.get('prog_therapy')
+            'date': row.date,
+            'total_service_time': row.total_service_time,
+            'physical_note': row.physical_note,
+            'cognitive_note': row.cognitive_note,
+            'nursing_note': row.nursing_note,
+            'functional_note': row.functional_note,
+            'meal_breakfast': row.meal_breakfast,
+            'meal_lunch': row.meal_lunch,
+            'meal_dinner': row.meal_dinner,
+            'toilet_care': row.toilet_care,
+            'bath_time': row.bath_time,
+            'bp_temp': row.bp_temp,
+            'prog_therapy': row.prog_therapy
         })
     
     return transformed_records, (prev_start, prev_end), (start_date, curr_end)
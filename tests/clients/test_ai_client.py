@@ -9,6 +9,7 @@ import sys
 import pytest
 from unittest.mock import patch, MagicMock
 from modules.clients.ai_client import (
+    AsyncRateLimiter,
     BaseAIClient,
     OpenAIClient,
     GeminiClient,
@@ -176,6 +177,43 @@ class TestGeminiClient:
         assert response.choices[0].message.content == '{"result": "테스트 응답"}'
 
 
+class TestAsyncRateLimiter:
+    """AsyncRateLimiter 토큰 버킷 테스트"""
+
+    def test_acquire_within_capacity_does_not_wait(self):
+        """버킷 용량 이내 요청은 대기 없이 통과한다"""
+        import asyncio
+        limiter = AsyncRateLimiter(requests_per_minute=3)
+
+        async def run():
+            with patch('modules.clients.ai_client.asyncio.sleep') as mock_sleep:
+                for _ in range(3):
+                    await limiter.acquire()
+                return mock_sleep
+
+        assert asyncio.run(run()).call_count == 0
+
+    def test_acquire_waits_when_bucket_empty(self):
+        """토큰이 소진되면 다음 토큰이 채워질 때까지 대기한다"""
+        import asyncio
+        limiter = AsyncRateLimiter(requests_per_minute=60)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            limiter._tokens += 1
+
+        async def run():
+            limiter._tokens = 0
+            with patch('modules.clients.ai_client.asyncio.sleep', side_effect=fake_sleep):
+                await limiter.acquire()
+
+        asyncio.run(run())
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 1
+
+
 class TestSetAiClient:
     """set_ai_client / get_ai_client 의존성 주입 테스트"""
 
@@ -309,6 +347,34 @@ class TestGetAiClientWithoutStreamlit:
 
         assert isinstance(client, OpenAIClient)
 
+    def test_get_ai_client_reuses_client_in_plain_env(self):
+        """일반 환경에서 provider별 클라이언트를 한 번만 생성해 재사용"""
+        mock_openai_module = MagicMock()
+
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
+            with patch('modules.clients.ai_client.openai', mock_openai_module):
+                with patch('modules.clients.ai_client._get_cached_ai_client',
+                           side_effect=RuntimeError("no streamlit")):
+                    first = get_ai_client(provider='openai')
+                    second = get_ai_client(provider='openai')
+
+        assert first is second
+        mock_openai_module.OpenAI.assert_called_once()
+
+    def test_set_ai_client_clears_cached_clients(self):
+        """set_ai_client 호출 시 캐시된 클라이언트 초기화"""
+        mock_openai_module = MagicMock()
+
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
+            with patch('modules.clients.ai_client.openai', mock_openai_module):
+                with patch('modules.clients.ai_client._get_cached_ai_client',
+                           side_effect=RuntimeError("no streamlit")):
+                    first = get_ai_client(provider='openai')
+                    set_ai_client(None)
+                    second = get_ai_client(provider='openai')
+
+        assert first is not second
+
     def test_get_ai_client_gemini_module_not_installed_raises(self):
         """genai 모듈이 None일 때 ModuleNotFoundError 발생"""
         with patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'}):
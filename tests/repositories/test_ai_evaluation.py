@@ -2,8 +2,11 @@
 
 import unittest
 import pytest
-from unittest.mock import patch
-from modules.repositories.ai_evaluation import AiEvaluationRepository
+from contextlib import contextmanager
+from unittest.mock import patch, MagicMock
+from modules.repositories.ai_evaluation import (
+    AiEvaluationRepository, EvaluationRow, CustomerEvaluationRow
+)
 
 
 class TestAiEvaluationRepository:
@@ -20,6 +23,12 @@ class TestAiEvaluationRepository:
         with patch.object(AiEvaluationRepository, '_execute_query') as mock:
             yield mock
     
+    @pytest.fixture
+    def mock_execute_query_tuples(self):
+        """_execute_query_tuples 메서드 mock"""
+        with patch.object(AiEvaluationRepository, '_execute_query_tuples') as mock:
+            yield mock
+    
     @pytest.fixture
     def mock_execute_query_one(self):
         """_execute_query_one 메서드 mock"""
@@ -97,6 +106,52 @@ class TestAiEvaluationRepository:
         call_args = mock_execute_transaction.call_args[0][1]
         assert '인지' in call_args
 
+    # ========== save_evaluations_bulk 테스트 ==========
+    
+    @staticmethod
+    def _mock_transaction_ctx(cursor):
+        """db_transaction 컨텍스트 매니저 mock 생성"""
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+        return _mock_tx
+    
+    def test_save_evaluations_bulk_empty(self, repo):
+        """빈 목록이면 DB 접근 없음"""
+        with patch('modules.repositories.ai_evaluation.db_transaction') as mock_tx:
+            repo.save_evaluations_bulk([])
+        
+        mock_tx.assert_not_called()
+    
+    def test_save_evaluations_bulk_single_upsert(self, repo):
+        """여러 평가를 ON DUPLICATE KEY UPDATE 1문장으로 저장하고 카테고리는 한국어로 변환"""
+        cursor = MagicMock()
+        rows = [
+            (100, 'SPECIAL_NOTE_PHYSICAL', 'O', 'O', 'X', '평균', '원본1', None, '수정1'),
+            (100, 'COGNITIVE', 'X', 'X', 'X', '개선', '원본2', '이유', '수정2'),
+        ]
+        
+        with patch('modules.repositories.ai_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            repo.save_evaluations_bulk(rows)
+        
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        assert 'ON DUPLICATE KEY UPDATE' in query
+        assert query.count('CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)') == 2
+        # INSERT 컬럼 순서: reason_text, suggestion_text, original_text
+        assert params[:9] == [100, '신체', 'O', 'O', 'X', '평균', None, '수정1', '원본1']
+        assert params[10] == '인지'
+    
+    def test_save_evaluations_bulk_chunks(self, repo):
+        """chunk_size 단위로 문장 분할"""
+        cursor = MagicMock()
+        rows = [(i, '신체', 'O', 'O', 'O', '우수', '', None, '') for i in range(5)]
+        
+        with patch('modules.repositories.ai_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            repo.save_evaluations_bulk(rows, chunk_size=2)
+        
+        assert cursor.execute.call_count == 3
+
     # ========== get_evaluation 테스트 ==========
     
     def test_get_evaluation_exists(self, repo, mock_execute_query_one, sample_evaluation_data):
@@ -117,22 +172,50 @@ class TestAiEvaluationRepository:
         
         assert result is None
 
+    def test_get_evaluation_reuses_prebuilt_query(self, repo, mock_execute_query_one):
+        """호출마다 같은 SQL 문자열 객체를 사용하고 특이사항 카테고리도 매핑"""
+        mock_execute_query_one.return_value = None
+        
+        repo.get_evaluation(record_id=100, category='PHYSICAL')
+        first_query = mock_execute_query_one.call_args[0][0]
+        repo.get_evaluation(record_id=100, category='SPECIAL_NOTE_COGNITIVE')
+        second_query, params = mock_execute_query_one.call_args[0]
+        
+        assert first_query is second_query
+        assert params == (100, '인지')
+
     # ========== get_all_evaluations_by_record 테스트 ==========
     
-    def test_get_all_evaluations_by_record(self, repo, mock_execute_query, sample_evaluation_data):
+    @staticmethod
+    def _evaluation_row(category='신체'):
+        return EvaluationRow(category, 'O', 'O', 'O', '우수', '사유', '제안', None)
+    
+    def test_get_all_evaluations_by_record(self, repo, mock_execute_query_tuples):
         """레코드의 모든 평가 조회"""
-        mock_execute_query.return_value = [
-            sample_evaluation_data,
-            {**sample_evaluation_data, 'category': '인지'}
+        mock_execute_query_tuples.return_value = [
+            self._evaluation_row('신체'),
+            self._evaluation_row('인지')
         ]
         
         result = repo.get_all_evaluations_by_record(record_id=100)
         
         assert len(result) == 2
+        assert mock_execute_query_tuples.call_args[0][2] is EvaluationRow
     
-    def test_get_all_evaluations_by_record_empty(self, repo, mock_execute_query):
+    def test_get_all_evaluations_by_record_sorted_by_category_order(self, repo, mock_execute_query_tuples):
+        """DB 정렬 없이 신체 → 인지 → 간호 → 기능 순서로 정렬"""
+        mock_execute_query_tuples.return_value = [
+            self._evaluation_row(c) for c in ('기능', '기타', '신체', '인지')
+        ]
+        
+        result = repo.get_all_evaluations_by_record(record_id=100)
+        
+        assert 'ORDER BY' not in mock_execute_query_tuples.call_args[0][0]
+        assert [r.category for r in result] == ['신체', '인지', '기능', '기타']
+    
+    def test_get_all_evaluations_by_record_empty(self, repo, mock_execute_query_tuples):
         """평가가 없는 레코드"""
-        mock_execute_query.return_value = []
+        mock_execute_query_tuples.return_value = []
         
         result = repo.get_all_evaluations_by_record(record_id=999)
         
@@ -140,14 +223,29 @@ class TestAiEvaluationRepository:
 
     # ========== get_evaluations_by_customer 테스트 ==========
     
-    def test_get_evaluations_by_customer(self, repo, mock_execute_query, sample_evaluation_data):
+    def test_get_evaluations_by_customer(self, repo, mock_execute_query_tuples):
         """고객별 평가 조회"""
-        mock_execute_query.return_value = [sample_evaluation_data]
+        mock_execute_query_tuples.return_value = [
+            CustomerEvaluationRow('신체', 'O', 'O', 'O', '우수', None, None, None, '2024-01-15', '홍길동')
+        ]
         
         result = repo.get_evaluations_by_customer(customer_id=1, limit=10)
         
         assert len(result) == 1
-        mock_execute_query.assert_called_once()
+        assert result[0].customer_name == '홍길동'
+        mock_execute_query_tuples.assert_called_once()
+
+    def test_get_evaluations_by_customer_without_customers_join(self, repo, mock_execute_query_tuples):
+        """customers 테이블 JOIN 없이 daily_infos.customer_id로 필터링"""
+        mock_execute_query_tuples.return_value = []
+        
+        repo.get_evaluations_by_customer(customer_id=1, limit=10)
+        
+        query, params, row_type = mock_execute_query_tuples.call_args[0]
+        assert 'JOIN customers' not in query
+        assert 'di.customer_id = %s' in query
+        assert params == (1, 1, 10)
+        assert row_type is CustomerEvaluationRow
 
     # ========== delete_evaluation 테스트 ==========
     
@@ -207,3 +305,57 @@ class TestAiEvaluationRepository:
         call_args = mock_execute_query.call_args[0][1]
         assert '2024-01-01' in call_args
         assert '2024-01-31' in call_args
+
+    def test_get_evaluation_stats_sql_is_constant(self, repo, mock_execute_query):
+        """날짜 범위 유무와 관계없이 같은 SQL을 사용하고 파라미터는 고정 5개"""
+        mock_execute_query.return_value = []
+        
+        repo.get_evaluation_stats(customer_id=1)
+        query_without_range, params_without_range = mock_execute_query.call_args[0]
+        repo.get_evaluation_stats(customer_id=1, start_date='2024-01-01', end_date='2024-01-31')
+        query_with_range, params_with_range = mock_execute_query.call_args[0]
+        
+        assert query_without_range == query_with_range
+        assert params_without_range == (1, None, None, None, None)
+        assert params_with_range == (1, '2024-01-01', '2024-01-01', '2024-01-31', '2024-01-31')
+    
+    def test_get_evaluation_stats_reads_daily_summary_table(self, repo, mock_execute_query):
+        """ai_evaluations 전체 집계 대신 일자별 집계 테이블을 합산"""
+        mock_execute_query.return_value = []
+        
+        repo.get_evaluation_stats(customer_id=1)
+        
+        query = mock_execute_query.call_args[0][0]
+        assert 'FROM ai_evaluation_daily_stats' in query
+        assert 'ai_evaluations ae' not in query
+    
+    def test_get_evaluation_stats_ignores_partial_range(self, repo, mock_execute_query):
+        """시작일만 있으면 기존과 같이 날짜 필터를 적용하지 않음"""
+        mock_execute_query.return_value = []
+        
+        repo.get_evaluation_stats(customer_id=1, start_date='2024-01-01')
+        
+        assert mock_execute_query.call_args[0][1] == (1, None, None, None, None)
+
+    def test_get_evaluation_stats_rounds_in_sql(self, repo, mock_execute_query):
+        """반올림은 SQL에서 수행하고 값은 그대로 전달"""
+        mock_execute_query.return_value = [
+            {
+                'category': '인지',
+                'total_evaluations': 3,
+                'avg_oer_fidelity': 0.67,
+                'avg_specificity': 0,
+                'avg_grammar': 1.0,
+                'excellent_count': 1,
+                'average_count': 1,
+                'improvement_count': 1,
+                'poor_count': 0
+            }
+        ]
+        
+        result = repo.get_evaluation_stats(customer_id=1)
+        
+        query = mock_execute_query.call_args[0][0]
+        assert 'ROUND(SUM(' in query
+        assert result['인지']['avg_oer_fidelity'] == 0.67
+        assert result['인지']['avg_specificity'] == 0
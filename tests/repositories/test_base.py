@@ -77,6 +77,75 @@ class TestBaseRepository:
 
         mock_db_ctx.execute.assert_called_once_with("SELECT 1", ())
 
+    # ========== _execute_query_iter 테스트 ==========
+
+    def test_execute_query_iter_yields_rows_lazily(self, repo, mock_db_ctx):
+        """_execute_query_iter는 fetchall() 없이 fetchone()으로 한 행씩 반환한다"""
+        rows = [{'id': 1}, {'id': 2}]
+        mock_db_ctx.fetchone.side_effect = rows + [None]
+
+        iterator = repo._execute_query_iter("SELECT * FROM customers")
+        mock_db_ctx.execute.assert_not_called()
+
+        assert list(iterator) == rows
+        mock_db_ctx.fetchall.assert_not_called()
+        assert mock_db_ctx.fetchone.call_count == 3
+
+    def test_execute_query_iter_with_params(self, repo, mock_db_ctx):
+        """파라미터와 함께 _execute_query_iter 실행"""
+        mock_db_ctx.fetchone.return_value = None
+
+        result = list(repo._execute_query_iter("SELECT * FROM customers WHERE id = %s", (1,)))
+
+        assert result == []
+        mock_db_ctx.execute.assert_called_once_with(
+            "SELECT * FROM customers WHERE id = %s", (1,)
+        )
+
+    # ========== _execute_query_tuples 테스트 ==========
+
+    def test_execute_query_tuples_wraps_rows(self, repo, mock_db_ctx):
+        """튜플 커서 결과를 지정한 NamedTuple로 변환한다"""
+        from typing import NamedTuple
+
+        class Row(NamedTuple):
+            id: int
+            name: str
+
+        mock_db_ctx.fetchall.return_value = [(1, '홍길동'), (2, '김철수')]
+
+        result = repo._execute_query_tuples("SELECT id, name FROM customers", (), Row)
+
+        assert result == [Row(1, '홍길동'), Row(2, '김철수')]
+        assert result[0].name == '홍길동'
+
+    def test_execute_query_tuples_uses_tuple_cursor(self, repo, mock_cursor):
+        """딕셔너리가 아닌 튜플 커서를 요청한다"""
+        requested = []
+
+        @contextmanager
+        def _mock_query(dictionary=True):
+            requested.append(dictionary)
+            yield mock_cursor
+
+        with patch('modules.repositories.base.db_query', _mock_query):
+            repo._execute_query_tuples("SELECT 1", (), tuple)
+
+        assert requested == [False]
+
+    # ========== _execute_query_sets 테스트 ==========
+
+    def test_execute_query_sets_returns_each_result_set(self, repo, mock_db_ctx):
+        """다중 문장 결과를 문장 순서대로 반환한다"""
+        mock_db_ctx.fetchsets.return_value = iter([
+            ("SELECT 1", [{'a': 1}]), ("SELECT 2", []),
+        ])
+
+        result = repo._execute_query_sets("SELECT 1; SELECT 2", ())
+
+        assert result == [[{'a': 1}], []]
+        mock_db_ctx.execute.assert_called_once_with("SELECT 1; SELECT 2", ())
+
     # ========== _execute_query_one 테스트 ==========
 
     def test_execute_query_one_returns_single_result(self, repo, mock_db_ctx):
@@ -104,6 +173,53 @@ class TestBaseRepository:
 
         mock_db_ctx.fetchone.assert_called_once()
 
+    # ========== _fast_one 테스트 ==========
+
+    @staticmethod
+    def _prepared_ctx(*cursors):
+        """prepared_cursor 컨텍스트 매니저 mock (호출마다 다음 커서를 돌려줌)"""
+        queue = list(cursors)
+        calls = []
+
+        @contextmanager
+        def _mock_prepared(query):
+            calls.append(query)
+            yield queue.pop(0)
+        return _mock_prepared, calls
+
+    def test_fast_one_uses_pooled_prepared_cursor(self, repo, mock_cursor):
+        """풀 연결의 쿼리별 prepared 커서로 실행하고 첫 행을 반환한다"""
+        mock_cursor.fetchall.return_value = [{'id': 1}]
+        mock_prepared, calls = self._prepared_ctx(mock_cursor)
+
+        with patch('modules.repositories.base.prepared_cursor', mock_prepared):
+            result = repo._fast_one("SELECT * FROM customers WHERE id = %s", (1,))
+
+        assert result == {'id': 1}
+        assert calls == ["SELECT * FROM customers WHERE id = %s"]
+        mock_cursor.execute.assert_called_once_with("SELECT * FROM customers WHERE id = %s", (1,))
+
+    def test_fast_one_returns_none_when_no_rows(self, repo, mock_cursor):
+        """결과가 없으면 None 반환"""
+        mock_prepared, _ = self._prepared_ctx(mock_cursor)
+
+        with patch('modules.repositories.base.prepared_cursor', mock_prepared):
+            assert repo._fast_one("SELECT 1") is None
+
+    def test_fast_one_retries_once_on_operational_error(self, repo, mock_cursor):
+        """연결 오류 시 새로 체크아웃한 연결로 한 번 재시도한다"""
+        import mysql.connector
+        stale = MagicMock()
+        stale.execute.side_effect = mysql.connector.errors.OperationalError("gone away")
+        mock_cursor.fetchall.return_value = [{'id': 1}]
+        mock_prepared, calls = self._prepared_ctx(stale, mock_cursor)
+
+        with patch('modules.repositories.base.prepared_cursor', mock_prepared):
+            result = repo._fast_one("SELECT 1")
+
+        assert result == {'id': 1}
+        assert len(calls) == 2
+
     # ========== _execute_transaction 테스트 ==========
 
     def test_execute_transaction_returns_rowcount(self, repo, mock_db_ctx):
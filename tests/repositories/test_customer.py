@@ -1,13 +1,23 @@
 """CustomerRepository 테스트"""
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import patch, MagicMock
+from modules.repositories import customer as customer_module
 from modules.repositories.customer import CustomerRepository
+from modules.utils.cache_utils import request_cache
 
 
 class TestCustomerRepository:
     """CustomerRepository 테스트 클래스"""
     
+    @pytest.fixture(autouse=True)
+    def clear_customer_cache(self):
+        """프로세스 전역 대상자 캐시 초기화"""
+        customer_module._customer_cache.clear()
+        yield
+        customer_module._customer_cache.clear()
+    
     @pytest.fixture
     def repo(self):
         """CustomerRepository 인스턴스 생성"""
@@ -20,9 +30,9 @@ class TestCustomerRepository:
             yield mock
     
     @pytest.fixture
-    def mock_execute_query_one(self):
-        """_execute_query_one 메서드 mock"""
-        with patch.object(CustomerRepository, '_execute_query_one') as mock:
+    def mock_fast_one(self):
+        """_fast_one 메서드 mock (단건 조회 핫 패스)"""
+        with patch.object(CustomerRepository, '_fast_one') as mock:
             yield mock
     
     @pytest.fixture
@@ -60,6 +70,16 @@ class TestCustomerRepository:
         call_args = mock_execute_query.call_args
         assert '%홍%' in call_args[0][1]
     
+    def test_list_customers_with_long_keyword_uses_fulltext(self, repo, mock_execute_query, sample_customer_data):
+        """2글자 이상 키워드는 전문 검색 + 인정번호 접두어 검색"""
+        mock_execute_query.return_value = [sample_customer_data]
+        
+        repo.list_customers(keyword='길동')
+        
+        query, params = mock_execute_query.call_args[0]
+        assert 'MATCH(name) AGAINST' in query
+        assert params == ('"길동"', '길동%')
+    
     def test_list_customers_empty_result(self, repo, mock_execute_query):
         """고객이 없는 경우"""
         mock_execute_query.return_value = []
@@ -70,9 +90,9 @@ class TestCustomerRepository:
 
     # ========== get_customer 테스트 ==========
     
-    def test_get_customer_exists(self, repo, mock_execute_query_one, sample_customer_data):
+    def test_get_customer_exists(self, repo, mock_fast_one, sample_customer_data):
         """존재하는 고객 조회"""
-        mock_execute_query_one.return_value = sample_customer_data
+        mock_fast_one.return_value = sample_customer_data
         
         result = repo.get_customer(1)
         
@@ -80,9 +100,9 @@ class TestCustomerRepository:
         assert result['customer_id'] == 1
         assert result['name'] == '홍길동'
     
-    def test_get_customer_not_exists(self, repo, mock_execute_query_one):
+    def test_get_customer_not_exists(self, repo, mock_fast_one):
         """존재하지 않는 고객 조회"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
         
         result = repo.get_customer(999)
         
@@ -105,6 +125,69 @@ class TestCustomerRepository:
         assert result == 1
         mock_execute_transaction_lastrowid.assert_called_once()
 
+    # ========== create_customers_bulk 테스트 ==========
+    
+    @staticmethod
+    def _mock_transaction_ctx(cursor):
+        """db_transaction 컨텍스트 매니저 mock 생성"""
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+        return _mock_tx
+    
+    def test_create_customers_bulk_empty(self, repo):
+        """빈 목록이면 DB 접근 없이 빈 리스트 반환"""
+        with patch('modules.repositories.customer.db_transaction') as mock_tx:
+            result = repo.create_customers_bulk([])
+        
+        assert result == []
+        mock_tx.assert_not_called()
+    
+    def test_create_customers_bulk_single_multirow_insert(self, repo):
+        """청크 하나는 다중 행 INSERT 1문장으로 실행하고 연속 ID 반환"""
+        cursor = MagicMock()
+        cursor.lastrowid = 10
+        cursor.fetchone.return_value = (1,)
+        rows = [{'name': '홍길동', 'birth_date': '1950-01-01'}, {'name': '김철수'}]
+        
+        with patch('modules.repositories.customer.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.create_customers_bulk(rows)
+        
+        assert result == [10, 11]
+        inserts = [c for c in cursor.execute.call_args_list if 'INSERT' in c[0][0]]
+        assert len(inserts) == 1
+        query, params = inserts[0][0]
+        assert query.count('(%s, %s, %s, %s, %s, %s)') == 2
+        assert len(params) == 12
+        assert params[0] == '홍길동'
+        assert params[6] == '김철수'
+    
+    def test_create_customers_bulk_chunks(self, repo):
+        """chunk_size 단위로 INSERT 문장 분할"""
+        cursor = MagicMock()
+        cursor.lastrowid = 1
+        cursor.fetchone.return_value = (1,)
+        rows = [{'name': f'고객{i}'} for i in range(5)]
+        
+        with patch('modules.repositories.customer.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.create_customers_bulk(rows, chunk_size=2)
+        
+        assert sum('INSERT' in c[0][0] for c in cursor.execute.call_args_list) == 3
+        assert len(result) == 5
+    
+    def test_create_customers_bulk_uses_auto_increment_increment(self, repo):
+        """auto_increment_increment가 1이 아니면 그 간격으로 ID 계산"""
+        cursor = MagicMock()
+        cursor.lastrowid = 11
+        cursor.fetchone.return_value = (2,)
+        rows = [{'name': '홍길동'}, {'name': '홍길동'}, {'name': '김철수'}]
+        
+        with patch('modules.repositories.customer.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.create_customers_bulk(rows)
+        
+        assert result == [11, 13, 15]
+        assert '@@SESSION.auto_increment_increment' in cursor.execute.call_args_list[-1][0][0]
+
     # ========== update_customer 테스트 ==========
     
     def test_update_customer_success(self, repo, mock_execute_transaction):
@@ -153,18 +236,18 @@ class TestCustomerRepository:
 
     # ========== find_by_name 테스트 ==========
     
-    def test_find_by_name_exists(self, repo, mock_execute_query_one, sample_customer_data):
+    def test_find_by_name_exists(self, repo, mock_fast_one, sample_customer_data):
         """이름으로 고객 검색 - 존재"""
-        mock_execute_query_one.return_value = sample_customer_data
+        mock_fast_one.return_value = sample_customer_data
         
         result = repo.find_by_name('홍길동')
         
         assert result is not None
         assert result['name'] == '홍길동'
     
-    def test_find_by_name_not_exists(self, repo, mock_execute_query_one):
+    def test_find_by_name_not_exists(self, repo, mock_fast_one):
         """이름으로 고객 검색 - 존재하지 않음"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
         
         result = repo.find_by_name('없는이름')
         
@@ -172,9 +255,9 @@ class TestCustomerRepository:
 
     # ========== find_by_recognition_no 테스트 ==========
     
-    def test_find_by_recognition_no_exists(self, repo, mock_execute_query_one, sample_customer_data):
+    def test_find_by_recognition_no_exists(self, repo, mock_fast_one, sample_customer_data):
         """인정번호로 고객 검색 - 존재"""
-        mock_execute_query_one.return_value = sample_customer_data
+        mock_fast_one.return_value = sample_customer_data
         
         result = repo.find_by_recognition_no('L1234567890')
         
@@ -183,20 +266,96 @@ class TestCustomerRepository:
 
     # ========== get_or_create 테스트 ==========
     
-    def test_get_or_create_existing_customer(self, repo, mock_execute_query_one, mock_execute_transaction, sample_customer_data):
-        """기존 고객이 있으면 업데이트 후 ID 반환"""
-        mock_execute_query_one.return_value = sample_customer_data
-        mock_execute_transaction.return_value = 1
+    def test_get_or_create_existing_customer(self, repo):
+        """기존 고객이 있으면 같은 트랜잭션에서 업데이트 후 ID 반환"""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (1,)
         
-        result = repo.get_or_create(name='홍길동', birth_date='1950-01-01')
+        with patch('modules.repositories.customer.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.get_or_create(name='홍길동', birth_date='1950-01-01')
         
         assert result == 1
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        assert 'FOR UPDATE' in queries[0]
+        assert 'UPDATE customers' in queries[1]
+        assert 'gender' not in queries[1]
     
-    def test_get_or_create_new_customer(self, repo, mock_execute_query_one, mock_execute_transaction_lastrowid):
-        """새 고객이면 생성 후 ID 반환"""
-        mock_execute_query_one.return_value = None
-        mock_execute_transaction_lastrowid.return_value = 2
+    def test_get_or_create_new_customer(self, repo):
+        """새 고객이면 같은 트랜잭션에서 생성 후 ID 반환"""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = None
+        cursor.lastrowid = 2
         
-        result = repo.get_or_create(name='새고객', birth_date='1970-01-01')
+        with patch('modules.repositories.customer.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.get_or_create(name='새고객', birth_date='1970-01-01')
         
         assert result == 2
+        assert cursor.execute.call_count == 2
+        assert 'INSERT INTO customers' in cursor.execute.call_args[0][0]
+
+    # ========== 요청 범위 캐시 테스트 ==========
+
+    def test_get_customer_cached_within_request(self, repo, mock_fast_one, sample_customer_data):
+        """request_cache 스코프 안에서 같은 고객 조회는 1번만 실행"""
+        mock_fast_one.return_value = sample_customer_data
+
+        with request_cache():
+            repo.get_customer(1)
+            repo.get_customer(1)
+
+        mock_fast_one.assert_called_once()
+
+    def test_find_by_name_not_cached_outside_request(self, repo, mock_fast_one, sample_customer_data):
+        """스코프 밖에서는 매번 조회"""
+        mock_fast_one.return_value = sample_customer_data
+
+        repo.find_by_name('홍길동')
+        repo.find_by_name('홍길동')
+
+        assert mock_fast_one.call_count == 2
+
+    # ========== 프로세스 전역 TTL 캐시 테스트 ==========
+
+    def test_get_customer_cached_across_requests(self, repo, mock_fast_one, sample_customer_data):
+        """get_customer는 요청이 달라도 TTL 동안 DB를 다시 조회하지 않음"""
+        mock_fast_one.return_value = sample_customer_data
+
+        first = repo.get_customer(1)
+        second = repo.get_customer(1)
+
+        mock_fast_one.assert_called_once()
+        assert second == first
+
+    def test_get_customer_missing_not_cached(self, repo, mock_fast_one):
+        """존재하지 않는 고객은 캐시하지 않음"""
+        mock_fast_one.return_value = None
+
+        repo.get_customer(999)
+        repo.get_customer(999)
+
+        assert mock_fast_one.call_count == 2
+
+    def test_delete_customer_evicts_process_cache(self, repo, mock_fast_one,
+                                                  mock_execute_transaction, sample_customer_data):
+        """삭제 시 해당 고객 캐시 제거"""
+        mock_fast_one.return_value = sample_customer_data
+        mock_execute_transaction.return_value = 1
+
+        repo.get_customer(1)
+        repo.delete_customer(1)
+        repo.get_customer(1)
+
+        assert mock_fast_one.call_count == 2
+
+    def test_update_customer_invalidates_request_cache(self, repo, mock_fast_one,
+                                                        mock_execute_transaction, sample_customer_data):
+        """수정 후에는 캐시를 버리고 다시 조회"""
+        mock_fast_one.return_value = sample_customer_data
+        mock_execute_transaction.return_value = 1
+
+        with request_cache():
+            repo.find_by_name('홍길동')
+            repo.update_customer(customer_id=1, name='홍길동', birth_date='1950-01-01')
+            repo.find_by_name('홍길동')
+
+        assert mock_fast_one.call_count == 2
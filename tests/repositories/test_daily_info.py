@@ -7,13 +7,26 @@
 import pytest
 from contextlib import contextmanager
 from unittest.mock import patch, MagicMock, call
-from datetime import date
-from modules.repositories.daily_info import DailyInfoRepository
+import json
+import os
+from datetime import date, time
+from pathlib import Path
+from modules.repositories import daily_info as daily_info_module
+from modules.repositories.daily_info import DailyInfoRepository, DailyRecord, DailyRecordRow
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
 
 
 class TestDailyInfoRepository:
     """DailyInfoRepository 테스트 클래스"""
 
+    @pytest.fixture(autouse=True)
+    def clear_records_cache(self):
+        """프로세스 전역 기록 조회 캐시 초기화"""
+        daily_info_module._records_cache.clear()
+        yield
+        daily_info_module._records_cache.clear()
+
     @pytest.fixture
     def repo(self):
         return DailyInfoRepository()
@@ -24,8 +37,8 @@ class TestDailyInfoRepository:
             yield mock
 
     @pytest.fixture
-    def mock_execute_query_one(self):
-        with patch.object(DailyInfoRepository, '_execute_query_one') as mock:
+    def mock_fast_one(self):
+        with patch.object(DailyInfoRepository, '_fast_one') as mock:
             yield mock
 
     @pytest.fixture
@@ -82,29 +95,29 @@ class TestDailyInfoRepository:
 
     # ========== find_existing_record_id 테스트 ==========
 
-    def test_find_existing_record_id_exists(self, repo, mock_execute_query_one):
+    def test_find_existing_record_id_exists(self, repo, mock_fast_one):
         """기존 레코드가 있을 때 record_id 반환"""
-        mock_execute_query_one.return_value = {'record_id': 100}
+        mock_fast_one.return_value = {'record_id': 100}
 
         result = repo.find_existing_record_id(customer_id=1, record_date=date(2024, 1, 15))
 
         assert result == 100
 
-    def test_find_existing_record_id_not_exists(self, repo, mock_execute_query_one):
+    def test_find_existing_record_id_not_exists(self, repo, mock_fast_one):
         """기존 레코드가 없을 때 None 반환"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
 
         result = repo.find_existing_record_id(customer_id=1, record_date=date(2024, 1, 15))
 
         assert result is None
 
-    def test_find_existing_record_id_passes_params(self, repo, mock_execute_query_one):
+    def test_find_existing_record_id_passes_params(self, repo, mock_fast_one):
         """올바른 파라미터가 전달되는지 확인"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
 
         repo.find_existing_record_id(customer_id=5, record_date=date(2024, 3, 20))
 
-        params = mock_execute_query_one.call_args[0][1]
+        params = mock_fast_one.call_args[0][1]
         assert 5 in params
         assert date(2024, 3, 20) in params
 
@@ -191,55 +204,196 @@ class TestDailyInfoRepository:
         params = mock_execute_transaction_lastrowid.call_args[0][1]
         assert 7 == params[0]
 
+    def test_insert_daily_info_upserts_same_day(self, repo, mock_execute_transaction_lastrowid, sample_record):
+        """같은 대상자/일자 기록이 있으면 갱신하고 기존 record_id를 lastrowid로 반환"""
+        mock_execute_transaction_lastrowid.return_value = 1
+
+        repo.insert_daily_info(customer_id=1, record=sample_record)
+
+        query = mock_execute_transaction_lastrowid.call_args[0][0]
+        assert 'ON DUPLICATE KEY UPDATE' in query
+        assert 'record_id = LAST_INSERT_ID(record_id)' in query
+
     # ========== get_customer_records 테스트 ==========
 
-    def test_get_customer_records_without_date_filter(self, repo, mock_execute_query):
+    @pytest.fixture
+    def mock_execute_query_sets(self):
+        """daily_infos + 하위 테이블 4개 결과 세트 mock (기본: 모두 빈 결과)"""
+        with patch.object(DailyInfoRepository, '_execute_query_sets',
+                          return_value=[[], [], [], [], []]) as mock:
+            yield mock
+
+    def test_get_customer_records_without_date_filter(self, repo, mock_execute_query_sets):
         """날짜 필터 없이 전체 레코드 조회"""
-        expected = [{'record_id': 1, 'date': date(2024, 1, 15), 'physical_note': '정상'}]
-        mock_execute_query.return_value = expected
+        mock_execute_query_sets.return_value = [
+            [{'record_id': 1, 'date': date(2024, 1, 15), 'total_service_time': '8시간'}],
+            [{'record_id': 1, 'physical_note': '정상'}], [], [], []
+        ]
 
         result = repo.get_customer_records(customer_id=1)
 
         assert len(result) == 1
-        mock_execute_query.assert_called_once()
+        assert result[0]['physical_note'] == '정상'
+        mock_execute_query_sets.assert_called_once()
+
+    def test_get_customer_records_merges_child_rows(self, repo, mock_execute_query_sets):
+        """하위 테이블 결과를 record_id로 병합하고, 없는 하위 기록 컬럼은 None (JOIN 결과와 같은 키 순서)"""
+        mock_execute_query_sets.return_value = [
+            [{'record_id': 2, 'date': date(2024, 1, 16), 'total_service_time': None},
+             {'record_id': 1, 'date': date(2024, 1, 15), 'total_service_time': '8시간'}],
+            [{'record_id': 1, 'physical_note': '정상', 'writer_physical': '홍담당'}],
+            [],
+            [{'record_id': 2, 'bp_temp': '120/80', 'nursing_note': '양호', 'writer_nursing': '김간호'}],
+            [{'record_id': 99, 'prog_therapy': '무관'}],
+        ]
 
-    def test_get_customer_records_with_date_range(self, repo, mock_execute_query):
-        """날짜 범위로 레코드 필터링"""
-        mock_execute_query.return_value = []
+        result = repo.get_customer_records(customer_id=1)
+
+        assert [r['record_id'] for r in result] == [2, 1]
+        assert list(result[0]) == list(DailyRecordRow._fields)
+        assert result[0]['bp_temp'] == '120/80'
+        assert result[0]['physical_note'] is None
+        assert result[1]['writer_physical'] == '홍담당'
+        assert result[1]['prog_therapy'] is None
+
+    def test_get_customer_records_single_round_trip_without_join(self, repo, mock_execute_query_sets):
+        """JOIN 없이 daily_infos + 하위 테이블 4개 조회를 다중 문장 1회로 실행"""
+        repo.get_customer_records(customer_id=1)
 
+        query, params = mock_execute_query_sets.call_args[0]
+        statements = query.split('; ')
+        assert len(statements) == 5
+        assert 'JOIN' not in query.upper()
+        assert statements[0].startswith('SELECT record_id, date, total_service_time FROM daily_infos')
+        assert [s.split(' FROM ')[1].split()[0] for s in statements[1:]] == [
+            'daily_physicals', 'daily_cognitives', 'daily_nursings', 'daily_recoveries'
+        ]
+        assert params == (1,) * 5
+
+    def test_get_customer_records_with_date_range(self, repo, mock_execute_query_sets):
+        """날짜 범위로 레코드 필터링"""
         repo.get_customer_records(
             customer_id=1,
             start_date=date(2024, 1, 1),
             end_date=date(2024, 1, 31)
         )
 
-        call_args = mock_execute_query.call_args[0]
-        params = call_args[1]
-        assert date(2024, 1, 1) in params
-        assert date(2024, 1, 31) in params
+        params = mock_execute_query_sets.call_args[0][1]
+        assert params == (1, date(2024, 1, 1), date(2024, 1, 31)) * 5
 
-    def test_get_customer_records_returns_empty(self, repo, mock_execute_query):
+    def test_get_customer_records_returns_empty(self, repo, mock_execute_query_sets):
         """레코드가 없을 때 빈 리스트 반환"""
-        mock_execute_query.return_value = []
-
         result = repo.get_customer_records(customer_id=999)
 
         assert result == []
 
-    def test_get_customer_records_ordered_desc(self, repo, mock_execute_query):
+    def test_get_customer_records_ordered_desc(self, repo, mock_execute_query_sets):
         """날짜 내림차순 정렬 확인"""
-        mock_execute_query.return_value = []
+        repo.get_customer_records(customer_id=1)
+
+        query = mock_execute_query_sets.call_args[0][0]
+        assert 'ORDER BY DATE DESC' in query.split('; ')[0].upper()
 
+    def test_get_customer_records_cached_per_range(self, repo, mock_execute_query_sets):
+        """같은 대상자/기간은 DB를 다시 조회하지 않고 사본을 반환"""
+        mock_execute_query_sets.return_value = [
+            [{'record_id': 1}], [{'record_id': 1, 'physical_note': '정상'}], [], [], []
+        ]
+
+        first = repo.get_customer_records(customer_id=1)
+        first[0]['physical_note'] = '변경'
+        second = repo.get_customer_records(customer_id=1)
+        repo.get_customer_records(customer_id=1, start_date=date(2024, 1, 1), end_date=date(2024, 1, 31))
+
+        assert mock_execute_query_sets.call_count == 2
+        assert second[0]['physical_note'] == '정상'
+
+    def test_get_customer_records_invalidated_by_writes(self, repo, mock_execute_query_sets,
+                                                         mock_execute_transaction,
+                                                         mock_execute_transaction_lastrowid, sample_record):
+        """대상자 기록 저장/수정 후에는 다시 조회"""
+        repo.get_customer_records(customer_id=1)
+        repo.insert_daily_info(customer_id=1, record=sample_record)
+        repo.get_customer_records(customer_id=1)
+        repo.replace_daily_nursings(record_id=100, record=sample_record)
         repo.get_customer_records(customer_id=1)
 
-        query = mock_execute_query.call_args[0][0]
-        assert 'DESC' in query.upper()
+        assert mock_execute_query_sets.call_count == 3
+
+    def test_save_parsed_data_invalidates_saved_customers(self, repo, mock_execute_query_sets, sample_record):
+        """일괄 저장한 대상자의 기록 캐시 제거"""
+        repo.get_customer_records(customer_id=1)
+
+        with patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+             patch.object(repo, '_process_batch', return_value=1):
+            repo.save_parsed_data([sample_record])
+        repo.get_customer_records(customer_id=1)
+
+        assert mock_execute_query_sets.call_count == 2
+
+    # ========== get_customer_records_rows 테스트 ==========
+
+    def test_get_customer_records_rows_from_split_fetch(self, repo, mock_execute_query_sets):
+        """분할 조회 결과를 DailyRecordRow로 변환 (하위 기록이 없는 필드는 None)"""
+        mock_execute_query_sets.return_value = [
+            [{'record_id': 1, 'date': date(2024, 1, 15), 'total_service_time': '8시간'}],
+            [{'record_id': 1, 'physical_note': '정상', 'meal_lunch': '일반식'}], [], [], []
+        ]
+
+        rows = repo.get_customer_records_rows(customer_id=1, start_date=date(2024, 1, 1), end_date=date(2024, 1, 31))
+
+        assert len(rows) == 1
+        assert isinstance(rows[0], DailyRecordRow)
+        assert rows[0].physical_note == '정상'
+        assert rows[0].meal_lunch == '일반식'
+        assert rows[0].cognitive_note is None
+        assert mock_execute_query_sets.call_args[0][1] == (1, date(2024, 1, 1), date(2024, 1, 31)) * 5
+
+    def test_get_customer_records_rows_shares_cache(self, repo, mock_execute_query_sets):
+        """get_customer_records와 같은 캐시를 써서 같은 대상자/기간은 DB를 다시 조회하지 않음"""
+        mock_execute_query_sets.return_value = [[{'record_id': 1}], [], [], [], []]
+
+        repo.get_customer_records(customer_id=1)
+        rows = repo.get_customer_records_rows(customer_id=1)
+
+        assert mock_execute_query_sets.call_count == 1
+        assert [row.record_id for row in rows] == [1]
+
+    def test_daily_record_row_fields_cover_split_columns(self):
+        """분할 조회 컬럼(별칭)은 모두 DailyRecordRow 필드"""
+        query, _ = DailyInfoRepository._customer_records_split_query(1, None, None)
+        columns = set()
+        for statement in query.split('; '):
+            select_list = statement.split('SELECT', 1)[1].split('FROM', 1)[0]
+            columns.update(c.strip().split()[-1] for c in select_list.split(','))
+
+        assert columns == set(DailyRecordRow._fields)
+
+    # ========== DailyRecord 테스트 ==========
+
+    def test_daily_record_fields_match_write_keys(self):
+        """DailyRecord 필드는 date + daily_infos 키 + 하위 테이블 레코드 키 순서"""
+        expected = ('date', *daily_info_module._DAILY_INFO_RECORD_KEYS, *(
+            key for child in daily_info_module._CHILD_TABLES for key in child.record_keys
+        ))
+
+        assert DailyRecord._fields == expected
+
+    def test_daily_record_from_dict_fills_missing_keys(self, sample_record):
+        """파싱 결과 딕셔너리에서 생성, 저장 대상이 아닌 키는 무시하고 빠진 키는 None"""
+        record = DailyRecord.from_dict(sample_record)
+        partial = DailyRecord.from_dict({'date': date(2024, 1, 15), 'bp_temp': '120/80'})
+
+        assert record.physical_note == sample_record['physical_note']
+        assert record.date == sample_record['date']
+        assert partial.bp_temp == '120/80'
+        assert partial.writer_phy is None
 
     # ========== get_record_by_customer_and_date 테스트 ==========
 
-    def test_get_record_by_customer_and_date_exists(self, repo, mock_execute_query_one):
+    def test_get_record_by_customer_and_date_exists(self, repo, mock_fast_one):
         """특정 날짜의 레코드 조회"""
-        mock_execute_query_one.return_value = {'record_id': 55}
+        mock_fast_one.return_value = {'record_id': 55}
 
         result = repo.get_record_by_customer_and_date(
             customer_id=1,
@@ -248,9 +402,9 @@ class TestDailyInfoRepository:
 
         assert result == 55
 
-    def test_get_record_by_customer_and_date_not_exists(self, repo, mock_execute_query_one):
+    def test_get_record_by_customer_and_date_not_exists(self, repo, mock_fast_one):
         """해당 날짜에 레코드가 없을 때 None 반환"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
 
         result = repo.get_record_by_customer_and_date(
             customer_id=1,
@@ -325,13 +479,11 @@ class TestDailyInfoRepository:
     def test_save_parsed_data_calls_bulk_methods(self, repo, sample_record):
         """save_parsed_data가 bulk 메서드를 호출하는지 확인"""
         with patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}) as mock_bulk_customers, \
-             patch.object(repo, '_bulk_find_existing_records', return_value={}) as mock_bulk_records, \
              patch.object(repo, '_process_batch', return_value=1) as mock_batch:
 
             result = repo.save_parsed_data(records=[sample_record])
 
             mock_bulk_customers.assert_called_once()
-            mock_bulk_records.assert_called_once()
             mock_batch.assert_called_once()
             assert result == 1
 
@@ -346,7 +498,6 @@ class TestDailyInfoRepository:
         ]
 
         with patch.object(repo, '_bulk_get_or_create_customers', return_value={f'고객{i}': i + 1 for i in range(25)}), \
-             patch.object(repo, '_bulk_find_existing_records', return_value={}), \
              patch.object(repo, '_process_batch', return_value=20) as mock_batch:
 
             result = repo.save_parsed_data(records=records, batch_size=20)
@@ -354,58 +505,199 @@ class TestDailyInfoRepository:
             # 25개 레코드를 20씩 처리하면 2번 배치
             assert mock_batch.call_count == 2
 
-    # ========== replace_daily_physicals 테스트 ==========
+    def test_save_parsed_data_keeps_customer_rows_in_one_batch(self, repo):
+        """같은 대상자의 기록은 한 배치에 입력 순서대로 모여 배치끼리 키가 겹치지 않음"""
+        records = [
+            {'customer_name': name, 'date': date(2024, 1, day)}
+            for name, day in [('가', 1), ('나', 1), ('가', 2), ('다', 1), ('가', 3)]
+        ]
 
-    def _make_mock_cursor(self):
-        """쿼리 기록용 mock cursor 생성"""
-        mock_cursor = MagicMock()
-        executed_queries = []
-        mock_cursor.execute.side_effect = lambda q, *args: executed_queries.append(q)
-        mock_cursor._executed = executed_queries
-        return mock_cursor
+        with patch.object(repo, '_bulk_get_or_create_customers', return_value={'가': 1, '나': 2, '다': 3}), \
+             patch.object(repo, '_process_batch', side_effect=len) as mock_batch:
+            result = repo.save_parsed_data(records=records, batch_size=3)
+
+        assert result == 5
+        batches = sorted(
+            [(cid, r.date.day) for cid, r in c[0][0]] for c in mock_batch.call_args_list
+        )
+        assert batches == [[(1, 1), (1, 2), (1, 3)], [(2, 1), (3, 1)]]
+
+    def test_save_parsed_data_retries_deadlocked_batch_once(self, repo):
+        """병렬 배치가 교착 상태로 롤백되면 그 배치만 한 번 다시 저장"""
+        import mysql.connector
+        records = [{'customer_name': f'고객{i}', 'date': date(2024, 1, 1)} for i in range(2)]
+        calls = []
+
+        def _batch(targets):
+            calls.append(targets[0][0])
+            if calls.count(1) == 1 and targets[0][0] == 1:
+                raise mysql.connector.Error(errno=1213)
+            return len(targets)
+
+        with patch.object(repo, '_bulk_get_or_create_customers', return_value={'고객0': 1, '고객1': 2}), \
+             patch.object(repo, '_process_batch', side_effect=_batch):
+            result = repo.save_parsed_data(records=records, batch_size=1)
+
+        assert result == 2
+        assert sorted(calls) == [1, 1, 2]
+
+    def test_save_parsed_data_bulk_loads_over_threshold(self, repo, sample_record):
+        """BULK_LOAD_THRESHOLD를 넘으면 배치 대신 LOAD DATA 경로 1회로 저장"""
+        records = [dict(sample_record), dict(sample_record, date=date(2024, 1, 16))]
+
+        with patch.object(daily_info_module, 'BULK_LOAD_THRESHOLD', 1), \
+             patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+             patch.object(repo, '_bulk_load_records', return_value=2) as mock_load, \
+             patch.object(repo, '_process_batch') as mock_batch:
+            result = repo.save_parsed_data(records)
+
+        assert result == 2
+        targets = mock_load.call_args[0][0]
+        assert [(cid, r.date) for cid, r in targets] == [(1, date(2024, 1, 15)), (1, date(2024, 1, 16))]
+        mock_batch.assert_not_called()
+
+    def test_save_parsed_data_falls_back_to_batches_without_local_infile(self, repo, sample_record):
+        """서버가 LOCAL INFILE을 허용하지 않으면(None) 배치 처리로 저장"""
+        records = [dict(sample_record), dict(sample_record, date=date(2024, 1, 16))]
+
+        with patch.object(daily_info_module, 'BULK_LOAD_THRESHOLD', 1), \
+             patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+             patch.object(repo, '_bulk_load_records', return_value=None), \
+             patch.object(repo, '_process_batch', return_value=2) as mock_batch:
+            result = repo.save_parsed_data(records)
+
+        assert result == 2
+        mock_batch.assert_called_once()
+
+    def test_save_parsed_data_counts_duplicates_once_on_every_path(self, repo, sample_record):
+        """같은 입력이면 프로시저/LOAD DATA 경로 모두 중복 키를 뺀 같은 저장 수 반환"""
+        records = [
+            dict(sample_record), dict(sample_record, physical_note='수정'),
+            dict(sample_record, date=date(2024, 1, 16)),
+        ]
+        cursor = MagicMock()
+
+        def _execute(query, params=()):
+            if 'LOAD DATA LOCAL INFILE' in query:
+                with open(params[0], encoding='utf-8', newline='') as f:
+                    cursor.rowcount = f.read().count('\n')
+        cursor.execute.side_effect = _execute
 
-    def _mock_transaction_ctx(self, mock_cursor):
-        """db_transaction 컨텍스트 매니저 mock 생성"""
         @contextmanager
-        def _ctx(dictionary=False):
-            yield mock_cursor
-        return _ctx
+        def _mock_tx(dictionary=False, local_infile=False):
+            yield cursor
+
+        counts = []
+        for threshold in (len(records), 1):
+            with patch.object(daily_info_module, 'BULK_LOAD_THRESHOLD', threshold), \
+                 patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+                 patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+                counts.append(repo.save_parsed_data([dict(r) for r in records]))
+
+        cursor.callproc.assert_called_once()
+        assert counts == [2, 2]
+
+    # ========== save_parsed_data_columnar 테스트 ==========
+
+    def test_save_parsed_data_columnar_transposes_once(self, repo):
+        """열 목록을 DailyRecord로 전치해 저장하고, 대상자는 이름별 첫 행 정보로 조회/생성"""
+        columns = {
+            'customer_name': ['홍길동', '김철수', '홍길동'],
+            'customer_grade': ['3등급', '2등급', '1등급'],
+            'date': [date(2024, 1, 15), date(2024, 1, 15), date(2024, 1, 16)],
+            'bp_temp': ['120/80', None, '130/85'],
+        }
+
+        with patch.object(repo, '_bulk_get_or_create_customers',
+                          return_value={'홍길동': 1, '김철수': 2}) as mock_customers, \
+             patch.object(repo, '_process_batch', side_effect=len) as mock_batch:
+            result = repo.save_parsed_data_columnar(columns, batch_size=2)
+
+        assert result == 3
+        (customer_meta,) = mock_customers.call_args[0]
+        assert customer_meta == {'홍길동': (None, '3등급', None), '김철수': (None, '2등급', None)}
+        saved = [target for c in mock_batch.call_args_list for target in c[0][0]]
+        assert sorted((cid, r.date, r.bp_temp or '') for cid, r in saved) == [
+            (1, date(2024, 1, 15), '120/80'), (1, date(2024, 1, 16), '130/85'), (2, date(2024, 1, 15), '')
+        ]
+        assert saved[0][1].physical_note is None
+
+    def test_save_parsed_data_columnar_matches_dict_api(self, repo, sample_record):
+        """딕셔너리 API와 같은 DailyRecord로 저장"""
+        columns = {key: [value] for key, value in sample_record.items()}
+
+        with patch.object(repo, '_bulk_get_or_create_customers', return_value={'홍길동': 1}), \
+             patch.object(repo, '_process_batch', return_value=1) as mock_batch:
+            repo.save_parsed_data_columnar(columns)
+            repo.save_parsed_data([dict(sample_record)])
+
+        columnar_targets, dict_targets = (c[0][0] for c in mock_batch.call_args_list)
+        assert columnar_targets == dict_targets
+
+    def test_save_parsed_data_columnar_empty(self, repo):
+        """행이 없으면 DB 접근 없이 0 반환"""
+        with patch.object(repo, '_bulk_get_or_create_customers') as mock_customers:
+            assert repo.save_parsed_data_columnar({'customer_name': []}) == 0
 
-    def test_replace_daily_physicals_deletes_then_inserts(self, repo, sample_record):
-        """기존 데이터 삭제 후 새 데이터 삽입"""
-        cursor = self._make_mock_cursor()
-        with patch('modules.repositories.daily_info.db_transaction', self._mock_transaction_ctx(cursor)):
-            repo.replace_daily_physicals(record_id=100, record=sample_record)
+        mock_customers.assert_not_called()
 
-        assert any('DELETE' in q.upper() and 'daily_physicals' in q for q in cursor._executed)
-        assert any('INSERT' in q.upper() and 'daily_physicals' in q for q in cursor._executed)
+    # ========== replace_daily_* 테스트 ==========
 
-    def test_replace_daily_cognitives_deletes_then_inserts(self, repo, sample_record):
-        """인지 데이터 교체: 삭제 후 삽입"""
-        cursor = self._make_mock_cursor()
-        with patch('modules.repositories.daily_info.db_transaction', self._mock_transaction_ctx(cursor)):
-            repo.replace_daily_cognitives(record_id=100, record=sample_record)
+    @pytest.mark.parametrize('method, table', [
+        ('replace_daily_physicals', 'daily_physicals'),
+        ('replace_daily_cognitives', 'daily_cognitives'),
+        ('replace_daily_nursings', 'daily_nursings'),
+        ('replace_daily_recoveries', 'daily_recoveries'),
+    ])
+    def test_replace_daily_child_single_upsert(self, repo, mock_execute_transaction, sample_record,
+                                               method, table):
+        """DELETE 없이 INSERT ... ON DUPLICATE KEY UPDATE 1문장으로 교체"""
+        getattr(repo, method)(record_id=100, record=sample_record)
 
-        assert any('DELETE' in q.upper() and 'daily_cognitives' in q for q in cursor._executed)
-        assert any('INSERT' in q.upper() and 'daily_cognitives' in q for q in cursor._executed)
+        mock_execute_transaction.assert_called_once()
+        query, params = mock_execute_transaction.call_args[0]
+        assert f'INSERT INTO {table}' in query
+        assert 'ON DUPLICATE KEY UPDATE' in query
+        assert 'DELETE' not in query.upper()
+        assert params[0] == 100
 
-    def test_replace_daily_nursings_deletes_then_inserts(self, repo, sample_record):
-        """간호 데이터 교체: 삭제 후 삽입"""
-        cursor = self._make_mock_cursor()
-        with patch('modules.repositories.daily_info.db_transaction', self._mock_transaction_ctx(cursor)):
-            repo.replace_daily_nursings(record_id=100, record=sample_record)
+    def test_replace_daily_physicals_maps_record_keys(self, repo, mock_execute_transaction, sample_record):
+        """레코드 키가 컬럼 순서대로 매핑됨 (physical_note → note, writer_phy → writer_name)"""
+        repo.replace_daily_physicals(record_id=100, record=sample_record)
 
-        assert any('DELETE' in q.upper() and 'daily_nursings' in q for q in cursor._executed)
-        assert any('INSERT' in q.upper() and 'daily_nursings' in q for q in cursor._executed)
+        params = mock_execute_transaction.call_args[0][1]
+        assert params[1] == sample_record['hygiene_care']
+        assert params[-2:] == (sample_record['physical_note'], sample_record['writer_phy'])
 
-    def test_replace_daily_recoveries_deletes_then_inserts(self, repo, sample_record):
-        """기능회복 데이터 교체: 삭제 후 삽입"""
-        cursor = self._make_mock_cursor()
-        with patch('modules.repositories.daily_info.db_transaction', self._mock_transaction_ctx(cursor)):
-            repo.replace_daily_recoveries(record_id=100, record=sample_record)
+    def test_replace_daily_physicals_missing_keys_become_none(self, repo, mock_execute_transaction):
+        """일부 키만 있는 레코드도 빠진 컬럼은 None으로 채움"""
+        repo.replace_daily_physicals(record_id=100, record={'bath_time': '10:00', 'writer_phy': '홍담당'})
 
-        assert any('DELETE' in q.upper() and 'daily_recoveries' in q for q in cursor._executed)
-        assert any('INSERT' in q.upper() and 'daily_recoveries' in q for q in cursor._executed)
+        params = mock_execute_transaction.call_args[0][1]
+        assert params == (100, None, '10:00', None, None, None, None, None, None, None, '홍담당')
+
+
+    def test_replace_daily_child_deletes_when_all_fields_empty(self, repo, mock_execute_transaction):
+        """하위 항목 값이 모두 None이면 빈 행을 UPSERT하지 않고 기존 행만 삭제"""
+        repo.replace_daily_cognitives(record_id=100, record={'bp_temp': '120/80', 'physical_note': '정상'})
+
+        query, params = mock_execute_transaction.call_args[0]
+        assert query == "DELETE FROM daily_cognitives WHERE record_id = %s"
+        assert params == (100,)
+
+    def test_replace_daily_child_reuses_prebuilt_query(self, repo, mock_execute_transaction, sample_record):
+        """호출마다 SQL을 새로 만들지 않고 테이블 명세의 쿼리 문자열을 그대로 사용"""
+        repo.replace_daily_nursings(record_id=100, record=sample_record)
+        repo.replace_daily_nursings(record_id=101, record=sample_record)
+
+        first, second = (c[0][0] for c in mock_execute_transaction.call_args_list)
+        assert first is second is daily_info_module._NURSINGS.upsert_query
+
+    def test_replace_daily_child_keeps_empty_string(self, repo, mock_execute_transaction):
+        """빈 문자열은 값으로 보고 UPSERT"""
+        repo.replace_daily_cognitives(record_id=100, record={'cognitive_note': ''})
+
+        assert 'INSERT INTO daily_cognitives' in mock_execute_transaction.call_args[0][0]
 
 
 class TestDailyInfoRepositoryHelpers:
@@ -417,15 +709,23 @@ class TestDailyInfoRepositoryHelpers:
 
     def test_bulk_get_or_create_customers_empty_names(self, repo):
         """고객명이 없으면 빈 딕셔너리 반환"""
-        result = repo._bulk_get_or_create_customers(records=[], customer_names=[])
+        result = repo._bulk_get_or_create_customers({})
 
         assert result == {}
 
-    def test_bulk_find_existing_records_empty_customer_map(self, repo):
-        """고객 맵이 비어있으면 빈 딕셔너리 반환"""
-        result = repo._bulk_find_existing_records(customer_map={}, records=[])
+    def test_customer_meta_by_name_keeps_first_record(self):
+        """이름별 첫 레코드의 대상자 정보만 한 번의 순회로 수집"""
+        records = [
+            {"customer_name": "가", "customer_birth_date": "1950-01-01", "customer_grade": "1등급"},
+            {"customer_name": None},
+            {"customer_name": "가", "customer_grade": "무시"},
+            {"customer_name": "나", "customer_recognition_no": "L002"},
+        ]
 
-        assert result == {}
+        assert daily_info_module._customer_meta_by_name(records) == {
+            "가": ("1950-01-01", "1등급", None),
+            "나": (None, None, "L002"),
+        }
 
     # ========== _bulk_get_or_create_customers (DB 호출) ==========
 
@@ -439,11 +739,7 @@ class TestDailyInfoRepositoryHelpers:
             yield mock_cursor
 
         with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
-            result = repo._bulk_get_or_create_customers(
-                records=[{"customer_name": "홍길동", "customer_birth_date": "1950-01-01",
-                          "customer_grade": "3등급", "customer_recognition_no": "L001"}],
-                customer_names=["홍길동"]
-            )
+            result = repo._bulk_get_or_create_customers({"홍길동": ("1950-01-01", "3등급", "L001")})
         # 쿼리가 실행되었는지 확인
         assert mock_cursor.execute.called
 
@@ -465,169 +761,312 @@ class TestDailyInfoRepositoryHelpers:
         }]
 
         with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
-            result = repo._bulk_get_or_create_customers(records, ["신규고객"])
+            result = repo._bulk_get_or_create_customers(daily_info_module._customer_meta_by_name(records))
 
         # INSERT 쿼리가 실행되었는지 확인
         executed = [call[0][0] for call in mock_cursor.execute.call_args_list]
         assert any("INSERT" in q.upper() for q in executed)
 
-    # ========== _bulk_find_existing_records (DB 호출) ==========
-
-    def test_bulk_find_existing_records_with_existing(self, repo):
-        """기존 레코드가 있으면 (customer_id, date) 키로 record_id 반환"""
+    def test_bulk_get_or_create_customers_single_insert_for_new(self, repo):
+        """신규 고객은 이름 중복 없이 다중 행 INSERT 1문장으로 생성하고 ID는 이름으로 다시 조회
+        (auto_increment_increment가 1이 아니어도 연속 ID를 가정하지 않음)"""
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [
-            {'customer_id': 1, 'date': date(2024, 1, 15), 'record_id': 100}
-        ]
+        # 1차 조회: 기존 고객 없음 / INSERT 후 재조회: 간격이 2인 ID
+        mock_cursor.fetchall.side_effect = [[], [(50, "가"), (52, "나")]]
 
         @contextmanager
-        def _mock_query(dictionary=True):
+        def _mock_tx(dictionary=False):
             yield mock_cursor
 
-        customer_map = {"홍길동": 1}
-        records = [{"customer_name": "홍길동", "date": date(2024, 1, 15)}]
-
-        with patch('modules.repositories.daily_info.db_query', _mock_query):
-            result = repo._bulk_find_existing_records(customer_map, records)
+        records = [
+            {"customer_name": "가"}, {"customer_name": "나"}, {"customer_name": "가"}
+        ]
 
-        assert (1, "2024-01-15") in result
-        assert result[(1, "2024-01-15")] == 100
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            result = repo._bulk_get_or_create_customers(daily_info_module._customer_meta_by_name(records))
+
+        inserts = [c for c in mock_cursor.execute.call_args_list if "INSERT" in c[0][0].upper()]
+        assert len(inserts) == 1
+        assert inserts[0][0][0].count("(%s, %s, %s, %s)") == 2
+        reselect_query, reselect_params = mock_cursor.execute.call_args_list[-1][0]
+        assert "SELECT customer_id, name FROM customers" in reselect_query
+        assert reselect_params == ("가", "나")
+        assert result == {"가": 50, "나": 52}
+
+    def test_bulk_resolve_customers_refreshes_existing_in_one_upsert(self, repo):
+        """기존 고객은 행별 UPDATE 대신 PK 기준 다중 행 upsert 1문장으로 갱신"""
+        cursor = MagicMock()
+        # 동명이인은 ORDER BY customer_id로 가장 최근 고객이 마지막에 덮어씀
+        cursor.fetchall.return_value = [(1, "가"), (3, "가"), (2, "나")]
 
-    def test_bulk_find_existing_records_no_matching_records(self, repo):
-        """레코드가 없으면 빈 딕셔너리 반환"""
+        records = [
+            {"customer_name": "가", "customer_grade": "1등급"},
+            {"customer_name": "나", "customer_grade": "2등급"},
+            {"customer_name": "가", "customer_grade": "무시"},
+        ]
+        result = repo._bulk_resolve_customers(cursor, daily_info_module._customer_meta_by_name(records))
+
+        assert result == {"가": 3, "나": 2}
+        assert cursor.execute.call_count == 2
+        select_query = cursor.execute.call_args_list[0][0][0]
+        assert "ORDER BY customer_id" in select_query
+        upsert_query, upsert_params = cursor.execute.call_args_list[1][0]
+        assert "ON DUPLICATE KEY UPDATE" in upsert_query
+        # PDF에 없는(NULL) 항목은 기존 값을 유지
+        for col in ("birth_date", "grade", "recognition_no"):
+            assert f"{col} = COALESCE(VALUES({col}), {col})" in upsert_query
+        assert upsert_query.count("(%s, %s, %s, %s, %s)") == 2
+        assert upsert_params == (3, "가", None, "1등급", None, 2, "나", None, "2등급", None)
+
+    def test_bulk_get_or_create_customers_evicts_process_cache(self, repo):
+        """갱신된 고객은 프로세스 전역 캐시에서 제거"""
+        from modules.repositories import customer as customer_module
+        customer_module._customer_cache.set(7, {"customer_id": 7})
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchall.return_value = [(7, "홍길동")]
 
         @contextmanager
-        def _mock_query(dictionary=True):
+        def _mock_tx(dictionary=False):
             yield mock_cursor
 
-        customer_map = {"홍길동": 1}
-        records = [{"customer_name": "홍길동", "date": date(2024, 1, 15)}]
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            repo._bulk_get_or_create_customers({"홍길동": (None, None, None)})
 
-        with patch('modules.repositories.daily_info.db_query', _mock_query):
-            result = repo._bulk_find_existing_records(customer_map, records)
+        assert customer_module._customer_cache.get(7) is None
 
-        assert result == {}
+    # ========== _process_batch (저장 프로시저 호출) ==========
 
-    def test_bulk_find_existing_records_name_not_in_map(self, repo):
-        """고객 맵에 없는 이름은 건너뜀"""
-        customer_map = {"홍길동": 1}
-        records = [{"customer_name": "없는사람", "date": date(2024, 1, 15)}]
+    @staticmethod
+    def _mock_tx_ctx(cursor):
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+        return _mock_tx
 
-        result = repo._bulk_find_existing_records(customer_map, records)
-        assert result == {}
+    def test_process_batch_calls_procedure_once(self, repo):
+        """배치 전체를 save_daily_batch 프로시저 호출 1회로 저장"""
+        cursor = MagicMock()
+        batch = [
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": "기존"})),
+            (2, DailyRecord.from_dict({"date": date(2024, 1, 16), "start_time": time(9, 0)})),
+        ]
 
-    # ========== _process_batch (신규/기존 레코드 처리) ==========
+        with patch('modules.repositories.daily_info.db_transaction', self._mock_tx_ctx(cursor)):
+            count = repo._process_batch(batch)
+
+        assert count == 2
+        cursor.callproc.assert_called_once()
+        cursor.execute.assert_not_called()
+        cursor.executemany.assert_not_called()
+        name, (payload,) = cursor.callproc.call_args[0]
+        assert name == "save_daily_batch"
+        rows = json.loads(payload)
+        assert [(r["customer_id"], r["date"]) for r in rows] == [(1, "2024-01-15"), (2, "2024-01-16")]
+        assert rows[0]["physical_note"] == "기존"
+        assert rows[1]["start_time"] == "09:00:00"
+        # 빠진 키는 null로 채워 프로시저의 JSON_TABLE 컬럼이 NULL이 되도록 함
+        assert rows[0]["writer_phy"] is None
+
+    def test_process_batch_dedupes_payload_last_wins(self, repo):
+        """같은 (customer_id, date)가 중복되면 payload에는 마지막 항목만 (하위 값이 빈 항목이 앞 항목의 하위 행을 지우지 않도록)"""
+        cursor = MagicMock()
+        batch = [
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 15)})),
+            (1, DailyRecord.from_dict({"date": "2024-01-15", "physical_note": "마지막"})),
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 16), "physical_note": "앞"})),
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 16)})),
+        ]
+
+        with patch('modules.repositories.daily_info.db_transaction', self._mock_tx_ctx(cursor)):
+            count = repo._process_batch(batch)
 
-    def _make_mock_cursor_with_queries(self):
+        assert count == 2
+        rows = json.loads(cursor.callproc.call_args[0][1][0])
+        assert [(r["date"], r["physical_note"]) for r in rows] == [("2024-01-15", "마지막"), ("2024-01-16", None)]
+
+    def test_process_batch_payload_keys_match_procedure(self, repo):
+        """payload 키는 daily_infos와 하위 테이블 레코드 키 전체 (현재 프로시저 migrations/009 JSON_TABLE 경로와 동일)"""
         cursor = MagicMock()
-        queries = []
-        cursor.execute.side_effect = lambda q, *a: queries.append(q)
-        cursor._queries = queries
-        return cursor
 
-    def test_process_batch_inserts_new_record(self, repo):
-        """새 레코드는 INSERT 쿼리를 실행"""
-        cursor = self._make_mock_cursor_with_queries()
-        cursor.lastrowid = 101
+        with patch('modules.repositories.daily_info.db_transaction', self._mock_tx_ctx(cursor)):
+            repo._process_batch([(1, DailyRecord.from_dict({"date": date(2024, 1, 15)}))])
+
+        row = json.loads(cursor.callproc.call_args[0][1][0])[0]
+        with open(MIGRATIONS_DIR / "009_save_daily_batch_keep_foreign_key_checks.sql", encoding="utf-8") as f:
+            procedure = f.read()
+        for key in row:
+            assert f"'$.{key}'" in procedure
+
+    def test_save_daily_batch_procedure_keeps_foreign_key_checks(self):
+        """현재 프로시저는 foreign_key_checks를 끄지 않고 InnoDB FK 검증을 그대로 받는다"""
+        with open(MIGRATIONS_DIR / "009_save_daily_batch_keep_foreign_key_checks.sql", encoding="utf-8") as f:
+            procedure = f.read()
+        statements = "\n".join(line for line in procedure.splitlines() if not line.startswith("--"))
+        assert "foreign_key_checks" not in statements
+
+    def test_process_batch_falls_back_when_procedure_missing(self, repo):
+        """프로시저가 없으면(1305) UNIQUE 키 없이 조회 후 UPDATE/INSERT, 하위 테이블은 삭제 후 삽입"""
+        import mysql.connector
+        proc_cursor = MagicMock()
+        proc_cursor.callproc.side_effect = mysql.connector.errors.ProgrammingError(
+            msg="PROCEDURE save_daily_batch does not exist", errno=1305
+        )
+        cursor = MagicMock()
+        # 1차 조회: 기존 기록 1건 / 2차 조회(신규 INSERT 후): 전체 키
+        cursor.fetchall.side_effect = [
+            [(10, 1, date(2024, 1, 15))],
+            [(10, 1, date(2024, 1, 15)), (11, 2, date(2024, 1, 16))],
+        ]
+        cursors = iter([proc_cursor, cursor])
 
         @contextmanager
         def _mock_tx(dictionary=False):
-            yield cursor
+            yield next(cursors)
 
-        record = {
-            "customer_name": "홍길동", "date": date(2024, 1, 15),
-            "start_time": "09:00", "end_time": "17:00",
-            "total_service_time": "480분", "transport_service": "제공",
-            "transport_vehicles": "12가3456",
-        }
-        customer_map = {"홍길동": 1}
-        existing_records = {}  # 기존 레코드 없음
+        batch = [
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": "이전 값"})),
+            (1, DailyRecord.from_dict({"date": "2024-01-15", "physical_note": "기존"})),
+            (2, DailyRecord.from_dict({"date": date(2024, 1, 16), "bp_temp": "120/80"})),
+        ]
 
         with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
-            count = repo._process_batch([record], customer_map, existing_records)
+            count = repo._process_batch(batch)
+
+        assert count == 2
+        update_query, update_rows = cursor.executemany.call_args[0]
+        assert "UPDATE daily_infos" in update_query
+        assert [row[-1] for row in update_rows] == [10]
+        queries = [c[0] for c in cursor.execute.call_args_list]
+        insert_info = [q for q in queries if "INSERT INTO daily_infos" in q[0]]
+        assert len(insert_info) == 1 and "ON DUPLICATE KEY" not in insert_info[0][0]
+        assert insert_info[0][1][:2] == (2, date(2024, 1, 16))
+        physical = [q for q in queries if "INSERT INTO daily_physicals" in q[0]][0]
+        # 같은 날짜가 중복되면 마지막 값만 저장
+        assert physical[1][0] == 10 and "기존" in physical[1]
+        nursing = [q for q in queries if "INSERT INTO daily_nursings" in q[0]][0]
+        assert nursing[1][0] == 11
+        deletes = [q for q in queries if q[0].startswith("DELETE FROM")]
+        assert len(deletes) == 4 and all(q[1] == (10, 11) for q in deletes)
+        assert not any("daily_cognitives" in q[0] and "INSERT" in q[0] for q in queries)
+
+    def test_process_batch_empty(self, repo):
+        """저장 대상이 없으면 DB 호출 없이 0 반환"""
+        with patch('modules.repositories.daily_info.db_transaction') as mock_tx:
+            count = repo._process_batch([])
 
-        assert count == 1
-        assert any("INSERT" in q.upper() and "daily_infos" in q for q in cursor._queries)
+        assert count == 0
+        mock_tx.assert_not_called()
+
+    def test_save_targets_skips_unknown_customer(self, repo):
+        """고객 맵에 없는 레코드는 제외하고, 원본 딕셔너리에 customer_id 기록"""
+        records = [
+            {"customer_name": "홍길동", "date": date(2024, 1, 15), "bp_temp": "120/80"},
+            {"customer_name": "알수없는사람", "date": date(2024, 1, 15)},
+        ]
+
+        targets = repo._save_targets(records, {"홍길동": 1})
+
+        assert targets == [(1, DailyRecord.from_dict(records[0]))]
+        assert records[0]["customer_id"] == 1
+        assert "customer_id" not in records[1]
+
+    # ========== _bulk_load_records (LOAD DATA LOCAL INFILE) ==========
 
-    def test_process_batch_updates_existing_record(self, repo):
-        """기존 레코드는 UPDATE 쿼리를 실행"""
-        cursor = self._make_mock_cursor_with_queries()
+    def test_bulk_load_records_stages_csv_and_upserts(self, repo):
+        """임시 테이블에 CSV를 적재하고 daily_infos + 하위 4개 테이블을 INSERT ... SELECT로 반영"""
+        cursor = MagicMock()
+        loaded = {}
+
+        def _execute(query, params=()):
+            cursor.rowcount = -1
+            if 'LOAD DATA LOCAL INFILE' in query:
+                with open(params[0], encoding='utf-8', newline='') as f:
+                    loaded['path'], loaded['csv'] = params[0], f.read()
+                cursor.rowcount = loaded['csv'].count('\n')
+        cursor.execute.side_effect = _execute
+        tx_kwargs = {}
 
         @contextmanager
-        def _mock_tx(dictionary=False):
+        def _mock_tx(dictionary=False, local_infile=False):
+            tx_kwargs['local_infile'] = local_infile
             yield cursor
 
-        record = {
-            "customer_name": "홍길동", "date": date(2024, 1, 15),
-            "start_time": "09:00", "end_time": "17:00",
-            "total_service_time": "480분", "transport_service": "제공",
-            "transport_vehicles": "", "customer_id": 1,
-        }
-        customer_map = {"홍길동": 1}
-        existing_records = {(1, "2024-01-15"): 200}  # 기존 레코드 존재
+        targets = [(1, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": 'a,b "c"\\d'}))]
 
         with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
-            count = repo._process_batch([record], customer_map, existing_records)
+            count = repo._bulk_load_records(targets)
 
+        # 저장 수는 LOAD DATA가 적재한 행 수 (이후 UPSERT의 영향 행 수가 아님)
         assert count == 1
-        assert any("UPDATE" in q.upper() and "daily_infos" in q for q in cursor._queries)
+        assert tx_kwargs['local_infile'] is True
+        queries = [c[0][0] for c in cursor.execute.call_args_list]
+        assert 'CREATE TEMPORARY TABLE' in queries[0]
+        assert 'INSERT INTO daily_infos' in queries[2]
+        # 하위 테이블마다 UPSERT(값이 있는 기록) + DELETE(값이 모두 빈 기록의 예전 행)
+        assert [q.split('INSERT INTO ')[1].split()[0] for q in queries[3::2]] == [
+            'daily_physicals', 'daily_cognitives', 'daily_nursings', 'daily_recoveries'
+        ]
+        assert all('IS NOT NULL' in q for q in queries[3::2])
+        assert [q.split('DELETE t FROM ')[1].split()[0] for q in queries[4::2]] == [
+            'daily_physicals', 'daily_cognitives', 'daily_nursings', 'daily_recoveries'
+        ]
+        fields = loaded['csv'].rstrip('\n').split(',', 3)
+        assert fields[:3] == ['1', '2024-01-15', '\\N']
+        # 역슬래시는 ESCAPED BY 문자이므로 두 번, 따옴표는 CSV 규칙대로 두 번
+        assert '"a,b ""c""\\\\d"' in loaded['csv']
+        assert not os.path.exists(loaded['path'])
+
+    def test_bulk_load_records_keeps_last_duplicate(self, repo):
+        """같은 (customer_id, date) 기록이 여러 번 있으면 CSV에는 마지막 값 1행만 씀"""
+        cursor = MagicMock()
+        loaded = {}
 
-    def test_process_batch_skips_unknown_customer(self, repo):
-        """고객 맵에 없는 레코드는 건너뜀"""
-        cursor = self._make_mock_cursor_with_queries()
+        def _execute(query, params=()):
+            if 'LOAD DATA LOCAL INFILE' in query:
+                with open(params[0], encoding='utf-8', newline='') as f:
+                    loaded['csv'] = f.read()
+                cursor.rowcount = loaded['csv'].count('\n')
+        cursor.execute.side_effect = _execute
 
         @contextmanager
-        def _mock_tx(dictionary=False):
+        def _mock_tx(dictionary=False, local_infile=False):
             yield cursor
 
-        record = {"customer_name": "알수없는사람", "date": date(2024, 1, 15)}
-        customer_map = {}
-        existing_records = {}
+        targets = [
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": "첫번째"})),
+            (2, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": "다른 대상자"})),
+            (1, DailyRecord.from_dict({"date": date(2024, 1, 15), "physical_note": "마지막"})),
+        ]
 
         with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
-            count = repo._process_batch([record], customer_map, existing_records)
+            count = repo._bulk_load_records(targets)
 
-        assert count == 0
+        assert count == 2
+        assert "첫번째" not in loaded['csv']
+        assert "마지막" in loaded['csv']
+        assert "다른 대상자" in loaded['csv']
 
-    # ========== _get_or_create_customer_in_transaction ==========
-
-    def test_get_or_create_customer_existing(self, repo):
-        """기존 고객이 있으면 customer_id 반환, UPDATE 실행"""
+    def test_bulk_load_records_returns_none_when_local_infile_disabled(self, repo):
+        """서버가 LOCAL INFILE을 거부하면 None 반환 (배치 처리 폴백), 임시 파일은 삭제"""
+        import mysql.connector
         cursor = MagicMock()
-        cursor.fetchone.return_value = (42,)  # 기존 customer_id
-
-        record = {
-            "customer_name": "홍길동",
-            "customer_birth_date": "1950-01-01",
-            "customer_grade": "3등급",
-            "customer_recognition_no": "L001"
-        }
-        result = repo._get_or_create_customer_in_transaction(cursor, record)
+        paths = []
 
-        assert result == 42
-        # UPDATE 쿼리가 실행되었는지 확인
-        executed = [call[0][0] for call in cursor.execute.call_args_list]
-        assert any("UPDATE" in q.upper() for q in executed)
+        def _execute(query, params=()):
+            if 'LOAD DATA LOCAL INFILE' in query:
+                paths.append(params[0])
+                raise mysql.connector.errors.DatabaseError(msg="Loading local data is disabled", errno=3948)
+        cursor.execute.side_effect = _execute
 
-    def test_get_or_create_customer_new(self, repo):
-        """기존 고객이 없으면 INSERT 실행, lastrowid 반환"""
-        cursor = MagicMock()
-        cursor.fetchone.return_value = None  # 기존 고객 없음
-        cursor.lastrowid = 99
+        @contextmanager
+        def _mock_tx(dictionary=False, local_infile=False):
+            yield cursor
 
-        record = {
-            "customer_name": "신규고객",
-            "customer_birth_date": "1960-01-01",
-            "customer_grade": "2등급",
-            "customer_recognition_no": "L999"
-        }
-        result = repo._get_or_create_customer_in_transaction(cursor, record)
+        with patch('modules.repositories.daily_info.db_transaction', _mock_tx):
+            result = repo._bulk_load_records([(1, DailyRecord.from_dict({"date": date(2024, 1, 15)}))])
 
-        assert result == 99
-        executed = [call[0][0] for call in cursor.execute.call_args_list]
-        assert any("INSERT" in q.upper() for q in executed)
+        assert result is None
+        assert not os.path.exists(paths[0])
 
     # ========== _delete_daily_record_in_transaction ==========
 
@@ -645,44 +1084,29 @@ class TestDailyInfoRepositoryHelpers:
         assert any("daily_recoveries" in q for q in queries)
         assert any("daily_infos" in q for q in queries)
 
-    # ========== _insert_*_in_transaction 헬퍼 메서드 ==========
+    # ========== _bulk_delete_records ==========
 
-    def test_insert_physicals_in_transaction(self, repo):
-        """physicals INSERT 쿼리 실행 확인"""
+    def test_bulk_delete_records_single_multi_statement(self, repo):
+        """기록 수와 무관하게 테이블당 DELETE ... IN 1문장, 5문장을 한 번에 실행하고 결과를 모두 소비"""
         cursor = MagicMock()
-        record = {"hygiene_care": "완료", "bath_time": "없음", "physical_note": "이상없음"}
-        repo._insert_physicals_in_transaction(cursor, 100, record)
 
-        query = cursor.execute.call_args[0][0]
-        assert "INSERT" in query.upper()
-        assert "daily_physicals" in query
+        repo._bulk_delete_records(cursor, [100, 101, 102])
 
-    def test_insert_cognitives_in_transaction(self, repo):
-        """cognitives INSERT 쿼리 실행 확인"""
-        cursor = MagicMock()
-        record = {"cog_support": "완료", "comm_support": "완료", "cognitive_note": ""}
-        repo._insert_cognitives_in_transaction(cursor, 100, record)
-
-        query = cursor.execute.call_args[0][0]
-        assert "INSERT" in query.upper()
-        assert "daily_cognitives" in query
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        statements = query.split('; ')
+        assert [q.split()[2] for q in statements] == [
+            "daily_physicals", "daily_cognitives", "daily_nursings",
+            "daily_recoveries", "daily_infos"
+        ]
+        assert all("IN (%s, %s, %s)" in q for q in statements)
+        assert params == (100, 101, 102) * 5
+        cursor.fetchsets.assert_called_once()
 
-    def test_insert_nursings_in_transaction(self, repo):
-        """nursings INSERT 쿼리 실행 확인"""
+    def test_bulk_delete_records_empty_skips(self, repo):
+        """삭제할 기록이 없으면 쿼리를 실행하지 않음"""
         cursor = MagicMock()
-        record = {"bp_temp": "120/80", "health_manage": "완료", "nursing_note": ""}
-        repo._insert_nursings_in_transaction(cursor, 100, record)
 
-        query = cursor.execute.call_args[0][0]
-        assert "INSERT" in query.upper()
-        assert "daily_nursings" in query
-
-    def test_insert_recoveries_in_transaction(self, repo):
-        """recoveries INSERT 쿼리 실행 확인"""
-        cursor = MagicMock()
-        record = {"prog_basic": "완료", "prog_activity": "완료", "functional_note": ""}
-        repo._insert_recoveries_in_transaction(cursor, 100, record)
+        repo._bulk_delete_records(cursor, [])
 
-        query = cursor.execute.call_args[0][0]
-        assert "INSERT" in query.upper()
-        assert "daily_recoveries" in query
+        cursor.execute.assert_not_called()
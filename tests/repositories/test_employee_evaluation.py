@@ -1,14 +1,23 @@
 """EmployeeEvaluationRepository 테스트"""
 
 import pytest
-from unittest.mock import patch
+from contextlib import contextmanager
+from unittest.mock import patch, MagicMock
 from datetime import date
+from modules.repositories import user as user_module
 from modules.repositories.employee_evaluation import EmployeeEvaluationRepository
 
 
 class TestEmployeeEvaluationRepository:
     """EmployeeEvaluationRepository 테스트 클래스"""
     
+    @pytest.fixture(autouse=True)
+    def clear_users_cache(self):
+        """프로세스 전역 직원 목록 캐시 초기화"""
+        user_module._users_cache.clear()
+        yield
+        user_module._users_cache.clear()
+    
     @pytest.fixture
     def repo(self):
         """EmployeeEvaluationRepository 인스턴스 생성"""
@@ -21,9 +30,9 @@ class TestEmployeeEvaluationRepository:
             yield mock
     
     @pytest.fixture
-    def mock_execute_query_one(self):
-        """_execute_query_one 메서드 mock"""
-        with patch.object(EmployeeEvaluationRepository, '_execute_query_one') as mock:
+    def mock_fast_one(self):
+        """_fast_one 메서드 mock (단건 조회 핫 패스)"""
+        with patch.object(EmployeeEvaluationRepository, '_fast_one') as mock:
             yield mock
     
     @pytest.fixture
@@ -72,6 +81,64 @@ class TestEmployeeEvaluationRepository:
         
         assert result == 2
 
+    # ========== save_evaluations_bulk 테스트 ==========
+    
+    @staticmethod
+    def _mock_transaction_ctx(cursor):
+        """db_transaction 컨텍스트 매니저 mock 생성"""
+        @contextmanager
+        def _mock_tx(dictionary=False):
+            yield cursor
+        return _mock_tx
+    
+    def test_save_evaluations_bulk_empty(self, repo):
+        """빈 목록이면 DB 접근 없이 빈 리스트 반환"""
+        with patch('modules.repositories.employee_evaluation.db_transaction') as mock_tx:
+            result = repo.save_evaluations_bulk([])
+        
+        assert result == []
+        mock_tx.assert_not_called()
+    
+    def test_save_evaluations_bulk_single_multirow_insert(self, repo):
+        """청크 하나는 다중 행 INSERT 1문장으로 실행하고 연속 ID 반환"""
+        cursor = MagicMock()
+        cursor.lastrowid = 20
+        cursor.fetchone.return_value = (1,)
+        rows = [
+            {'record_id': 100, 'target_user_id': 1, 'category': '신체',
+             'evaluation_type': '누락', 'evaluation_date': date(2024, 1, 15), 'comment': '메모'},
+            {'record_id': 101, 'target_user_id': 2, 'category': '인지',
+             'evaluation_type': '내용부족', 'evaluation_date': date(2024, 1, 15), 'score': 2},
+        ]
+        
+        with patch('modules.repositories.employee_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.save_evaluations_bulk(rows)
+        
+        assert result == [20, 21]
+        inserts = [c for c in cursor.execute.call_args_list if 'INSERT' in c[0][0]]
+        assert len(inserts) == 1
+        query, params = inserts[0][0]
+        assert query.count('(%s, %s, %s, %s, %s, %s, %s, %s, %s)') == 2
+        assert params[:9] == [100, None, 1, None, '신체', '누락', 1, '메모', date(2024, 1, 15)]
+        assert params[15] == 2
+    
+    def test_save_evaluations_bulk_chunks(self, repo):
+        """chunk_size 단위로 INSERT 문장 분할"""
+        cursor = MagicMock()
+        cursor.lastrowid = 1
+        cursor.fetchone.return_value = (1,)
+        rows = [
+            {'record_id': i, 'target_user_id': 1, 'category': '신체',
+             'evaluation_type': '누락', 'evaluation_date': date(2024, 1, 15)}
+            for i in range(5)
+        ]
+        
+        with patch('modules.repositories.employee_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.save_evaluations_bulk(rows, chunk_size=2)
+        
+        assert sum('INSERT' in c[0][0] for c in cursor.execute.call_args_list) == 3
+        assert len(result) == 5
+
     # ========== get_evaluations_by_record 테스트 ==========
     
     def test_get_evaluations_by_record(self, repo, mock_execute_query, sample_employee_evaluation_data):
@@ -95,17 +162,17 @@ class TestEmployeeEvaluationRepository:
 
     # ========== get_user_id_by_name 테스트 ==========
     
-    def test_get_user_id_by_name_exists(self, repo, mock_execute_query_one):
+    def test_get_user_id_by_name_exists(self, repo, mock_fast_one):
         """존재하는 사용자 ID 조회"""
-        mock_execute_query_one.return_value = {'user_id': 1}
+        mock_fast_one.return_value = {'user_id': 1}
         
         result = repo.get_user_id_by_name('홍길동')
         
         assert result == 1
     
-    def test_get_user_id_by_name_not_exists(self, repo, mock_execute_query_one):
+    def test_get_user_id_by_name_not_exists(self, repo, mock_fast_one):
         """존재하지 않는 사용자"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
         
         result = repo.get_user_id_by_name('없는사용자')
         
@@ -125,6 +192,16 @@ class TestEmployeeEvaluationRepository:
         assert len(result) == 2
         assert result[0]['name'] == '홍길동'
 
+    def test_get_all_users_cached(self, repo, mock_execute_query):
+        """드롭다운용 전체 사용자 목록은 TTL 동안 DB를 다시 조회하지 않음"""
+        mock_execute_query.return_value = [{'user_id': 1, 'name': '홍길동'}]
+
+        repo.get_all_users()
+        result = repo.get_all_users()
+
+        assert result == [{'user_id': 1, 'name': '홍길동'}]
+        mock_execute_query.assert_called_once()
+
     # ========== delete_evaluation 테스트 ==========
     
     def test_delete_evaluation_success(self, repo, mock_execute_transaction):
@@ -145,9 +222,9 @@ class TestEmployeeEvaluationRepository:
 
     # ========== find_existing_evaluation 테스트 ==========
     
-    def test_find_existing_evaluation_exists(self, repo, mock_execute_query_one):
+    def test_find_existing_evaluation_exists(self, repo, mock_fast_one):
         """기존 평가 찾기 - 존재"""
-        mock_execute_query_one.return_value = {'emp_eval_id': 5}
+        mock_fast_one.return_value = {'emp_eval_id': 5}
         
         result = repo.find_existing_evaluation(
             record_id=100,
@@ -158,9 +235,9 @@ class TestEmployeeEvaluationRepository:
         
         assert result == 5
     
-    def test_find_existing_evaluation_not_exists(self, repo, mock_execute_query_one):
+    def test_find_existing_evaluation_not_exists(self, repo, mock_fast_one):
         """기존 평가 찾기 - 존재하지 않음"""
-        mock_execute_query_one.return_value = None
+        mock_fast_one.return_value = None
         
         result = repo.find_existing_evaluation(
             record_id=100,
@@ -171,6 +248,38 @@ class TestEmployeeEvaluationRepository:
         
         assert result is None
 
+    # ========== update_existing_evaluation 테스트 ==========
+    
+    def test_update_existing_evaluation_returns_matched_id(self, repo):
+        """일치하는 평가를 UPDATE 1문장으로 수정하고 그 ID 반환"""
+        cursor = MagicMock()
+        cursor.lastrowid = 7
+        
+        with patch('modules.repositories.employee_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.update_existing_evaluation(
+                record_id=100, target_user_id=1, category='신체',
+                evaluation_type='누락', evaluation_date=date(2024, 1, 15), comment='수정'
+            )
+        
+        assert result == 7
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        assert 'LAST_INSERT_ID(emp_eval_id)' in query
+        assert params[-4:] == (100, 1, '신체', '누락')
+    
+    def test_update_existing_evaluation_no_match(self, repo):
+        """일치하는 평가가 없으면 None 반환"""
+        cursor = MagicMock()
+        cursor.lastrowid = 0
+        
+        with patch('modules.repositories.employee_evaluation.db_transaction', self._mock_transaction_ctx(cursor)):
+            result = repo.update_existing_evaluation(
+                record_id=100, target_user_id=1, category='신체',
+                evaluation_type='누락', evaluation_date=date(2024, 1, 15)
+            )
+        
+        assert result is None
+
     # ========== update_evaluation 테스트 ==========
     
     def test_update_evaluation_success(self, repo, mock_execute_transaction):
@@ -7,12 +7,20 @@
 import pytest
 from unittest.mock import patch
 from datetime import date
+from modules.repositories import user as user_module
 from modules.repositories.user import UserRepository
 
 
 class TestUserRepository:
     """UserRepository 테스트 클래스"""
 
+    @pytest.fixture(autouse=True)
+    def clear_users_cache(self):
+        """프로세스 전역 직원 목록 캐시 초기화"""
+        user_module._users_cache.clear()
+        yield
+        user_module._users_cache.clear()
+
     @pytest.fixture
     def repo(self):
         return UserRepository()
@@ -122,6 +130,42 @@ class TestUserRepository:
         assert '%홍%' in call_args[1]
         assert '재직' in call_args[1]
 
+    def test_list_users_cached_per_filter(self, repo, mock_execute_query, sample_user):
+        """같은 조건의 목록은 TTL 동안 DB를 다시 조회하지 않고 조건이 다르면 따로 조회"""
+        mock_execute_query.return_value = [sample_user]
+
+        first = repo.list_users(keyword='홍')
+        second = repo.list_users(keyword='홍')
+        repo.list_users(keyword='김')
+
+        assert second == first
+        assert mock_execute_query.call_count == 2
+
+    def test_list_users_cache_returns_copies(self, repo, mock_execute_query, sample_user):
+        """호출자가 결과를 수정해도 캐시는 바뀌지 않음"""
+        mock_execute_query.return_value = [dict(sample_user)]
+
+        repo.list_users()[0]['name'] = '변경'
+
+        assert repo.list_users()[0]['name'] == '홍길동'
+
+    @pytest.mark.parametrize('method, args, mock_name', [
+        ('create_user', ('user1', 'pw', '김철수'), 'mock_execute_transaction_lastrowid'),
+        ('update_user', (1, '홍길동'), 'mock_execute_transaction'),
+        ('soft_delete_user', (1,), 'mock_execute_transaction'),
+    ])
+    def test_writes_invalidate_users_cache(self, request, repo, mock_execute_query, sample_user,
+                                           method, args, mock_name):
+        """직원 생성/수정/퇴사 처리 후에는 목록을 다시 조회"""
+        request.getfixturevalue(mock_name).return_value = 1
+        mock_execute_query.return_value = [sample_user]
+
+        repo.list_users()
+        getattr(repo, method)(*args)
+        repo.list_users()
+
+        assert mock_execute_query.call_count == 2
+
     # ========== create_user 테스트 ==========
 
     def test_create_user_success(self, repo, mock_execute_transaction_lastrowid):
@@ -2,7 +2,17 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
-from modules.services.daily_report_service import EvaluationService
+from modules.services import daily_report_service as service_module
+from modules.services.daily_report_service import EvaluationService, is_skippable_note
+from modules.utils.cache_utils import request_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_special_note_cache():
+    """프로세스 전역 특이사항 AI 평가 결과 캐시 초기화"""
+    service_module._special_note_cache.clear()
+    yield
+    service_module._special_note_cache.clear()
 
 
 class TestEvaluationService:
@@ -118,6 +128,30 @@ class TestEvaluationService:
         assert result['suggestion'] == ''
         assert result['grade'] == '평가없음'
     
+    def test_get_evaluation_from_db_cached_within_request(self, service):
+        """요청 범위 안에서 같은 인자의 조회는 DB를 1번만 호출"""
+        service._mock_base_repo._execute_query_one.return_value = {
+            'suggestion_text': '', 'grade_code': '우수'
+        }
+        
+        with request_cache():
+            service.get_evaluation_from_db(100, 'SPECIAL_NOTE_PHYSICAL')
+            service.get_evaluation_from_db(100, 'SPECIAL_NOTE_PHYSICAL')
+        
+        assert service._mock_base_repo._execute_query_one.call_count == 1
+    
+    def test_save_ai_evaluation_invalidates_request_cache(self, service):
+        """평가 저장 후에는 캐시된 조회 결과 대신 DB를 다시 조회"""
+        service._mock_base_repo._execute_query_one.return_value = None
+        
+        with request_cache():
+            assert service.get_evaluation_from_db(100, 'SPECIAL_NOTE_PHYSICAL')['grade'] == '평가없음'
+            service.save_ai_evaluation(100, '신체', 1, {'grade_code': '우수'}, '원문')
+            service._mock_base_repo._execute_query_one.return_value = {
+                'suggestion_text': '', 'grade_code': '우수'
+            }
+            assert service.get_evaluation_from_db(100, 'SPECIAL_NOTE_PHYSICAL')['grade'] == '우수'
+    
     def test_get_evaluation_from_db_category_mapping(self, service):
         """카테고리 매핑 확인"""
         service._mock_base_repo._execute_query_one.return_value = {
@@ -169,6 +203,18 @@ class TestEvaluationService:
         
         assert result == '개선'
     
+    def test_calculate_grade_boundaries(self, service):
+        """경계값은 상위 등급에 포함 (90 -> 우수, 75 -> 평균)"""
+        def grade(score):
+            return service.calculate_grade({
+                'consistency_score': score, 'grammar_score': score, 'specificity_score': score
+            })
+        
+        assert grade(90) == '우수'
+        assert grade(89.9) == '평균'
+        assert grade(75) == '평균'
+        assert grade(74.9) == '개선'
+    
     def test_calculate_grade_empty(self, service):
         """빈 평가 결과 -> 평가없음"""
         result = service.calculate_grade(None)
@@ -186,6 +232,13 @@ class TestEvaluationService:
         assert result['grammar'] == 'X'
         assert result['grade_code'] == '평가없음'
 
+    def test_create_empty_evaluation_returns_independent_copy(self, service):
+        """반환값을 수정해도 다음 호출 결과에 영향이 없음"""
+        first = service.create_empty_evaluation()
+        first['grade_code'] = '우수'
+
+        assert service.create_empty_evaluation()['grade_code'] == '평가없음'
+
     # ========== evaluate_special_note_with_ai 테스트 ==========
     
     def test_evaluate_special_note_with_ai_empty_notes(self, service):
@@ -246,6 +299,14 @@ class TestEvaluationService:
         assert '두뇌튼튼교실' in result
         assert '힘뇌체조' in result
     
+    def test_extract_programs_from_text_dedup_keeps_order(self, service):
+        """패턴 순서와 등장 순서를 유지하며 중복 제거"""
+        text = "재난상황 대응훈련 후 두뇌튼튼교실, 다시 두뇌튼튼교실 참여"
+        
+        result = service._extract_programs_from_text(text)
+        
+        assert result == ['두뇌튼튼교실', '대응훈련', '재난상황 대응훈련']
+    
     def test_extract_programs_from_text_empty(self, service):
         """빈 텍스트"""
         result = service._extract_programs_from_text('')
@@ -318,6 +379,25 @@ class TestEvaluationService:
         
         assert result['grade_code'] == '평가없음'
     
+    @pytest.mark.parametrize('text', [None, '', '  ', '특이사항 없음', '특이사항없음', ' 결석 ', '해당 없음', '없음'])
+    def test_is_skippable_note_boilerplate(self, text):
+        """비어 있거나 상투 문구인 특이사항은 평가 제외"""
+        assert is_skippable_note(text) is True
+    
+    def test_is_skippable_note_real_text(self):
+        """실제 내용이 있는 특이사항은 평가 대상"""
+        assert is_skippable_note('두뇌튼튼교실에 참여하심') is False
+    
+    def test_evaluate_special_note_with_ai_boilerplate_skips_ai(self, service):
+        """신체/인지 특이사항이 모두 상투 문구면 AI를 호출하지 않음"""
+        record = {'physical_note': '특이사항 없음', 'cognitive_note': '결석'}
+        
+        with patch('modules.services.daily_report_service.get_ai_client') as mock_get_client:
+            result = service.evaluate_special_note_with_ai(record)
+        
+        assert result is None
+        mock_get_client.assert_not_called()
+    
     def test_process_daily_note_evaluation_nursing_category(self, service):
         """간호/기능 카테고리는 기본 평가"""
         service._mock_base_repo._execute_query_one.return_value = {
@@ -395,58 +475,62 @@ class TestEvaluationServiceAdditional:
             svc._mock_base_repo = mock_base_repo_instance
             yield svc
 
-    # ========== _save_evaluation_result UPDATE 분기 ==========
-
-    def test_save_evaluation_result_update_when_existing(self, service):
-        """기존 레코드가 있을 때 UPDATE 쿼리 실행"""
-        service._mock_base_repo._execute_query_one.return_value = {'ai_eval_id': 42}
-
-        service._save_evaluation_to_db(
-            record_id=1,
-            category='SPECIAL_NOTE_PHYSICAL',
-            oer_fidelity='O',
-            specificity='O',
-            grammar='O',
-            grade='우수',
-            original_text='원본',
-            reason_text='근거',
-            suggestion_text='제안'
-        )
-
-        service._mock_base_repo._execute_transaction.assert_called_once()
-        call_args = service._mock_base_repo._execute_transaction.call_args[0]
-        assert 'UPDATE' in call_args[0]
-
-    def test_save_evaluation_result_insert_when_not_existing(self, service):
-        """기존 레코드가 없을 때 INSERT 쿼리 실행"""
-        service._mock_base_repo._execute_query_one.return_value = None
-
-        service._save_evaluation_to_db(
-            record_id=1,
-            category='SPECIAL_NOTE_PHYSICAL',
-            oer_fidelity='X',
-            specificity='X',
-            grammar='X',
-            grade='개선',
-            original_text='원본',
-            reason_text='',
-            suggestion_text=''
-        )
+    # ========== save_special_note_evaluations_bulk 테스트 ==========
 
-        service._mock_base_repo._execute_transaction.assert_called_once()
-        call_args = service._mock_base_repo._execute_transaction.call_args[0]
-        assert 'INSERT' in call_args[0]
+    def test_save_special_note_evaluation_single_upsert(self, service):
+        """기록 1건의 신체/인지 평가를 조회 없이 upsert 1회로 저장"""
+        evaluation_result = {
+            'original_physical': {'oer_fidelity': 'O', 'specificity': 'O', 'grammar': 'O', 'grade': '우수'},
+            'original_cognitive': {'oer_fidelity': 'X', 'specificity': 'X', 'grammar': 'O', 'grade': '개선'},
+            'physical': {'corrected_note': '수정된 신체'},
+            'cognitive': {'corrected_note': '수정된 인지'},
+            'physical_note': '원본 신체',
+            'cognitive_note': '원본 인지'
+        }
 
-    # ========== evaluate_special_note_with_ai 코드블록 파싱 ==========
+        service.save_special_note_evaluation(100, evaluation_result)
 
-    def test_evaluate_special_note_json_code_block(self, service, sample_ai_response):
-        """```json 코드블록 포함 응답 파싱"""
+        service._mock_ai_repo.save_evaluations_bulk.assert_called_once_with([
+            (100, 'SPECIAL_NOTE_PHYSICAL', 'O', 'O', 'O', '우수', '원본 신체', None, '수정된 신체'),
+            (100, 'SPECIAL_NOTE_COGNITIVE', 'X', 'X', 'O', '개선', '원본 인지', None, '수정된 인지'),
+        ])
+        service._mock_base_repo._execute_query_one.assert_not_called()
+
+    def test_save_special_note_evaluations_bulk_multiple_records(self, service):
+        """여러 기록의 평가를 저장 호출 1번으로 모음"""
+        service.save_special_note_evaluations_bulk([
+            (1, {'original_physical': {'grade': '평균'}, 'physical_note': '보행 보조'}),
+            (2, None),
+            (3, {'original_cognitive': {'grade': '우수'}, 'cognitive_note': '대화 원활'}),
+        ])
+
+        rows = service._mock_ai_repo.save_evaluations_bulk.call_args[0][0]
+        assert [(r[0], r[1]) for r in rows] == [(1, 'SPECIAL_NOTE_PHYSICAL'), (3, 'SPECIAL_NOTE_COGNITIVE')]
+
+    def test_save_special_note_evaluations_bulk_skips_empty_notes(self, service):
+        """원본 특이사항이 비었거나 '결석' 같은 상투 문구인 카테고리는 평가 행을 만들지 않음"""
+        scores = {'oer_fidelity': 'O', 'specificity': 'O', 'grammar': 'O', 'grade': '우수'}
+        service.save_special_note_evaluations_bulk([
+            (1, {'original_physical': scores, 'original_cognitive': scores,
+                 'physical_note': '보행 보조', 'cognitive_note': '결석'}),
+            (2, {'original_physical': scores, 'original_cognitive': scores,
+                 'physical_note': '', 'cognitive_note': '대화 원활'}),
+            (3, {'original_physical': scores, 'original_cognitive': scores,
+                 'physical_note': ' 특이사항 없음 ', 'cognitive_note': None}),
+        ])
+
+        rows = service._mock_ai_repo.save_evaluations_bulk.call_args[0][0]
+        assert [(r[0], r[1]) for r in rows] == [(1, 'SPECIAL_NOTE_PHYSICAL'), (2, 'SPECIAL_NOTE_COGNITIVE')]
+
+    # ========== evaluate_special_note_with_ai JSON 모드 ==========
+
+    def test_evaluate_special_note_requests_json_object(self, service, sample_ai_response):
+        """JSON 모드(response_format)로 요청하고 응답을 그대로 파싱"""
         record = {'physical_note': '신체 테스트', 'cognitive_note': '인지 테스트'}
-        wrapped = f'```json\n{sample_ai_response}\n```'
 
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.choices[0].message.content = wrapped
+        mock_response.choices[0].message.content = sample_ai_response
         mock_client.chat_completion.return_value = mock_response
 
         with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client):
@@ -456,11 +540,12 @@ class TestEvaluationServiceAdditional:
 
         assert result is not None
         assert 'original_physical' in result
+        assert mock_client.chat_completion.call_args[1]['response_format'] == {'type': 'json_object'}
 
-    def test_evaluate_special_note_plain_code_block(self, service, sample_ai_response):
-        """``` 코드블록 포함 응답 파싱"""
+    def test_evaluate_special_note_code_block_is_malformed(self, service, sample_ai_response):
+        """JSON 모드에서 코드 블록으로 감싼 응답은 잘못된 응답으로 처리"""
         record = {'physical_note': '신체 테스트', 'cognitive_note': '인지 테스트'}
-        wrapped = f'```\n{sample_ai_response}\n```'
+        wrapped = f'```json\n{sample_ai_response}\n```'
 
         mock_client = MagicMock()
         mock_response = MagicMock()
@@ -472,7 +557,7 @@ class TestEvaluationServiceAdditional:
                        return_value=('sys', 'usr')):
                 result = service.evaluate_special_note_with_ai(record)
 
-        assert result is not None
+        assert result is None
 
     def test_evaluate_special_note_json_parse_error(self, service):
         """JSON 파싱 실패 시 None 반환"""
@@ -632,45 +717,233 @@ class TestEvaluationServiceAdditional:
 
         assert result['grade_code'] == '평균'
 
-    # ========== _select_most_unique_sentences / _find_least_similar ==========
+    # ========== process_daily_notes_batch 테스트 ==========
 
-    def test_select_most_unique_sentences_no_previous(self, service):
-        """이전 문장 없을 때 첫 번째 후보 반환"""
-        ai_result = {
-            'physical_candidates': [
-                {'corrected_note': '신체1'},
-                {'corrected_note': '신체2'},
-                {'corrected_note': '신체3'},
-            ],
-            'cognitive_candidates': [
-                {'corrected_note': '인지1'},
-                {'corrected_note': '인지2'},
-                {'corrected_note': '인지3'},
-            ]
-        }
+    @staticmethod
+    def _batch_client(content):
+        mock_client = MagicMock()
+        mock_client.chat_completion.return_value.choices[0].message.content = content
+        return mock_client
+
+    def test_process_daily_notes_batch_single_call(self, service, sample_ai_response):
+        """배치 응답을 id별로 매핑해 AI 호출 1번으로 저장"""
+        import json
+        item = json.loads(sample_ai_response)
+        content = json.dumps({'results': [dict(item, id=1), dict(item, id=2)]})
+        mock_client = self._batch_client(content)
+        records = [
+            {'record_id': 1, 'physical_note': '신체1', 'cognitive_note': '인지1'},
+            {'record_id': 2, 'physical_note': '신체2', 'cognitive_note': ''},
+        ]
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client), \
+             patch.object(service, 'evaluate_special_note_with_ai') as mock_single:
+            results = service.process_daily_notes_batch(records)
+
+        assert set(results) == {1, 2}
+        mock_client.chat_completion.assert_called_once()
+        assert mock_client.chat_completion.call_args[1]['response_format'] == {'type': 'json_object'}
+        mock_single.assert_not_called()
+        # 배치 전체를 저장 호출 1번으로 (2번 기록은 인지 특이사항이 비어 신체만)
+        service._mock_ai_repo.save_evaluations_bulk.assert_called_once()
+        rows = service._mock_ai_repo.save_evaluations_bulk.call_args[0][0]
+        assert [(r[0], r[1]) for r in rows] == [
+            (1, 'SPECIAL_NOTE_PHYSICAL'), (1, 'SPECIAL_NOTE_COGNITIVE'),
+            (2, 'SPECIAL_NOTE_PHYSICAL'),
+        ]
+        assert rows[0][6] == '신체1'
+        assert rows[0][8] == '수정된 신체활동 특이사항 1'
+
+    def test_process_daily_notes_batch_fallback_on_malformed(self, service):
+        """배치 응답이 잘못되면 기록별 단건 평가로 폴백"""
+        mock_client = self._batch_client('invalid json {{{')
+        records = [
+            {'record_id': 1, 'physical_note': '신체1', 'cognitive_note': ''},
+            {'record_id': 2, 'physical_note': '', 'cognitive_note': '인지2'},
+        ]
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client), \
+             patch.object(service, 'evaluate_special_note_with_ai',
+                          side_effect=[{'original_physical': {'grade': '평균'}}, None]) as mock_single:
+            results = service.process_daily_notes_batch(records)
+
+        assert mock_single.call_count == 2
+        assert list(results) == [1]
+        rows = service._mock_ai_repo.save_evaluations_bulk.call_args[0][0]
+        assert [(r[0], r[1], r[5]) for r in rows] == [(1, 'SPECIAL_NOTE_PHYSICAL', '평균')]
+
+    def test_process_daily_notes_batch_missing_id_falls_back(self, service, sample_ai_response):
+        """응답에서 누락되거나 요청하지 않은 id는 단건 평가로 처리"""
+        import json
+        item = json.loads(sample_ai_response)
+        content = json.dumps({'results': [dict(item, id=1), dict(item, id=99), {'id': 2}]})
+        mock_client = self._batch_client(content)
+        records = [
+            {'record_id': 1, 'physical_note': '신체1'},
+            {'record_id': 2, 'physical_note': '신체2'},
+        ]
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client), \
+             patch.object(service, 'evaluate_special_note_with_ai', return_value={'physical': {}}) as mock_single:
+            results = service.process_daily_notes_batch(records)
+
+        mock_single.assert_called_once_with(records[1])
+        assert set(results) == {1, 2}
+
+    def test_process_daily_notes_batch_splits_by_batch_size(self, service):
+        """batch_size 단위로 AI 호출을 나누고 빈 특이사항은 제외"""
+        records = [{'record_id': i, 'physical_note': f'신체{i}'} for i in range(1, 6)]
+        records.append({'record_id': 6, 'physical_note': '', 'cognitive_note': ''})
+
+        with patch.object(service, '_evaluate_special_notes_batch', return_value={}) as mock_batch, \
+             patch.object(service, 'evaluate_special_note_with_ai', return_value=None):
+            service.process_daily_notes_batch(records, batch_size=2)
 
-        result = service._select_most_unique_sentences(ai_result, previous_sentences=[])
+        assert sorted(len(c[0][0]) for c in mock_batch.call_args_list) == [1, 2, 2]
 
-        assert result['physical']['corrected_note'] == '신체1'
-        assert result['cognitive']['corrected_note'] == '인지1'
+    def test_aprocess_many_reports_progress_per_batch(self, service):
+        """배치가 끝날 때마다 처리한 기록 수로 on_progress 호출"""
+        import asyncio
+        records = [{'record_id': i, 'physical_note': f'신체{i}'} for i in range(1, 6)]
+        progress = []
 
-    def test_find_least_similar_no_references(self, service):
-        """참조 문장 없으면 첫 번째 후보 반환"""
-        candidates = ['문장A', '문장B', '문장C']
-        vectorizer = MagicMock()
+        with patch.object(service, '_process_notes_batch',
+                          side_effect=lambda batch: {r['record_id']: {} for r in batch}):
+            results = asyncio.run(service.aprocess_many(
+                records, max_concurrency=2, batch_size=2, on_progress=progress.append
+            ))
 
-        result = service._find_least_similar(candidates, [], vectorizer)
+        assert set(results) == {1, 2, 3, 4, 5}
+        assert sorted(progress) == [1, 2, 2]
 
-        assert result == '문장A'
+    def test_aprocess_many_batch_error_isolated(self, service):
+        """한 배치가 실패해도 나머지 배치 결과는 반환"""
+        import asyncio
+        records = [{'record_id': i, 'physical_note': f'신체{i}'} for i in range(1, 4)]
 
-    def test_find_least_similar_sklearn_fallback(self, service):
-        """scikit-learn 로딩 실패 시 첫 번째 후보 반환"""
-        candidates = ['문장A', '문장B']
-        references = ['참조1']
+        def process(batch):
+            if batch[0]['record_id'] == 1:
+                raise RuntimeError('DB error')
+            return {r['record_id']: {} for r in batch}
 
-        with patch('builtins.__import__', side_effect=ImportError("sklearn")):
-            # ImportError 발생 시 fallback
-            result = service._find_least_similar(candidates, references, MagicMock())
+        with patch.object(service, '_process_notes_batch', side_effect=process):
+            results = asyncio.run(service.aprocess_many(records, batch_size=2))
+
+        assert set(results) == {3}
+
+    # ========== process_daily_note_evaluations_bulk 테스트 ==========
+
+    def test_process_daily_note_evaluations_bulk_prefetch_once(self, service):
+        """기록을 IN 조회 1번으로 가져오고 저장도 1번으로 모음"""
+        service._mock_base_repo._execute_query.return_value = [
+            {'record_id': 1, 'physical_note': '신체1'},
+        ]
+        items = [
+            {'record_id': 1, 'category': 'NURSING', 'note_text': '간호', 'note_writer_user_id': 1},
+            {'record_id': 1, 'category': 'RECOVERY', 'note_text': '기능', 'note_writer_user_id': 1},
+            {'record_id': 2, 'category': 'NURSING', 'note_text': '간호', 'note_writer_user_id': 1},
+        ]
+
+        results = service.process_daily_note_evaluations_bulk(items)
+
+        service._mock_base_repo._execute_query.assert_called_once()
+        query, params = service._mock_base_repo._execute_query.call_args[0]
+        assert 'IN (%s, %s)' in query
+        assert params == (1, 2)
+        service._mock_base_repo._execute_query_one.assert_not_called()
+        # 없는 기록(2)은 평가하지 않음
+        assert [r['grade_code'] for r in results] == ['평균', '평균', '평가없음']
+        rows = service._mock_ai_repo.save_evaluations_bulk.call_args[0][0]
+        assert [(r[0], r[1]) for r in rows] == [(1, 'NURSING'), (1, 'RECOVERY')]
+        service._mock_ai_repo.save_evaluation.assert_not_called()
+
+    def test_process_daily_note_evaluation_uses_prefetched_record(self, service):
+        """미리 조회한 기록을 넘기면 DB 조회 생략"""
+        service.process_daily_note_evaluation(
+            record_id=1, category='NURSING', note_text='간호',
+            note_writer_user_id=1, record={'record_id': 1}
+        )
+
+        service._mock_base_repo._execute_query_one.assert_not_called()
+        service._mock_ai_repo.save_evaluation.assert_called_once()
+
+    # ========== 특이사항 AI 평가 결과 캐시 테스트 ==========
+
+    def test_evaluate_special_note_cache_hit_skips_ai(self, service, sample_ai_response):
+        """이름/날짜만 다르고 입력이 같은 기록은 AI를 다시 호출하지 않음"""
+        mock_client = self._batch_client(sample_ai_response)
+        record = {'customer_name': '홍길동', 'date': '2024-01-15',
+                  'physical_note': '신체 테스트', 'cognitive_note': '인지 테스트'}
+        same_input = dict(record, customer_name='김철수', date='2024-01-16',
+                          physical_note='신체 테스트  ')
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client):
+            first = service.evaluate_special_note_with_ai(record)
+            first['original_physical']['grade'] = '변경'
+            second = service.evaluate_special_note_with_ai(same_input)
+
+        mock_client.chat_completion.assert_called_once()
+        # 캐시 값은 복사본으로 반환되어 호출자 수정의 영향을 받지 않음
+        assert second['original_physical']['grade'] == '우수'
+
+    def test_evaluate_special_note_cache_miss_on_different_input(self, service, sample_ai_response):
+        """특이사항이 다르면 AI를 다시 호출"""
+        mock_client = self._batch_client(sample_ai_response)
+
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=mock_client):
+            service.evaluate_special_note_with_ai({'physical_note': '신체 A'})
+            service.evaluate_special_note_with_ai({'physical_note': '신체 B'})
+
+        assert mock_client.chat_completion.call_count == 2
+
+    def test_evaluate_special_notes_batch_sends_only_uncached(self, service, sample_ai_response):
+        """배치 평가는 캐시에 없는 기록만 AI에 전달"""
+        import json
+        item = json.loads(sample_ai_response)
+        cached_client = self._batch_client(sample_ai_response)
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=cached_client):
+            service.evaluate_special_note_with_ai({'record_id': 1, 'physical_note': '신체1'})
+
+        batch_client = self._batch_client(json.dumps({'results': [dict(item, id=2)]}))
+        records = [
+            {'record_id': 1, 'physical_note': '신체1'},
+            {'record_id': 2, 'physical_note': '신체2'},
+        ]
+        with patch('modules.services.daily_report_service.get_ai_client', return_value=batch_client):
+            results = service._evaluate_special_notes_batch(records)
+
+        assert set(results) == {1, 2}
+        user_prompt = batch_client.chat_completion.call_args[1]['messages'][1]['content']
+        assert 'record id="2"' in user_prompt
+        assert 'record id="1"' not in user_prompt
+
+    # ========== save_ai_evaluations_bulk / pending_saves 테스트 ==========
+
+    def test_save_ai_evaluations_bulk_converts_payloads(self, service):
+        """save_ai_evaluation과 같은 변환으로 저장 행을 만들어 한 번에 저장"""
+        service.save_ai_evaluations_bulk([
+            (1, 'PHYSICAL', 7, {'oer_fidelity': 'O', 'specificity': 'O', 'grammar': 'X',
+                                'grade_code': '평균', 'corrected_note': '수정'}, '원본'),
+            (2, 'NURSING', 7, None, None),
+        ])
+
+        service._mock_ai_repo.save_evaluations_bulk.assert_called_once_with([
+            (1, 'PHYSICAL', 'O', 'O', 'X', '평균', '원본', '', '수정'),
+            (2, 'NURSING', 'X', 'X', 'X', '평가없음', '', '', ''),
+        ])
+        service._mock_ai_repo.save_evaluation.assert_not_called()
+
+    def test_process_daily_note_evaluation_pending_saves_defers(self, service):
+        """pending_saves를 넘기면 즉시 저장하지 않고 저장 인자를 모음"""
+        service._mock_base_repo._execute_query_one.return_value = {'record_id': 1}
+        pending = []
+
+        service.process_daily_note_evaluation(
+            record_id=1, category='NURSING', note_text='간호 기록',
+            note_writer_user_id=3, pending_saves=pending
+        )
 
-        # fallback으로 첫 번째 후보 반환 또는 정상 처리
-        assert result in candidates
+        service._mock_ai_repo.save_evaluation.assert_not_called()
+        assert len(pending) == 1
+        assert pending[0][:3] == (1, 'NURSING', 3)
+        assert pending[0][4] == '간호 기록'
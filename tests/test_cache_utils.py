@@ -0,0 +1,133 @@
+"""캐시 유틸리티 테스트
+
+cache_utils 모듈의 요청 범위 메모이제이션 및 TTL 캐시 동작 검증.
+"""
+
+import pytest
+from unittest.mock import patch
+from modules.utils.cache_utils import (
+    request_cache,
+    cached_per_request,
+    invalidate_request_cache,
+    TTLCache,
+)
+
+
+class _Repo:
+    def __init__(self):
+        self.calls = 0
+
+    @cached_per_request
+    def lookup(self, key):
+        self.calls += 1
+        return {'key': key}
+
+
+class _OtherRepo(_Repo):
+    pass
+
+
+class TestRequestCache:
+    """request_cache / cached_per_request 테스트"""
+
+    def test_no_cache_outside_scope(self):
+        """스코프 밖에서는 매번 실행"""
+        repo = _Repo()
+        repo.lookup(1)
+        repo.lookup(1)
+        assert repo.calls == 2
+
+    def test_same_args_cached_in_scope(self):
+        """스코프 안에서 같은 인자는 1번만 실행"""
+        repo = _Repo()
+        with request_cache():
+            first = repo.lookup(1)
+            second = repo.lookup(1)
+        assert repo.calls == 1
+        assert first is second
+
+    def test_different_args_not_shared(self):
+        """인자가 다르면 별도 실행"""
+        repo = _Repo()
+        with request_cache():
+            repo.lookup(1)
+            repo.lookup(2)
+        assert repo.calls == 2
+
+    def test_scope_is_discarded_after_exit(self):
+        """스코프 종료 후 캐시 폐기"""
+        repo = _Repo()
+        with request_cache():
+            repo.lookup(1)
+        with request_cache():
+            repo.lookup(1)
+        assert repo.calls == 2
+
+    def test_nested_scope_reuses_outer_cache(self):
+        """중첩 스코프는 바깥 캐시 공유"""
+        repo = _Repo()
+        with request_cache() as outer:
+            repo.lookup(1)
+            with request_cache() as inner:
+                repo.lookup(1)
+            assert inner is outer
+        assert repo.calls == 1
+
+    def test_invalidate_only_owner_entries(self):
+        """invalidate_request_cache는 해당 클래스 항목만 제거"""
+        repo, other = _Repo(), _OtherRepo()
+        with request_cache():
+            repo.lookup(1)
+            other.lookup(1)
+            invalidate_request_cache(_Repo)
+            repo.lookup(1)
+            other.lookup(1)
+        assert repo.calls == 2
+        assert other.calls == 1
+
+    def test_invalidate_outside_scope_no_error(self):
+        """스코프 밖 무효화는 아무 동작 없음"""
+        invalidate_request_cache(_Repo)
+
+
+class TestTTLCache:
+    """TTLCache 테스트"""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+
+    def test_missing_key_returns_default(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        assert cache.get('a') is None
+        assert cache.get('a', 'x') == 'x'
+
+    def test_expired_entry_dropped(self):
+        """ttl 경과 후 항목 만료"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        with patch('modules.utils.cache_utils.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('modules.utils.cache_utils.time.monotonic', return_value=161.0):
+            assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_over_maxsize(self):
+        """maxsize 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.pop('a') == 1
+        assert cache.pop('a') is None
+        cache.clear()
+        assert len(cache) == 0
@@ -8,6 +8,7 @@ DB 연결 모듈 단위 테스트 (modules/db_connection.py)
   - db_transaction: 성공 시 커밋, 예외 시 롤백
   - db_query: 읽기 전용, 미소비 결과 자동 정리
   - release_pool(): 연결 풀 해제
+  - prepared_cursor(): 풀 연결별 쿼리당 prepared 커서 재사용, 사용 후 풀에 반납
 """
 
 import os
@@ -23,6 +24,7 @@ from modules.db_connection import (
     db_transaction,
     db_query,
     release_pool,
+    prepared_cursor,
 )
 
 
@@ -164,11 +166,19 @@ class TestConnectionFactory:
 class TestDbTransaction:
     """
     비즈니스 규칙:
+      - 블록 시작 시 명시적으로 트랜잭션 시작 (연결은 autocommit)
       - 블록 내에서 예외 없으면 commit() 호출
       - 블록 내에서 예외 발생 시 rollback() 호출하고 예외 재발생
       - 항상 cursor.close()와 conn.close() 호출
     """
 
+    def test_starts_explicit_transaction(self):
+        conn, cursor = make_mock_conn()
+        set_connection_factory(lambda: conn)
+
+        with db_transaction() as c:
+            conn.start_transaction.assert_called_once()
+
     def test_commits_on_success(self):
         conn, cursor = make_mock_conn()
         set_connection_factory(lambda: conn)
@@ -252,6 +262,20 @@ class TestDbTransaction:
         with db_transaction() as c:
             assert c is cursor
 
+    def test_local_infile_uses_dedicated_connection(self):
+        """local_infile=True면 풀 대신 LOCAL INFILE 허용 직접 연결 사용"""
+        conn, cursor = make_mock_conn()
+
+        with patch.dict(os.environ, {"DB_HOST": "h", "DB_USER": "u", "DB_PASSWORD": "p", "DB_NAME": "d"}), \
+             patch.object(db_module.mysql.connector, "connect", return_value=conn) as mock_connect, \
+             patch.object(db_module, "get_db_connection") as mock_pooled:
+            with db_transaction(local_infile=True) as c:
+                assert c is cursor
+
+        assert mock_connect.call_args.kwargs["allow_local_infile"] is True
+        mock_pooled.assert_not_called()
+        conn.commit.assert_called_once()
+
 
 # ───────────────────────────────────────────────────────────────
 # 4. db_query — 읽기 전용 동작
@@ -366,3 +390,192 @@ class TestReleasePool:
         db_module._connection_pool = None
         db_module._pool_config = None
         release_pool()  # 에러 없어야 함
+
+
+# ───────────────────────────────────────────────────────────────
+# 6. _get_connection_pool — 풀 생성 옵션
+# ───────────────────────────────────────────────────────────────
+
+class TestConnectionPool:
+    """
+    비즈니스 규칙:
+      - 풀은 한 번만 생성되고 이후 체크아웃은 같은 풀을 재사용
+      - 반납 시 세션 리셋을 하지 않음 (왕복 비용/time_zone 유실 방지)
+    """
+
+    ENV = {"DB_HOST": "h", "DB_USER": "u", "DB_PASSWORD": "p", "DB_NAME": "d"}
+
+    def test_pool_created_without_session_reset(self):
+        with patch.dict(os.environ, self.ENV, clear=False), \
+             patch.object(db_module.pooling, "MySQLConnectionPool") as mock_pool_cls:
+            db_module._get_connection_pool()
+
+        assert mock_pool_cls.call_args.kwargs["pool_reset_session"] is False
+
+    def test_pool_reused_for_same_config(self):
+        with patch.dict(os.environ, self.ENV, clear=False), \
+             patch.object(db_module.pooling, "MySQLConnectionPool") as mock_pool_cls:
+            first = db_module._get_connection_pool()
+            second = db_module._get_connection_pool()
+
+        assert first is second
+        mock_pool_cls.assert_called_once()
+
+    def test_pool_connections_autocommit(self):
+        """세션 리셋이 없으므로 읽기 스냅샷이 남지 않도록 autocommit 연결 사용"""
+        with patch.dict(os.environ, self.ENV, clear=False), \
+             patch.object(db_module.pooling, "MySQLConnectionPool") as mock_pool_cls:
+            db_module._get_connection_pool()
+
+        assert mock_pool_cls.call_args.kwargs["autocommit"] is True
+
+    def test_pool_size_defaults_to_constant(self):
+        from modules.utils.memory_utils import DB_POOL_SIZE
+        with patch.dict(os.environ, self.ENV, clear=False), \
+             patch.object(db_module.pooling, "MySQLConnectionPool") as mock_pool_cls:
+            os.environ.pop("DB_POOL_SIZE", None)
+            db_module._get_connection_pool()
+
+        assert mock_pool_cls.call_args.kwargs["pool_size"] == DB_POOL_SIZE
+
+    def test_pool_size_from_env(self):
+        """DB_POOL_SIZE 환경변수로 풀 크기 조정"""
+        with patch.dict(os.environ, {**self.ENV, "DB_POOL_SIZE": "8"}, clear=False), \
+             patch.object(db_module.pooling, "MySQLConnectionPool") as mock_pool_cls:
+            db_module._get_connection_pool()
+
+        assert mock_pool_cls.call_args.kwargs["pool_size"] == 8
+
+    def test_exhausted_pool_waits_for_returned_connection(self):
+        """풀이 소진되면 직접 연결 대신 반납된 풀 연결을 기다려 사용"""
+        import mysql.connector
+        pooled = MagicMock()
+        pool = MagicMock()
+        pool.get_connection.side_effect = [
+            mysql.connector.errors.PoolError("pool exhausted"), pooled
+        ]
+
+        with patch.object(db_module, "_get_connection_pool", return_value=pool), \
+             patch.object(db_module, "_connect_direct") as mock_direct:
+            conn = get_db_connection()
+
+        assert conn is pooled
+        mock_direct.assert_not_called()
+
+    def test_exhausted_pool_falls_back_after_wait(self):
+        """대기 시간 안에 반납이 없으면 직접 연결로 폴백"""
+        import mysql.connector
+        pool = MagicMock()
+        pool.get_connection.side_effect = mysql.connector.errors.PoolError("pool exhausted")
+
+        with patch.object(db_module, "_get_connection_pool", return_value=pool), \
+             patch("modules.utils.memory_utils.DB_POOL_WAIT_SECONDS", 0), \
+             patch.object(db_module, "_connect_direct") as mock_direct:
+            conn = get_db_connection()
+
+        assert conn is mock_direct.return_value
+        pool.get_connection.assert_called_once()
+
+
+# ───────────────────────────────────────────────────────────────
+# 7. prepared_cursor — 풀 연결별 prepared 커서 재사용
+# ───────────────────────────────────────────────────────────────
+
+class TestPreparedCursor:
+    """
+    비즈니스 규칙:
+      - 풀 연결을 체크아웃하고 블록이 끝나면 반납 (스레드별 전용 연결을 만들지 않음)
+      - 같은 풀 연결 + 같은 SQL이면 같은 prepared 커서 재사용
+      - 재연결로 connection_id가 바뀌거나 오류가 나면 prepared 커서를 다시 만듦
+      - _cnx가 없는 연결(풀 밖 연결)은 연결 객체 자체를 캐시 키로 사용
+    """
+
+    @staticmethod
+    def make_pooled_conn(cnx):
+        from mysql.connector import pooling
+        conn = MagicMock(spec=pooling.PooledMySQLConnection)
+        conn._cnx = cnx
+        return conn
+
+    @staticmethod
+    def make_cnx(connection_id=1):
+        cnx = MagicMock()
+        cnx.connection_id = connection_id
+        cnx.cursor.side_effect = lambda **kwargs: MagicMock()
+        return cnx
+
+    def test_prepared_cursor_cached_per_pooled_connection_and_query(self):
+        """같은 풀 연결에서 같은 SQL이면 같은 prepared 커서, 매번 연결은 반납"""
+        cnx = self.make_cnx()
+        conns = [self.make_pooled_conn(cnx) for _ in range(3)]
+
+        with patch.object(db_module, "get_db_connection", side_effect=conns):
+            with prepared_cursor("SELECT 1") as first:
+                pass
+            with prepared_cursor("SELECT 1") as second:
+                pass
+            with prepared_cursor("SELECT 2") as other:
+                pass
+
+        assert second is first
+        assert other is not first
+        cnx.cursor.assert_called_with(prepared=True, dictionary=True)
+        assert all(conn.close.called for conn in conns)
+
+    def test_prepared_cursor_separate_per_connection(self):
+        """다른 풀 연결은 각자의 prepared 커서 사용"""
+        cnx_a, cnx_b = self.make_cnx(1), self.make_cnx(2)
+
+        with patch.object(db_module, "get_db_connection",
+                          side_effect=[self.make_pooled_conn(cnx_a), self.make_pooled_conn(cnx_b)]):
+            with prepared_cursor("SELECT 1") as first:
+                pass
+            with prepared_cursor("SELECT 1") as second:
+                pass
+
+        assert second is not first
+
+    def test_prepared_cursor_recreated_after_reconnect(self):
+        """풀이 재연결해 connection_id가 바뀌면 prepared 커서를 새로 만듦"""
+        cnx = self.make_cnx(1)
+
+        with patch.object(db_module, "get_db_connection",
+                          side_effect=[self.make_pooled_conn(cnx), self.make_pooled_conn(cnx)]):
+            with prepared_cursor("SELECT 1") as first:
+                pass
+            cnx.connection_id = 2
+            with prepared_cursor("SELECT 1") as second:
+                pass
+
+        assert second is not first
+
+    def test_prepared_cursor_discarded_on_error(self):
+        """블록에서 오류가 나면 연결을 반납하고 그 연결의 prepared 커서 캐시를 버림"""
+        cnx = self.make_cnx()
+        conns = [self.make_pooled_conn(cnx), self.make_pooled_conn(cnx)]
+
+        with patch.object(db_module, "get_db_connection", side_effect=conns):
+            with pytest.raises(RuntimeError):
+                with prepared_cursor("SELECT 1") as first:
+                    raise RuntimeError("boom")
+            with prepared_cursor("SELECT 1") as second:
+                pass
+
+        assert second is not first
+        conns[0].close.assert_called_once()
+
+    def test_direct_connection_keyed_on_itself(self):
+        """_cnx가 없는 연결(풀 대기 초과 시 직접 연결 등)은 연결 객체 자체를 키로 prepared 커서를 캐시하고 닫음"""
+        conn = MagicMock(spec=["cursor", "close", "connection_id"])
+        conn.connection_id = 1
+        conn.cursor.side_effect = lambda **kwargs: MagicMock()
+
+        with patch.object(db_module, "get_db_connection", side_effect=[conn, conn]):
+            with prepared_cursor("SELECT 1") as first:
+                pass
+            with prepared_cursor("SELECT 1") as second:
+                pass
+
+        assert second is first
+        conn.cursor.assert_called_once_with(prepared=True, dictionary=True)
+        assert conn.close.call_count == 2